@@ -18,7 +18,7 @@ from scanner.restore_engine import RestoreEngine, RestoreRequest
 from scanner.verify_engine import VerifyEngine, VerifyRequest
 from scanner.errors import DevVaultRefusal
 from scanner.integrity_keys import load_manifest_hmac_key
-_COMMANDS = {"scan", "backup", "restore", "verify", "preflight", "key"}
+_COMMANDS = {"scan", "backup", "restore", "export", "verify", "preflight", "key", "catalog", "scrub", "verify-vault"}
 
 
 def _rewrite_argv_for_backcompat(argv: list[str]) -> list[str]:
@@ -98,6 +98,21 @@ def _enforce_coverage_gate_cli_or_exit() -> None:
         print(f"REFUSED (coverage): {e}", file=sys.stderr)
         raise SystemExit(2)
 
+def _add_ignore_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="gitignore-style pattern to leave out (repeatable); matching directories are not descended into.",
+    )
+    p.add_argument(
+        "--use-ignore-files",
+        action="store_true",
+        help="Also honor .gitignore/.devvaultignore at the source root.",
+    )
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     if argv is None:
         argv = sys.argv[1:]
@@ -142,6 +157,36 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     backup.add_argument("source_root", help="Directory to back up.")
     backup.add_argument("backup_root", help="Destination root where snapshots are created.")
     backup.add_argument("--dry-run", action="store_true", help="Plan only; do not write any data.")
+    backup.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse unchanged files (same size/mtime/inode) from the previous snapshot of this source.",
+    )
+    backup.add_argument(
+        "--storage-layout",
+        choices=("tree", "objects"),
+        default="tree",
+        help="tree: full copy per snapshot (default). objects: deduplicated content store shared by snapshots.",
+    )
+    backup.add_argument("--copy-workers", type=int, default=1, help="Number of parallel file copy workers (default: 1).")
+    backup.add_argument(
+        "--max-inflight-mib",
+        type=int,
+        default=0,
+        help="Cap on MiB being copied concurrently when --copy-workers > 1 (0 = default 256).",
+    )
+    backup.add_argument(
+        "--durability",
+        choices=("per-file", "batched"),
+        default="per-file",
+        help="per-file: fsync each copied file (default). batched: one flush of the whole snapshot before it is committed.",
+    )
+    _add_ignore_args(backup)
+    backup.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Create the vault file catalog (.devvault/catalog.sqlite) if missing; an existing one is always updated.",
+    )
     backup.add_argument("--json", action="store_true", help="Output results as JSON.")
     backup.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
 
@@ -152,6 +197,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     preflight = sub.add_parser("preflight", help="Estimate backup contents (files/bytes) and surface unreadable/skipped paths.")
     preflight.add_argument("source_root", help="Directory to preflight.")
     preflight.add_argument("backup_root", help="Destination vault root (used for display / policy context).")
+    _add_ignore_args(preflight)
     preflight.add_argument("--json", action="store_true", help="Output results as JSON.")
     preflight.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
 
@@ -161,6 +207,24 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     restore = sub.add_parser("restore", help="Restore a snapshot into an empty destination directory.")
     restore.add_argument("snapshot_dir", help="Snapshot directory to restore from.")
     restore.add_argument("destination_dir", help="Empty destination directory to restore into.")
+    restore.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Restore only this snapshot path or glob (repeatable; default: the whole snapshot).",
+    )
+    restore.add_argument(
+        "--sync",
+        action="store_true",
+        help="Allow a non-empty destination and rewrite only files that differ from the snapshot.",
+    )
+    restore.add_argument(
+        "--delete-extras",
+        action="store_true",
+        help="With --sync: remove destination files that are not in the snapshot (or selection).",
+    )
+    restore.add_argument("--workers", type=int, default=1, help="Number of parallel file apply workers (default: 1).")
     restore.add_argument("--json", action="store_true", help="Output results as JSON.")
     restore.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
     restore.add_argument("--escrow", type=str, default="", help="Escrow JSON (base64 manifest HMAC key) for operator independence.")
@@ -170,11 +234,109 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     # -------------------------
     verify = sub.add_parser("verify", help="Verify a snapshot without restoring.")
     verify.add_argument("snapshot_dir", help="Snapshot directory to verify.")
+    verify.add_argument("--workers", type=int, default=1, help="Number of parallel verify workers (default: 1).")
+    verify.add_argument(
+        "--sample",
+        action="store_true",
+        help="Sampled verify: check every file's presence and size, hash only a subset within the budgets.",
+    )
+    verify.add_argument("--sample-mib", type=int, default=0, help="Sampled verify: MiB to hash at most (0 = no limit).")
+    verify.add_argument("--sample-seconds", type=float, default=0.0, help="Sampled verify: seconds to hash at most (0 = no limit).")
+    verify.add_argument("--seed", type=int, default=None, help="Sampled verify: seed for the sample order (default: random).")
+    verify.add_argument(
+        "--rotation-slices",
+        type=int,
+        default=0,
+        help="Sampled verify: split files into N stable slices and hash one per run (today's by default).",
+    )
+    verify.add_argument("--rotation-slice", type=int, default=None, help="Sampled verify: slice to hash (0..N-1).")
+    verify.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Verify only this snapshot path or glob (repeatable; default: the whole snapshot).",
+    )
     verify.add_argument("--json", action="store_true", help="Output results as JSON.")
     verify.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
     verify.add_argument("--escrow", type=str, default="", help="Escrow JSON (base64 manifest HMAC key) for operator independence.")
 
-        # -------------------------
+    # -------------------------
+    # verify-vault
+    # -------------------------
+    verify_vault = sub.add_parser(
+        "verify-vault",
+        help="Verify every snapshot in a vault, hashing content shared between snapshots once.",
+    )
+    verify_vault.add_argument("backup_root", help="Vault root directory.")
+    verify_vault.add_argument("--workers", type=int, default=1, help="Number of parallel hashing workers (default: 1).")
+    verify_vault.add_argument("--json", action="store_true", help="Output results as JSON.")
+    verify_vault.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
+    verify_vault.add_argument("--escrow", type=str, default="", help="Escrow JSON (base64 manifest HMAC key) for operator independence.")
+
+    # -------------------------
+    # export
+    # -------------------------
+    export = sub.add_parser("export", help="Stream a verified snapshot into a tar/tar.gz/tar.xz/zip archive.")
+    export.add_argument("snapshot_dir", help="Snapshot directory to export.")
+    export.add_argument("archive", help="Archive file to create (must not exist), or - for stdout.")
+    export.add_argument(
+        "--format",
+        choices=["tar", "tar.gz", "tar.xz", "zip"],
+        default="",
+        help="Archive format (default: from the archive name; tar for stdout).",
+    )
+    export.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Export only this snapshot path or glob (repeatable; default: the whole snapshot).",
+    )
+    export.add_argument("--json", action="store_true", help="Output results as JSON.")
+    export.add_argument("--output", type=str, default="", help="Write the report to a file instead of printing it.")
+    export.add_argument("--escrow", type=str, default="", help="Escrow JSON (base64 manifest HMAC key) for operator independence.")
+
+    # -------------------------
+    # scrub
+    # -------------------------
+    scrub = sub.add_parser("scrub", help="Re-verify vault files, least recently verified first (resumable).")
+    scrub.add_argument("--vault", required=True, help="Vault root directory.")
+    scrub.add_argument("--rate-mib", type=float, default=0.0, help="Read rate limit in MiB/s (0 = unlimited).")
+    scrub.add_argument("--max-mib", type=int, default=0, help="Stop after verifying this many MiB (0 = no limit).")
+    scrub.add_argument("--max-seconds", type=float, default=0.0, help="Stop after this many seconds (0 = no limit).")
+    scrub.add_argument(
+        "--cycle-days",
+        type=float,
+        default=30.0,
+        help="Scrub cycle: files verified more recently are skipped, older ones count as overdue (default: 30).",
+    )
+    scrub.add_argument("--json", action="store_true", help="Output results as JSON.")
+    scrub.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
+    scrub.add_argument("--escrow", type=str, default="", help="Escrow JSON (base64 manifest HMAC key) for operator independence.")
+
+    # -------------------------
+    # catalog
+    # -------------------------
+    catalog = sub.add_parser("catalog", help="Query the vault file catalog (path/digest index across snapshots).")
+    catalog_sub = catalog.add_subparsers(dest="catalog_command", required=True)
+
+    c_sync = catalog_sub.add_parser("sync", help="Create or refresh the catalog from the vault's manifests.")
+    c_history = catalog_sub.add_parser("history", help="Versions of one path across snapshots.")
+    c_history.add_argument("path", help="Path relative to the source root (forward slashes).")
+    c_history.add_argument("--source-root", type=str, default=None, help="Only snapshots of this source root.")
+    c_search = catalog_sub.add_parser("search", help="Catalogued paths matching a glob pattern.")
+    c_search.add_argument("pattern", help='Case-sensitive glob, e.g. "src/*.py".')
+    c_search.add_argument("--limit", type=int, default=100)
+    c_diff = catalog_sub.add_parser("diff", help="Files added/removed/changed between two snapshots.")
+    c_diff.add_argument("old_snapshot_id")
+    c_diff.add_argument("new_snapshot_id")
+    for c in (c_sync, c_history, c_search, c_diff):
+        c.add_argument("--vault", required=True, help="Vault root directory.")
+        c.add_argument("--json", action="store_true", help="Output results as JSON.")
+        c.add_argument("--output", type=str, default="", help="Write output to a file instead of printing to stdout.")
+
+    # -------------------------
     # key
     # -------------------------
     key = sub.add_parser("key", help="Key management operations (dangerous).")
@@ -288,6 +450,8 @@ def main(argv: list[str] | None = None) -> int:
                 source_root=_p(args.source_root),
                 backup_root=_p(args.backup_root),
                 dry_run=True,
+                ignore_patterns=tuple(args.exclude or ()),
+                use_ignore_files=bool(args.use_ignore_files),
             )
 
             rep = engine.preflight(req)
@@ -298,6 +462,7 @@ def main(argv: list[str] | None = None) -> int:
                 "file_count": rep.file_count,
                 "total_bytes": rep.total_bytes,
                 "skipped_symlinks": rep.skipped_symlinks,
+                "ignored": rep.ignored_count,
                 "unreadable": {
                     "permission_denied": rep.unreadable_permission_denied,
                     "locked_or_in_use": rep.unreadable_locked_or_in_use,
@@ -324,6 +489,7 @@ def main(argv: list[str] | None = None) -> int:
                     f"Files:  {rep.file_count}\n"
                     f"Bytes:  {rep.total_bytes}\n"
                     f"Skipped symlinks: {rep.skipped_symlinks}\n"
+                    f"Ignored: {rep.ignored_count}\n"
                     f"Unreadable: {unread_total}\n"
                 )
                 if rep.warnings:
@@ -350,6 +516,14 @@ def main(argv: list[str] | None = None) -> int:
                 source_root=_p(args.source_root),
                 backup_root=_p(args.backup_root),
                 dry_run=bool(args.dry_run),
+                incremental=bool(args.incremental),
+                storage_layout=str(args.storage_layout),
+                copy_workers=max(1, int(args.copy_workers)),
+                max_inflight_bytes=max(0, int(args.max_inflight_mib)) * 1024 * 1024,
+                durability=str(args.durability),
+                ignore_patterns=tuple(args.exclude or ()),
+                use_ignore_files=bool(args.use_ignore_files),
+                update_catalog=bool(args.catalog),
             )
 
             result = engine.execute(req)
@@ -360,6 +534,18 @@ def main(argv: list[str] | None = None) -> int:
                 "dry_run": bool(getattr(result, "dry_run", False)),
                 "started_at": getattr(result, "started_at", None).isoformat() if getattr(result, "started_at", None) else None,
                 "finished_at": getattr(result, "finished_at", None).isoformat() if getattr(result, "finished_at", None) else None,
+                "files_copied": int(getattr(result, "files_copied", 0) or 0),
+                "files_reused": int(getattr(result, "files_reused", 0) or 0),
+                "copy_workers": [
+                    {
+                        "worker": w.worker,
+                        "files": w.files,
+                        "bytes": w.bytes,
+                        "seconds": round(w.seconds, 3),
+                        "bytes_per_second": round(w.bytes_per_second, 1),
+                    }
+                    for w in getattr(result, "worker_stats", ()) or ()
+                ],
             }
 
             want_json = args.json or (args.output and args.output.lower().endswith(".json"))
@@ -388,19 +574,28 @@ def main(argv: list[str] | None = None) -> int:
             req = RestoreRequest(
                 snapshot_dir=_p(args.snapshot_dir),
                 destination_dir=_p(args.destination_dir),
+                workers=max(1, int(args.workers)),
+                include=tuple(args.include),
+                sync=bool(args.sync),
+                delete_extras=bool(args.delete_extras),
             )
 
             if args.escrow:
                 key_hex = _load_escrow_manifest_key_hex(_p(args.escrow))
                 with _with_manifest_key_env(key_hex):
-                    engine.restore(req)
+                    result = engine.restore(req)
             else:
-                engine.restore(req)
+                result = engine.restore(req)
 
             payload = {
                 "status": "ok",
                 "snapshot_dir": str(req.snapshot_dir),
                 "destination_dir": str(req.destination_dir),
+                "include": list(req.include),
+                "sync": req.sync,
+                "files_restored": result.files_restored,
+                "files_unchanged": result.files_unchanged,
+                "files_removed": result.files_removed,
             }
 
             want_json = args.json or (args.output and args.output.lower().endswith(".json"))
@@ -408,6 +603,13 @@ def main(argv: list[str] | None = None) -> int:
                 "Restore completed.\n"
                 f"Snapshot: {payload['snapshot_dir']}\n"
                 f"Destination: {payload['destination_dir']}"
+                + (f"\nIncluded: {', '.join(req.include)}" if req.include else "")
+                + f"\nFiles restored: {result.files_restored}"
+                + (
+                    f"\nFiles unchanged: {result.files_unchanged}\nFiles removed: {result.files_removed}"
+                    if req.sync
+                    else ""
+                )
             )
 
             if args.output:
@@ -419,6 +621,64 @@ def main(argv: list[str] | None = None) -> int:
 
             return 0
 
+        # -------------------------
+        # export
+        # -------------------------
+        if args.command == "export":
+            from scanner.archive_export import ArchiveExporter, ExportRequest, archive_format_for
+
+            to_stdout = args.archive == "-"
+            archive = None if to_stdout else _p(args.archive)
+            fmt = args.format or ("tar" if archive is None else archive_format_for(archive))
+            if not fmt:
+                raise RuntimeError("Cannot tell the archive format from its name; pass --format.")
+
+            req = ExportRequest(
+                snapshot_dir=_p(args.snapshot_dir),
+                output=archive,
+                archive_format=fmt,
+                include=tuple(args.include),
+            )
+            exporter = ArchiveExporter(OSFileSystem())
+            stream = sys.stdout.buffer if to_stdout else None
+
+            if args.escrow:
+                key_hex = _load_escrow_manifest_key_hex(_p(args.escrow))
+                with _with_manifest_key_env(key_hex):
+                    result = exporter.export(req, stream=stream)
+            else:
+                result = exporter.export(req, stream=stream)
+            if stream is not None:
+                stream.flush()
+
+            payload = {
+                "status": "ok",
+                "snapshot_dir": str(req.snapshot_dir),
+                "archive": "-" if archive is None else str(archive),
+                "format": result.archive_format,
+                "files_exported": result.files_exported,
+                "bytes_exported": result.bytes_exported,
+            }
+
+            want_json = args.json or (args.output and args.output.lower().endswith(".json"))
+            out = json.dumps(payload, indent=2, sort_keys=True) if want_json else (
+                "Export completed.\n"
+                f"Snapshot: {payload['snapshot_dir']}\n"
+                f"Archive: {payload['archive']} ({result.archive_format})\n"
+                f"Files exported: {result.files_exported} ({result.bytes_exported} bytes)"
+            )
+
+            # stdout carries the archive when exporting to -; the report then goes to stderr.
+            report = sys.stderr if to_stdout else sys.stdout
+            if args.output:
+                write_output(args.output, out)
+                if not want_json:
+                    print(f"Wrote report to: {args.output}", file=report)
+            else:
+                print(out, file=report)
+
+            return 0
+
         # -------------------------
         # verify
         # -------------------------
@@ -460,11 +720,191 @@ def main(argv: list[str] | None = None) -> int:
 
             raise DevVaultRefusal("Unknown key subcommand.")
 
+        # -------------------------
+        # verify-vault
+        # -------------------------
+        if args.command == "verify-vault":
+            engine = VerifyEngine(OSFileSystem())
+            vault_root = _p(args.backup_root)
+            workers = max(1, int(args.workers))
+
+            if args.escrow:
+                key_hex = _load_escrow_manifest_key_hex(_p(args.escrow))
+                with _with_manifest_key_env(key_hex):
+                    res = engine.verify_vault(vault_root, workers=workers)
+            else:
+                res = engine.verify_vault(vault_root, workers=workers)
+
+            payload = {
+                "status": "ok" if res.ok else "failed",
+                "backup_root": str(res.backup_root),
+                "snapshots": [
+                    {
+                        "snapshot_id": v.snapshot_id,
+                        "ok": v.ok,
+                        "files_verified": v.files_verified,
+                        "reason": v.reason,
+                    }
+                    for v in res.verdicts
+                ],
+                "unique_files_hashed": res.unique_files_hashed,
+                "bytes_hashed": res.bytes_hashed,
+                "bytes_referenced": res.bytes_referenced,
+            }
+
+            want_json = args.json or (args.output and args.output.lower().endswith(".json"))
+            if want_json:
+                out = json.dumps(payload, indent=2, sort_keys=True)
+            else:
+                failed = [v for v in res.verdicts if not v.ok]
+                out = (
+                    f"Vault verify {'completed' if res.ok else 'found problems'}.\n"
+                    f"Vault: {payload['backup_root']}\n"
+                    f"Snapshots: {len(res.verdicts)} ({len(failed)} failed)\n"
+                    f"Bytes hashed: {res.bytes_hashed} of {res.bytes_referenced} referenced"
+                )
+                if failed:
+                    out += "\n\nFailed snapshots:\n" + "\n".join(f"- {v.snapshot_id}: {v.reason}" for v in failed)
+
+            if args.output:
+                write_output(args.output, out)
+                if not want_json:
+                    print(f"Wrote report to: {args.output}")
+            else:
+                print(out)
+
+            return 0 if res.ok else 1
+
+        # -------------------------
+        # scrub
+        # -------------------------
+        if args.command == "scrub":
+            from scanner.scrubber import VaultScrubber
+
+            vault_root = _p(args.vault)
+            scrub_kwargs = dict(
+                rate_bytes_per_second=int(max(0.0, float(args.rate_mib)) * 1024 * 1024),
+                max_bytes=max(0, int(args.max_mib)) * 1024 * 1024,
+                max_seconds=max(0.0, float(args.max_seconds)),
+                cycle_seconds=max(0.0, float(args.cycle_days)) * 24 * 3600,
+            )
+
+            if args.escrow:
+                key_hex = _load_escrow_manifest_key_hex(_p(args.escrow))
+                with _with_manifest_key_env(key_hex):
+                    rep = VaultScrubber(OSFileSystem()).scrub(vault_root, **scrub_kwargs)
+            else:
+                rep = VaultScrubber(OSFileSystem()).scrub(vault_root, **scrub_kwargs)
+
+            payload = {
+                "status": "failed" if rep.failures else "ok",
+                "vault_root": str(vault_root),
+                "files_verified": rep.files_verified,
+                "bytes_verified": rep.bytes_verified,
+                "failures": [{"snapshot_id": f.snapshot_id, "path": f.path, "reason": f.reason} for f in rep.failures],
+                "files_total": rep.files_total,
+                "files_never_verified": rep.files_never_verified,
+                "files_overdue": rep.files_overdue,
+                "files_failed": rep.files_failed,
+                "oldest_verified_at": rep.oldest_verified_at,
+                "stopped_early": rep.stopped_early,
+            }
+
+            want_json = args.json or (args.output and args.output.lower().endswith(".json"))
+            if want_json:
+                out = json.dumps(payload, indent=2, sort_keys=True)
+            else:
+                out = (
+                    f"Scrub {'found problems' if rep.failures else 'completed'}.\n"
+                    f"Vault: {vault_root}\n"
+                    f"Files verified: {rep.files_verified} ({rep.bytes_verified} bytes)\n"
+                    f"Overdue: {rep.files_overdue} of {rep.files_total} (never verified: {rep.files_never_verified})"
+                )
+                if rep.failures:
+                    out += "\n\nFailures:\n" + "\n".join(
+                        f"- {f.snapshot_id}: {f.path or '(snapshot)'}: {f.reason}" for f in rep.failures
+                    )
+
+            if args.output:
+                write_output(args.output, out)
+                if not want_json:
+                    print(f"Wrote report to: {args.output}")
+            else:
+                print(out)
+
+            return 1 if rep.failures else 0
+
+        # -------------------------
+        # catalog
+        # -------------------------
+        if args.command == "catalog":
+            from dataclasses import asdict
+
+            from scanner.vault_catalog import VaultCatalog, sync_catalog
+
+            vault_root = _p(args.vault)
+            cat = VaultCatalog.open(vault_root, create=args.catalog_command == "sync")
+            if cat is None:
+                raise DevVaultRefusal("No catalog for this vault (run `devvault catalog sync` or a backup with --catalog).")
+
+            with cat:
+                if args.catalog_command == "sync":
+                    res = sync_catalog(cat, fs=OSFileSystem(), backup_root=vault_root)
+                    payload = {"status": "ok", "vault_root": str(vault_root), **asdict(res)}
+                    text = (
+                        f"Catalog synced: {vault_root}\n"
+                        f"Added: {res.added}  Removed: {res.removed}  Unchanged: {res.unchanged}  Skipped: {res.skipped}"
+                    )
+                elif args.catalog_command == "history":
+                    versions = cat.file_history(args.path, source_root=args.source_root)
+                    payload = {"path": args.path, "versions": [asdict(v) for v in versions]}
+                    text = "\n".join(f"{v.snapshot_id}  {v.size:>12}  {v.digest_hex}" for v in versions) or "Not found."
+                elif args.catalog_command == "search":
+                    paths = cat.search_paths(args.pattern, limit=max(1, int(args.limit)))
+                    payload = {"pattern": args.pattern, "paths": paths}
+                    text = "\n".join(paths) or "No matches."
+                elif args.catalog_command == "diff":
+                    d = cat.diff_snapshots(args.old_snapshot_id, args.new_snapshot_id)
+                    payload = {
+                        "added": [f.path for f in d.added],
+                        "removed": [f.path for f in d.removed],
+                        "changed": [new.path for _old, new in d.changed],
+                    }
+                    text = "\n".join(
+                        [f"+ {p}" for p in payload["added"]]
+                        + [f"- {p}" for p in payload["removed"]]
+                        + [f"~ {p}" for p in payload["changed"]]
+                    ) or "No differences."
+                else:
+                    raise DevVaultRefusal("Unknown catalog subcommand.")
+
+            want_json = args.json or (args.output and args.output.lower().endswith(".json"))
+            out = json.dumps(payload, indent=2, sort_keys=True) if want_json else text
+
+            if args.output:
+                write_output(args.output, out)
+                if not want_json:
+                    print(f"Wrote report to: {args.output}")
+            else:
+                print(out)
+
+            return 0
+
         if args.command == "verify":
             fs = OSFileSystem()
             engine = VerifyEngine(fs)
 
-            req = VerifyRequest(snapshot_dir=_p(args.snapshot_dir))
+            req = VerifyRequest(
+                snapshot_dir=_p(args.snapshot_dir),
+                workers=max(1, int(args.workers)),
+                mode="sampled" if args.sample else "full",
+                sample_bytes=max(0, int(args.sample_mib)) * 1024 * 1024,
+                sample_seconds=max(0.0, float(args.sample_seconds)),
+                sample_seed=args.seed,
+                rotation_slices=max(0, int(args.rotation_slices)),
+                rotation_slice=args.rotation_slice,
+                include=tuple(args.include),
+            )
             if args.escrow:
                 key_hex = _load_escrow_manifest_key_hex(_p(args.escrow))
                 with _with_manifest_key_env(key_hex):
@@ -476,7 +916,18 @@ def main(argv: list[str] | None = None) -> int:
                 "status": "ok",
                 "snapshot_dir": str(res.snapshot_dir),
                 "files_verified": res.files_verified,
+                "mode": res.mode,
+                "include": list(req.include),
+                "files_hashed": res.files_hashed,
+                "bytes_hashed": res.bytes_hashed,
+                "total_bytes": res.total_bytes,
+                "file_coverage": round(res.file_coverage, 6),
+                "byte_coverage": round(res.byte_coverage, 6),
             }
+            if res.mode == "sampled":
+                payload["sample_seed"] = res.sample_seed
+                payload["rotation_slice"] = res.rotation_slice
+                payload["budget_exhausted"] = res.budget_exhausted
 
             want_json = args.json or (args.output and args.output.lower().endswith(".json"))
             out = json.dumps(payload, indent=2, sort_keys=True) if want_json else (
@@ -484,6 +935,11 @@ def main(argv: list[str] | None = None) -> int:
                 f"Snapshot: {payload['snapshot_dir']}\n"
                 f"Files verified: {payload['files_verified']}"
             )
+            if not want_json and res.mode == "sampled":
+                out += (
+                    f"\nFiles hashed: {res.files_hashed} ({res.file_coverage:.1%} of files, "
+                    f"{res.byte_coverage:.1%} of bytes; seed {res.sample_seed})"
+                )
 
             if args.output:
                 write_output(args.output, out)
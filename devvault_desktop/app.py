@@ -5,7 +5,7 @@ import sys
 import threading
 import tkinter as tk
 from pathlib import Path
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, simpledialog
 
 from devvault_desktop.config import set_vault_dir
 from devvault_desktop.winmon import get_work_area_for_window
@@ -701,6 +701,15 @@ class DevVaultApp(tk.Tk):
         if not picked:
             return
 
+        selection = simpledialog.askstring(
+            "Restore Selection",
+            "Paths or globs to restore, separated by commas.\nLeave blank to restore the whole snapshot.",
+            parent=self,
+        )
+        if selection is None:
+            return
+        include = [p.strip() for p in selection.split(",") if p.strip()]
+
         dst = filedialog.askdirectory(title="Select EMPTY destination directory for restore")
         if not dst:
             return
@@ -717,7 +726,7 @@ class DevVaultApp(tk.Tk):
 
         def restore_worker() -> None:
             try:
-                _payload = restore(snapshot_dir=snap_path, destination_dir=dst_path)
+                _payload = restore(snapshot_dir=snap_path, destination_dir=dst_path, include=include)
 
                 def done() -> None:
                     self._set_status("Restore complete.")
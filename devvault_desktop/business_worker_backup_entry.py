@@ -37,6 +37,7 @@ def main() -> int:
             source_root,
             backup_root,
             cancel_check=lambda: False,
+            incremental=bool(cfg.get("incremental", False)),
         )
     except Exception as e:
         print(str(e), file=sys.stderr)
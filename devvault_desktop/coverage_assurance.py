@@ -7,9 +7,10 @@ from pathlib import Path
 
 from scanner.adapters.filesystem import OSFileSystem
 from scanner.engine import scan as scan_engine
+from scanner.manifest_cache import load_manifest_cached
 from scanner.models import ScanRequest
-from scanner.snapshot_listing import list_snapshots
-from scanner.snapshot_metadata import read_snapshot_metadata
+from scanner.snapshot_listing import SnapshotRef, list_snapshots
+from scanner.snapshot_metadata import SnapshotMetadata, read_snapshot_metadata
 
 from devvault_desktop.config import (
     get_business_seat_identity,
@@ -134,25 +135,15 @@ def _is_devvault_runtime_path(candidate: Path) -> bool:
     return False
 
 
-def _live_protected_roots() -> list[Path]:
+def _live_snapshot_metadata(fs: OSFileSystem) -> list[tuple[SnapshotRef, SnapshotMetadata]]:
     """
-    Source of truth for coverage: live snapshot evidence across all currently
-    reachable known vaults.
-
-    Safety rule:
-    - unreachable vaults do NOT count as protection
-    - only live snapshots in reachable vaults count
+    Metadata of every live snapshot in the currently reachable known vaults.
 
-    Compatibility bridge:
-    - Older snapshots may not yet have manifest.source_root.
-    - For those, keep a remembered protected_root only if a live snapshot exists
-      in a reachable vault with a matching source_name (filename / leaf name).
+    One coverage pass reads it once and shares it between the protected-root and
+    drift checks. read_snapshot_metadata answers from the verified summary sidecar
+    or the process-wide manifest cache; unreadable snapshots are skipped.
     """
-    fs = OSFileSystem()
-
-    roots: list[Path] = []
-    legacy_names: set[str] = set()
-
+    out: list[tuple[SnapshotRef, SnapshotMetadata]] = []
     for backup_root in _known_vault_paths():
         try:
             if not backup_root.exists() or not backup_root.is_dir():
@@ -167,19 +158,42 @@ def _live_protected_roots() -> list[Path]:
 
         for snap in snaps:
             try:
-                md = read_snapshot_metadata(fs=fs, snapshot_dir=snap.snapshot_dir)
+                out.append((snap, read_snapshot_metadata(fs=fs, snapshot_dir=snap.snapshot_dir)))
             except Exception:
                 continue
+    return out
 
-            if md.source_root:
-                try:
-                    roots.append(Path(md.source_root))
-                except Exception:
-                    pass
-                continue
 
-            if md.source_name:
-                legacy_names.add(md.source_name.strip().lower())
+def _live_protected_roots(live: list[tuple[SnapshotRef, SnapshotMetadata]] | None = None) -> list[Path]:
+    """
+    Source of truth for coverage: live snapshot evidence across all currently
+    reachable known vaults (`live`, read here when not given).
+
+    Safety rule:
+    - unreachable vaults do NOT count as protection
+    - only live snapshots in reachable vaults count
+
+    Compatibility bridge:
+    - Older snapshots may not yet have manifest.source_root.
+    - For those, keep a remembered protected_root only if a live snapshot exists
+      in a reachable vault with a matching source_name (filename / leaf name).
+    """
+    if live is None:
+        live = _live_snapshot_metadata(OSFileSystem())
+
+    roots: list[Path] = []
+    legacy_names: set[str] = set()
+
+    for _snap, md in live:
+        if md.source_root:
+            try:
+                roots.append(Path(md.source_root))
+            except Exception:
+                pass
+            continue
+
+        if md.source_name:
+            legacy_names.add(md.source_name.strip().lower())
 
     # Local remembered protected roots are valid for non-Business modes only.
     # In Business mode, protection truth must come from live NAS snapshot evidence
@@ -455,7 +469,7 @@ def _normalize_snapshot_manifest_files(snapshot_dir: Path, *, fs: OSFileSystem)
     if not fs.exists(manifest_path) or not fs.is_file(manifest_path):
         raise ValueError(f"Snapshot is missing manifest.json: {snapshot_dir}")
 
-    manifest = json.loads(fs.read_text(manifest_path))
+    manifest = load_manifest_cached(fs, manifest_path)
     if not isinstance(manifest, dict):
         raise ValueError(f"Snapshot manifest must be an object: {snapshot_dir}")
 
@@ -594,58 +608,35 @@ def _has_drift(*, root: Path, snapshot_dir: Path, fs: OSFileSystem) -> bool:
     return uncovered_ratio >= DRIFT_REFLAG_RATIO
 
 
-def _latest_snapshot_for_root(*, target_root: Path, fs: OSFileSystem) -> Path | None:
-    target_key = str(target_root)
-    try:
-        target_key = str(target_root.resolve())
-    except Exception:
-        pass
+def _latest_snapshots_by_root(live: list[tuple[SnapshotRef, SnapshotMetadata]]) -> dict[str, Path]:
+    """Resolved source root -> its latest live snapshot directory."""
+    best: dict[str, tuple[str, Path]] = {}
 
-    best_snapshot: Path | None = None
-    best_id = ""
-
-    for backup_root in _known_vault_paths():
-        try:
-            if not backup_root.exists() or not backup_root.is_dir():
-                continue
-        except Exception:
+    for snap, md in live:
+        if not md.source_root:
             continue
 
         try:
-            snaps = list_snapshots(fs=fs, backup_root=backup_root)
+            source_key = str(Path(md.source_root).expanduser().resolve())
         except Exception:
-            continue
-
-        for snap in snaps:
-            try:
-                md = read_snapshot_metadata(fs=fs, snapshot_dir=snap.snapshot_dir)
-            except Exception:
-                continue
-
-            if not md.source_root:
-                continue
-
-            try:
-                source_key = str(Path(md.source_root).expanduser().resolve())
-            except Exception:
-                source_key = str(Path(md.source_root).expanduser())
-
-            if source_key != target_key:
-                continue
+            source_key = str(Path(md.source_root).expanduser())
 
-            sid = snap.snapshot_id
-            if sid > best_id:
-                best_id = sid
-                best_snapshot = snap.snapshot_dir
+        sid = snap.snapshot_id
+        if source_key not in best or sid > best[source_key][0]:
+            best[source_key] = (sid, snap.snapshot_dir)
 
-    return best_snapshot
+    return {key: snapshot_dir for key, (_sid, snapshot_dir) in best.items()}
 
 
 def _find_drifted_protected_roots(
     protected_roots: list[Path],
     ignored: set[str],
+    live: list[tuple[SnapshotRef, SnapshotMetadata]] | None = None,
 ) -> list[Path]:
     fs = OSFileSystem()
+    if live is None:
+        live = _live_snapshot_metadata(fs)
+    latest = _latest_snapshots_by_root(live)
     out: list[Path] = []
     seen: set[str] = set()
 
@@ -661,7 +652,7 @@ def _find_drifted_protected_roots(
         if root_str in seen:
             continue
 
-        snapshot_dir = _latest_snapshot_for_root(target_root=root_path, fs=fs)
+        snapshot_dir = latest.get(root_str)
         if snapshot_dir is None:
             continue
 
@@ -700,7 +691,8 @@ def compute_uncovered_candidates(
     - Drift detection compares current live files vs latest snapshot manifest.
     - Deterministic: does not mutate state.
     """
-    protected = _live_protected_roots()
+    live = _live_snapshot_metadata(OSFileSystem())
+    protected = _live_protected_roots(live)
     ignored = {str(Path(p)) for p in get_ignored_candidates()}
 
     req = ScanRequest(
@@ -779,6 +771,7 @@ def compute_uncovered_candidates(
     for drifted_root in _find_drifted_protected_roots(
         protected_roots=protected,
         ignored=ignored,
+        live=live,
     ):
         if _is_devvault_runtime_path(drifted_root):
             continue
@@ -260,7 +260,12 @@ def _require_subprocess_entitlement(entitlement: str) -> None:
     st.require_entitlement(entitlement)
 
 
-def _backup_preflight_payload(source: str | Path, vault: str | Path) -> dict:
+def _backup_preflight_payload(source: str | Path, vault: str | Path, *, include_inventory: bool = False) -> dict:
+    """
+    Preflight result for the desktop. include_inventory=True (in-process callers only;
+    it is not JSON) adds the traversal under payload["inventory"] so the execute step
+    can reuse it instead of walking the source again.
+    """
     _require_subprocess_entitlement("core_backup_engine")
     from scanner.adapters.filesystem import OSFileSystem
     from scanner.backup_engine import BackupEngine
@@ -323,6 +328,7 @@ def _backup_preflight_payload(source: str | Path, vault: str | Path) -> dict:
             "unreadable_other_io": int(pre.unreadable_other_io),
             "unreadable_samples": list(pre.unreadable_samples),
             "warnings": list(pre.warnings),
+            **({"inventory": pre.inventory} if include_inventory else {}),
         },
     }
 
@@ -412,7 +418,7 @@ def cmd_backup_execute(source: str, vault: str, cancel_token: str = "") -> int:
         return 2
 
 
-def cmd_restore(snapshot: str, destination: str) -> int:
+def cmd_restore(snapshot: str, destination: str, include: list[str] | None = None) -> int:
     try:
         from scanner.adapters.filesystem import OSFileSystem
         from scanner.restore_engine import RestoreEngine, RestoreRequest
@@ -421,7 +427,7 @@ def cmd_restore(snapshot: str, destination: str) -> int:
         dst = Path(destination).expanduser().resolve()
 
         eng = RestoreEngine(OSFileSystem())
-        eng.restore(RestoreRequest(snapshot_dir=snap, destination_dir=dst))
+        eng.restore(RestoreRequest(snapshot_dir=snap, destination_dir=dst, include=tuple(include or ())))
 
         _json_out(
             {
@@ -475,6 +481,8 @@ def run_backup_execute_with_drive_watch(
     vault: str | Path,
     *,
     cancel_check=None,
+    incremental: bool = False,
+    inventory=None,
 ) -> dict:
     try:
         if cancel_check and cancel_check():
@@ -531,8 +539,9 @@ def run_backup_execute_with_drive_watch(
 
         try:
             res = eng.execute(
-                BackupRequest(source_root=src, backup_root=vlt),
+                BackupRequest(source_root=src, backup_root=vlt, incremental=bool(incremental)),
                 cancel_check=cancel_check,
+                inventory=inventory,
             )
         finally:
             _release_vault_execution_lock(vlt)
@@ -573,6 +582,7 @@ def run_restore_with_drive_watch(
     snapshot: str | Path,
     destination: str | Path,
     *,
+    include: tuple[str, ...] = (),
     cancel_check=None,
 ) -> dict:
     try:
@@ -602,7 +612,7 @@ def run_restore_with_drive_watch(
 
         try:
             eng.restore(
-                RestoreRequest(snapshot_dir=snap, destination_dir=dst),
+                RestoreRequest(snapshot_dir=snap, destination_dir=dst, include=tuple(include)),
                 cancel_check=cancel_check,
             )
         finally:
@@ -656,6 +666,7 @@ def main(argv: list[str] | None = None) -> int:
     r = sub.add_parser("restore")
     r.add_argument("--snapshot", required=True)
     r.add_argument("--destination", required=True)
+    r.add_argument("--include", action="append", default=[], help="Snapshot path or glob to restore (repeatable).")
 
     ns = ap.parse_args(argv)
 
@@ -664,7 +675,7 @@ def main(argv: list[str] | None = None) -> int:
     if ns.cmd == "backup-execute":
         return cmd_backup_execute(ns.source, ns.vault, cancel_token=getattr(ns, "cancel_token", ""))
     if ns.cmd == "restore":
-        return cmd_restore(ns.snapshot, ns.destination)
+        return cmd_restore(ns.snapshot, ns.destination, ns.include)
 
     return 2
 
@@ -12064,6 +12064,7 @@ class DevVaultQt(QMainWindow):
             pass
 
     def _on_backup_pre_done(self, pre: dict) -> None:
+        self._pending_backup_inventory = pre.pop("inventory", None)
         # If operator cancelled during preflight, ignore results and exit cleanly.
         if bool(getattr(self, "_preflight_cancelled", False)):
             self._preflight_cancelled = False
@@ -12229,7 +12230,12 @@ class DevVaultQt(QMainWindow):
                 return
 
             self._backup_exec_thread = QThread()
-            self._backup_exec = _BackupExecuteWorker(source_dir, vault_dir)
+            self._backup_exec = _BackupExecuteWorker(
+                source_dir,
+                vault_dir,
+                inventory=getattr(self, "_pending_backup_inventory", None),
+            )
+            self._pending_backup_inventory = None
             self._backup_exec.moveToThread(self._backup_exec_thread)
 
             self._backup_exec_thread.started.connect(self._backup_exec.run)
@@ -12573,7 +12579,7 @@ class _BackupPreflightWorker(QObject):
             from devvault_desktop.engine_subprocess import _backup_preflight_payload
 
             self.log.emit("Backup preflight started...")
-            result = _backup_preflight_payload(self.source_dir, self.vault_dir)
+            result = _backup_preflight_payload(self.source_dir, self.vault_dir, include_inventory=True)
 
             if not isinstance(result, dict):
                 self.error.emit("Backup preflight returned an invalid response.")
@@ -12598,11 +12604,13 @@ class _BackupExecuteWorker(QObject):
     done = Signal(dict)
     error = Signal(object)
 
-    def __init__(self, source_dir: Path, vault_dir: Path):
+    def __init__(self, source_dir: Path, vault_dir: Path, inventory=None):
         self._business_nas_required = True # ensure defined early
         super().__init__()
         self.source_dir = Path(source_dir)
         self.vault_dir = Path(vault_dir)
+        # Preflight traversal to reuse (the engine re-walks if it no longer applies).
+        self.inventory = inventory
         self._cancel_requested = False
 
     def cancel(self) -> None:
@@ -12617,6 +12625,7 @@ class _BackupExecuteWorker(QObject):
                 self.source_dir,
                 self.vault_dir,
                 cancel_check=lambda: self._cancel_requested,
+                inventory=self.inventory,
             )
 
             if not isinstance(result, dict):
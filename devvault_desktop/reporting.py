@@ -169,12 +169,14 @@ def export_advanced_scan_report_json_dict(report: AdvancedScanReport) -> dict:
 
 
 def _load_manifest(snapshot_dir: Path, *, fs) -> dict:
+    from scanner.manifest_cache import load_manifest_cached
+
     manifest_path = snapshot_dir / "manifest.json"
     if not fs.exists(manifest_path) or not fs.is_file(manifest_path):
         raise ValueError(f"Snapshot is missing manifest.json: {snapshot_dir}")
 
     try:
-        manifest = json.loads(fs.read_text(manifest_path))
+        manifest = load_manifest_cached(fs, manifest_path)
     except Exception as e:
         raise ValueError(f"Snapshot manifest is invalid JSON: {snapshot_dir}") from e
 
@@ -9,7 +9,7 @@ import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from devvault_desktop.config import load_config
 
@@ -251,5 +251,8 @@ def backup(*, source_dir: Path) -> dict:
     return _run_devvault_json("Backup", ["backup", str(source_dir), str(vault), "--json"])
 
 
-def restore(*, snapshot_dir: Path, destination_dir: Path) -> dict:
-    return _run_devvault_json("Restore", ["restore", str(snapshot_dir), str(destination_dir), "--json"])
+def restore(*, snapshot_dir: Path, destination_dir: Path, include: Sequence[str] = ()) -> dict:
+    args = ["restore", str(snapshot_dir), str(destination_dir), "--json"]
+    for pattern in include:
+        args += ["--include", pattern]
+    return _run_devvault_json("Restore", args)
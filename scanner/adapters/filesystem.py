@@ -1,10 +1,202 @@
 from __future__ import annotations
 
+import errno
+import hashlib
 import os
 import stat
+import sys
 from pathlib import Path
+from typing import Iterable
 import shutil
 
+from scanner.checksum import Digest, HashedCopy
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share extents copy-on-write (btrfs/XFS/bcachefs).
+_FICLONE = 0x40049409
+
+_COPY_CHUNK = 1024 * 1024
+# Kernel-side copies have no per-byte Python cost; larger chunks only bound cancel latency.
+_KERNEL_COPY_CHUNK = 8 * 1024 * 1024
+
+# Errors meaning "this kernel copy primitive cannot handle these fds" (not a data error).
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    errno.EBADF,
+    errno.EPERM,
+}
+
+
+def _copy_file_range_chunk(rfd: int, wfd: int, offset: int) -> int:
+    # In-kernel copy; reflinks on btrfs/XFS, server-side copy on NFS/SMB where supported.
+    return os.copy_file_range(rfd, wfd, _KERNEL_COPY_CHUNK, offset, offset)
+
+
+def _sendfile_chunk(rfd: int, wfd: int, offset: int) -> int:
+    os.lseek(wfd, offset, os.SEEK_SET)
+    return os.sendfile(wfd, rfd, offset, _KERNEL_COPY_CHUNK)
+
+
+def _kernel_copy_methods() -> tuple:
+    if not sys.platform.startswith("linux"):
+        # sendfile elsewhere (macOS/BSD) needs a socket as destination.
+        return ()
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(_copy_file_range_chunk)
+    if hasattr(os, "sendfile"):
+        methods.append(_sendfile_chunk)
+    return tuple(methods)
+
+
+_KERNEL_COPY_METHODS = _kernel_copy_methods()
+
+
+# Below this many files a handful of fsyncs is cheaper than flushing the whole filesystem.
+_SYNCFS_MIN_FILES = 64
+
+
+def _syncfs(path: Path) -> bool:
+    """syncfs(2) on the filesystem holding `path` (Linux only). False when unavailable."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        syncfs = libc.syncfs
+    except (OSError, AttributeError):
+        return False
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if syncfs(fd) != 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSYS:
+                return False
+            raise OSError(err, os.strerror(err), str(path))
+        return True
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(path: Path) -> None:
+    # FlushFileBuffers on Windows needs a writable handle.
+    flags = os.O_RDWR if os.name == "nt" else os.O_RDONLY
+    fd = os.open(path, flags | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    if os.name == "nt":
+        # Directory handles cannot be fsynced on Windows; NTFS journals the metadata.
+        return
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _check_cancel(cancel_check) -> None:
+    if cancel_check is not None and bool(cancel_check()):
+        raise RuntimeError("Cancelled by operator.")
+
+
+def _try_reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with src.open("rb") as r, dst.open("xb") as w:
+            try:
+                fcntl.ioctl(w.fileno(), _FICLONE, r.fileno())
+                return True
+            except OSError:
+                pass
+    except OSError:
+        return False
+
+    # Reflink unsupported here: drop the empty placeholder we created.
+    try:
+        dst.unlink()
+    except OSError:
+        pass
+    return False
+
+
+class _ScandirEntry:
+    """FsEntry backed by os.DirEntry (type from the listing, stat cached per entry)."""
+
+    __slots__ = ("_de", "name", "path")
+
+    def __init__(self, de: os.DirEntry, parent: Path):
+        self._de = de
+        self.name = de.name
+        self.path = parent / de.name
+
+    def is_symlink(self) -> bool:
+        return self._de.is_symlink()
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._de.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self._de.is_file(follow_symlinks=follow_symlinks)
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        return self._de.stat(follow_symlinks=follow_symlinks)
+
+
+class _PathEntry:
+    """FsEntry for a standalone path (e.g. a traversal root); lstat is taken once."""
+
+    __slots__ = ("name", "path", "_lst", "_st")
+
+    def __init__(self, path: Path):
+        self.name = path.name
+        self.path = path
+        self._lst: os.stat_result | None = None
+        self._st: os.stat_result | None = None
+
+    def _lstat(self) -> os.stat_result:
+        if self._lst is None:
+            self._lst = os.lstat(self.path)
+        return self._lst
+
+    def is_symlink(self) -> bool:
+        try:
+            return stat.S_ISLNK(self._lstat().st_mode)
+        except OSError:
+            return False
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        if follow_symlinks and self.is_symlink():
+            if self._st is None:
+                self._st = os.stat(self.path)
+            return self._st
+        return self._lstat()
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        try:
+            return stat.S_ISDIR(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except OSError:
+            return False
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        try:
+            return stat.S_ISREG(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except OSError:
+            return False
+
 
 class OSFileSystem:
     def mkdir(self, path: Path, *, parents: bool = False, exist_ok: bool = True) -> None:
@@ -19,6 +211,41 @@ class OSFileSystem:
     def iterdir(self, path: Path):
         return path.iterdir()
 
+    def scandir(self, path: Path) -> list[_ScandirEntry]:
+        """
+        List a directory once, keeping os.scandir type/stat information per entry.
+        The handle is closed before returning, so recursion never holds open listings.
+        """
+        with os.scandir(path) as it:
+            return [_ScandirEntry(de, path) for de in it]
+
+    def entry(self, path: Path) -> _PathEntry:
+        return _PathEntry(path)
+
+    def walk(self, root: Path, *, prune=None):
+        """
+        Depth-first iteration over every entry below root (root itself excluded).
+
+        Symlinks are yielded but never followed. prune(entry) -> True skips
+        descending into that directory. Unlistable directories are skipped.
+        """
+        stack = [root]
+        while stack:
+            d = stack.pop()
+            try:
+                entries = self.scandir(d)
+            except OSError:
+                continue
+            subdirs: list[Path] = []
+            for e in entries:
+                yield e
+                try:
+                    if e.is_dir(follow_symlinks=False) and not (prune is not None and prune(e)):
+                        subdirs.append(e.path)
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirs))
+
     def stat(self, path: Path):
         return path.stat()
 
@@ -37,30 +264,154 @@ class OSFileSystem:
     def open_read(self, path: Path):
         return path.open("rb")
 
+    def open_write(self, path: Path):
+        return path.open("wb")
+
     def unlink(self, path: Path) -> None:
         path.unlink()
 
+    def rmdir(self, path: Path) -> None:
+        """Remove an empty directory (OSError when it is not empty)."""
+        path.rmdir()
+
+    def set_mtime_ns(self, path: Path, mtime_ns: int) -> None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
     def rename(self, src: Path, dst: Path) -> None:
         os.replace(src, dst)
 
-    def copy_file(self, src: Path, dst: Path, cancel_check=None) -> None:
-        chunk_size = 1024 * 1024
-        with src.open("rb") as r, dst.open("wb") as w:
-            while True:
-                if cancel_check is not None and bool(cancel_check()):
-                    raise RuntimeError("Cancelled by operator.")
-                chunk = r.read(chunk_size)
-                if not chunk:
-                    break
-                w.write(chunk)
-
-            # Ensure data is flushed and handle fully released
+    def _copy_kernel(self, rfd: int, wfd: int, *, cancel_check=None) -> tuple[int, bool]:
+        """
+        Copy rfd -> wfd without moving bytes through userspace.
+
+        Returns (bytes_copied, complete). complete=False means no kernel primitive
+        could finish the job; the caller continues from bytes_copied in userspace.
+        """
+        if not _KERNEL_COPY_METHODS:
+            return 0, False
+        size = os.fstat(rfd).st_size
+        copied = 0
+        for method in _KERNEL_COPY_METHODS:
             try:
-                w.flush()
-                import os
-                os.fsync(w.fileno())
-            except Exception:
-                pass
+                while True:
+                    _check_cancel(cancel_check)
+                    n = method(rfd, wfd, copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+                continue
+            # 0 is EOF only once the whole file went through: procfs/sysfs and some FUSE
+            # and network mounts answer 0 without copying anything.
+            if copied and copied >= size:
+                return copied, True
+        return copied, False
+
+    def _copy_stream(self, r, w, *, cancel_check=None, hasher=None, offset: int = 0) -> int:
+        """Userspace copy loop from `offset` (one reused buffer, no per-chunk allocation)."""
+        buf = bytearray(_COPY_CHUNK)
+        view = memoryview(buf)
+        copied = offset
+        if offset:
+            r.seek(offset)
+            w.seek(offset)
+        while True:
+            _check_cancel(cancel_check)
+            n = r.readinto(buf)
+            if not n:
+                break
+            chunk = view[:n]
+            if hasher is not None:
+                hasher.update(chunk)
+            written = 0
+            while written < n:
+                written += w.write(chunk[written:])
+            copied += n
+        return copied
+
+    @staticmethod
+    def _sync(w) -> None:
+        # Ensure data is flushed and handle fully released
+        try:
+            w.flush()
+            os.fsync(w.fileno())
+        except Exception:
+            pass
+
+    def copy_file(self, src: Path, dst: Path, cancel_check=None, *, durable: bool = True) -> None:
+        """
+        Copy src -> dst, kernel-side where possible (copy_file_range, then sendfile),
+        falling back to a userspace loop. Cancellable between chunks either way.
+
+        durable=False skips the per-file fsync; the caller then owns a sync_barrier().
+        """
+        with open(src, "rb", buffering=0) as r, open(dst, "wb", buffering=0) as w:
+            copied, complete = self._copy_kernel(r.fileno(), w.fileno(), cancel_check=cancel_check)
+            if not complete:
+                self._copy_stream(r, w, cancel_check=cancel_check, offset=copied)
+            if durable:
+                self._sync(w)
+
+    def copy_file_hashed(
+        self,
+        src: Path,
+        dst: Path,
+        *,
+        algo: str = "sha256",
+        cancel_check=None,
+        durable: bool = True,
+        exclusive: bool = False,
+    ) -> HashedCopy:
+        """
+        Copy src -> dst and hash the bytes as they stream through (single read of src).
+        The returned digest/size describe exactly the bytes written to dst.
+
+        exclusive=True creates dst with O_CREAT|O_EXCL: FileExistsError if anything is
+        already there, a symlink included (never followed).
+        """
+        # The digest must describe the written bytes, so this path stays in userspace.
+        h = hashlib.new(algo)
+        with open(src, "rb", buffering=0) as r, open(dst, "xb" if exclusive else "wb", buffering=0) as w:
+            size = self._copy_stream(r, w, cancel_check=cancel_check, hasher=h)
+            if durable:
+                self._sync(w)
+        return HashedCopy(digest=Digest(algo=algo, hex=h.hexdigest()), size=size)
+
+    def sync_barrier(self, *, files: Iterable[Path] = (), dirs: Iterable[Path] = ()) -> None:
+        """
+        Make `files` (data) and `dirs` (entries) durable before a commit point.
+
+        Large batches on one filesystem use a single syncfs(2) where available;
+        otherwise each file, then each directory, is fsynced. Failures raise: a
+        snapshot must not be committed on top of unflushed data.
+        """
+        files = list(files)
+        dirs = list(dirs)
+        if not files and not dirs:
+            return
+
+        if len(files) >= _SYNCFS_MIN_FILES and dirs:
+            devices = {os.stat(d).st_dev for d in dirs}
+            if len(devices) == 1 and _syncfs(dirs[0]):
+                return
+
+        for f in files:
+            _fsync_file(f)
+        for d in dirs:
+            _fsync_dir(d)
+
+    def clone_file(self, src: Path, dst: Path) -> None:
+        """
+        Materialize dst as a clone of src without copying bytes through userspace.
+
+        Prefers a reflink (independent copy-on-write file), falls back to a hardlink
+        (same inode). Raises OSError when neither is possible, e.g. across volumes.
+        """
+        if _try_reflink(src, dst):
+            return
+        os.link(src, dst)
 
     def set_readonly(self, path: Path, *, readonly: bool = True) -> None:
         # Disabled: DevVault uses logical integrity, not filesystem locking
@@ -0,0 +1,208 @@
+"""
+Streaming export of a snapshot into a tar (optionally gzip or xz) or zip archive.
+
+Each file is read once from the snapshot and written straight into the archive;
+its sha256 is computed from the bytes as they stream and checked against the
+manifest. Planning is the restore preflight (RestoreEngine.plan), so an export is
+refused in exactly the cases a restore is.
+
+An archive written to a path goes through a temp file that is renamed into place
+only when every file matched. On a stream (stdout) bytes cannot be taken back: a
+failure stops the export without finishing the archive (no zip central directory,
+no compression trailer, no tar end-of-archive blocks), and the caller reports the
+failure; a failed export must be treated as a broken archive.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tarfile
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from scanner.errors import RestoreRefused, SnapshotCorrupt
+from scanner.ports.filesystem import FileSystemPort
+from scanner.restore_engine import RestoreEngine, RestorePlan
+
+FORMAT_TAR = "tar"
+FORMAT_TAR_GZ = "tar.gz"
+FORMAT_TAR_XZ = "tar.xz"
+FORMAT_ZIP = "zip"
+EXPORT_FORMATS = (FORMAT_TAR, FORMAT_TAR_GZ, FORMAT_TAR_XZ, FORMAT_ZIP)
+
+_TAR_MODES = {FORMAT_TAR: "w|", FORMAT_TAR_GZ: "w|gz", FORMAT_TAR_XZ: "w|xz"}
+_SUFFIXES = (
+    (".tar.gz", FORMAT_TAR_GZ),
+    (".tgz", FORMAT_TAR_GZ),
+    (".tar.xz", FORMAT_TAR_XZ),
+    (".txz", FORMAT_TAR_XZ),
+    (".tar", FORMAT_TAR),
+    (".zip", FORMAT_ZIP),
+)
+_CHUNK = 1024 * 1024
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def archive_format_for(path: Path) -> str | None:
+    """Archive format implied by a file name, or None."""
+    name = path.name.lower()
+    for suffix, fmt in _SUFFIXES:
+        if name.endswith(suffix):
+            return fmt
+    return None
+
+
+@dataclass(frozen=True)
+class ExportRequest:
+    snapshot_dir: Path
+    # Archive path (must not exist); None writes to the stream passed to export().
+    output: Path | None = None
+    archive_format: str = FORMAT_TAR
+    # Snapshot-relative paths or globs, as for RestoreRequest.include.
+    include: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    archive_format: str
+    files_exported: int
+    bytes_exported: int
+
+
+class _VerifyingReader:
+    """Reads a snapshot file for the archive, hashing exactly the bytes handed out."""
+
+    def __init__(self, f: BinaryIO, *, cancel_check=None):
+        self._f = f
+        self._cancel_check = cancel_check
+        self._h = hashlib.sha256()
+        self.size = 0
+
+    def read(self, n: int = -1) -> bytes:
+        if self._cancel_check is not None and bool(self._cancel_check()):
+            raise RuntimeError("Cancelled by operator.")
+        b = self._f.read(_CHUNK if n is None or n < 0 else n)
+        self._h.update(b)
+        self.size += len(b)
+        return b
+
+    def check(self, *, rel: str, size: int, digest_hex: str | None) -> None:
+        if self.size != size:
+            raise SnapshotCorrupt(f"Export verification failed: file size mismatch: {rel}")
+        if digest_hex is not None and self._h.hexdigest() != digest_hex:
+            raise SnapshotCorrupt(f"Export verification failed: checksum mismatch: {rel}")
+
+
+class _Gate:
+    """
+    Write-only view of the output that can be shut.
+
+    tarfile and zipfile finish an archive when they are garbage collected; after a
+    failure the gate is shut so that an unfinished archive stays unfinished.
+    """
+
+    def __init__(self, out: BinaryIO):
+        self._out = out
+        self.shut = False
+
+    def write(self, b: bytes) -> int:
+        if not self.shut:
+            self._out.write(b)
+        return len(b)
+
+    def flush(self) -> None:
+        if not self.shut:
+            self._out.flush()
+
+
+class ArchiveExporter:
+    def __init__(self, fs: FileSystemPort):
+        self.fs = fs
+        self._restore = RestoreEngine(fs)
+
+    def export(self, req: ExportRequest, *, stream: BinaryIO | None = None, cancel_check=None) -> ExportResult:
+        fmt = req.archive_format
+        if fmt not in EXPORT_FORMATS:
+            raise RuntimeError(f"Unsupported export format: {fmt}")
+        if (req.output is None) == (stream is None):
+            raise RuntimeError("Unsupported export target: pass either an output path or a stream.")
+
+        tmp: Path | None = None
+        if req.output is not None:
+            if self.fs.exists(req.output):
+                raise RestoreRefused("Export output already exists.")
+            tmp = req.output.parent / (req.output.name + ".devvault.tmp")
+            if self.fs.exists(tmp):
+                raise RestoreRefused("Refusing export: temporary output already exists.")
+
+        plan = self._restore.plan(req.snapshot_dir, req.include)
+
+        if tmp is None:
+            return self._write(stream, fmt, plan, cancel_check=cancel_check)
+
+        try:
+            with self.fs.open_write(tmp) as out:
+                result = self._write(out, fmt, plan, cancel_check=cancel_check)
+        except BaseException:
+            if self.fs.exists(tmp):
+                try:
+                    self.fs.unlink(tmp)
+                except Exception:
+                    pass
+            raise
+        self.fs.rename(tmp, req.output)
+        return result
+
+    def _write(self, out: BinaryIO, fmt: str, plan: RestorePlan, *, cancel_check=None) -> ExportResult:
+        gate = _Gate(out)
+        try:
+            total = self._write_archive(gate, fmt, plan, cancel_check=cancel_check)
+        except BaseException:
+            gate.shut = True
+            raise
+        return ExportResult(archive_format=fmt, files_exported=len(plan.to_copy), bytes_exported=total)
+
+    def _write_archive(self, out: _Gate, fmt: str, plan: RestorePlan, *, cancel_check=None) -> int:
+        now = time.time()
+        total = 0
+
+        if fmt == FORMAT_ZIP:
+            # The gate is not seekable, so entries carry data descriptors (streamable zip).
+            zf = zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+            for src, rel_path, size, digest_hex in plan.to_copy:
+                mtime_ns = plan.mtimes.get(rel_path)
+                stamp = time.localtime(mtime_ns / 1e9 if mtime_ns is not None else now)[:6]
+                info = zipfile.ZipInfo(rel_path.as_posix(), date_time=max(stamp, _ZIP_EPOCH))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                with self.fs.open_read(src) as f, zf.open(info, "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as w:
+                    reader = _VerifyingReader(f, cancel_check=cancel_check)
+                    while True:
+                        b = reader.read(_CHUNK)
+                        if not b:
+                            break
+                        w.write(b)
+                reader.check(rel=rel_path.as_posix(), size=size, digest_hex=digest_hex)
+                total += size
+            # Only a complete export gets its central directory.
+            zf.close()
+        else:
+            tf = tarfile.open(fileobj=out, mode=_TAR_MODES[fmt], format=tarfile.PAX_FORMAT)
+            for src, rel_path, size, digest_hex in plan.to_copy:
+                mtime_ns = plan.mtimes.get(rel_path)
+                info = tarfile.TarInfo(rel_path.as_posix())
+                info.size = size
+                info.mtime = mtime_ns / 1e9 if mtime_ns is not None else now
+                info.mode = 0o644
+                with self.fs.open_read(src) as f:
+                    reader = _VerifyingReader(f, cancel_check=cancel_check)
+                    tf.addfile(info, reader)
+                reader.check(rel=rel_path.as_posix(), size=size, digest_hex=digest_hex)
+                total += size
+            # Only a complete export gets its end-of-archive blocks and compression trailer.
+            tf.close()
+
+        return total
@@ -1,20 +1,47 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import hashlib
 from dataclasses import dataclass
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Sequence
 from uuid import uuid4
 
 from scanner.checksum import hash_path
+from scanner.copy_pipeline import (
+    DEFAULT_MAX_INFLIGHT_BYTES,
+    CopyWorkerStats,
+    ParallelCopyPipeline,
+    PipelineStopped,
+)
 from scanner.errors import SnapshotCorrupt
-from scanner.manifest_integrity import add_integrity_block
+from scanner.manifest_stream import verify_manifest_text_integrity, write_manifest_stream
+from scanner.path_index import PATH_INDEX_NAME, write_path_index
+from scanner.snapshot_summary import SUMMARY_NAME, write_snapshot_summary
+from scanner.vault_catalog import VaultCatalog, catalog_path_for_backup_root, catalog_snapshot, sync_catalog
 from scanner.integrity_keys import load_manifest_hmac_key
-from scanner.ports.filesystem import FileSystemPort
-from scanner.models.backup import BackupRequest, PreflightReport
-from scanner.snapshot_index import rebuild_snapshot_index, write_snapshot_index
+from scanner.ports.filesystem import FileSystemPort, FsEntry
+from scanner.models.backup import BackupRequest, InventoryEntry, PreflightReport, SourceInventory
+from scanner.ignore_rules import matcher_for_request
+from scanner.source_inventory import build_source_inventory
+from scanner.snapshot_index import load_snapshot_index, upsert_snapshot_index
+from scanner.snapshot_listing import list_snapshots
+from scanner.snapshot_metadata import read_snapshot_metadata
+from scanner.object_store import (
+    LAYOUT_OBJECTS,
+    LAYOUT_TREE,
+    ObjectStore,
+    snapshot_file_path,
+    storage_layout_of,
+)
+
+# BackupRequest.durability values.
+DURABILITY_PER_FILE = "per-file"
+DURABILITY_BATCHED = "batched"
 
 
 @dataclass(frozen=True)
@@ -24,6 +51,53 @@ class BackupPlan:
     incomplete_path: Path
 
 
+@dataclass(frozen=True)
+class CopiedFile:
+    """One file written into the snapshot, with the size/digest observed while copying."""
+    rel_path: Path
+    size: int
+    digest_hex: str
+
+    # Source stat fingerprint; None when the file changed while it was being copied.
+    mtime_ns: int | None = None
+    inode: int | None = None
+
+    # True when the bytes were cloned from the previous snapshot (incremental mode).
+    reused: bool = False
+
+
+@dataclass(frozen=True)
+class PriorSnapshot:
+    """Previous snapshot of the same source, used as the reuse base for incremental backups."""
+    snapshot_dir: Path
+    entries: dict[str, dict]
+    vault_root: Path | None = None
+    layout: str = LAYOUT_TREE
+
+    def file_path(self, *, rel: Path, digest_hex: str) -> Path:
+        return snapshot_file_path(
+            snapshot_dir=self.snapshot_dir,
+            vault_root=self.vault_root or self.snapshot_dir.parent,
+            layout=self.layout,
+            rel_path=rel,
+            digest_hex=digest_hex,
+        )
+
+
+@dataclass(frozen=True)
+class _CopyContext:
+    cancel_check: object = None
+    prior: PriorSnapshot | None = None
+    objects: ObjectStore | None = None
+    pipeline: ParallelCopyPipeline | None = None
+    # False: per-file fsync is skipped and execute() runs one sync barrier before finalize.
+    durable: bool = True
+
+    def check_cancel(self) -> None:
+        if self.cancel_check is not None and bool(self.cancel_check()):
+            raise RuntimeError("Cancelled by operator.")
+
+
 @dataclass(frozen=True)
 class BackupResult:
     backup_id: str
@@ -31,6 +105,9 @@ class BackupResult:
     started_at: datetime
     finished_at: datetime
     dry_run: bool
+    files_copied: int = 0
+    files_reused: int = 0
+    worker_stats: tuple[CopyWorkerStats, ...] = ()
 
 
 class BackupEngine:
@@ -88,111 +165,43 @@ class BackupEngine:
         Best-effort preflight summary for a backup.
 
         Notes:
-        - Uses the SAME traversal + symlink-skip policy as backup/manifest generation.
+        - Uses the SAME traversal + symlink-skip policy as backup/manifest generation
+          (both go through build_source_inventory); the inventory is returned on the report
+          so execute() can reuse it instead of walking the source again.
         - Performs a minimal read probe (open + 1-byte read) to detect locked/in-use files early.
           Backup may still refuse later if a file becomes unreadable after preflight (race conditions).
         """
         src_root = request.source_root.expanduser().resolve()
         backup_root = request.backup_root.expanduser().resolve()
-        file_count = 0
-        total_bytes = 0
-        skipped_symlinks = 0
-
-        perm_denied = 0
-        locked = 0
-        not_found = 0
-        other_io = 0
-
-        samples: list[str] = []
-        SAMPLE_CAP = 25
-
-        def record_unreadable(path, exc: BaseException) -> None:
-            nonlocal perm_denied, locked, not_found, other_io
-            # PermissionError on Windows can indicate both ACL denial and sharing violations.
-            if isinstance(exc, PermissionError):
-                winerr = getattr(exc, "winerror", None)
-                # Windows sharing violation / lock is commonly 32 or 33.
-                if winerr in (32, 33):
-                    locked += 1
-                else:
-                    perm_denied += 1
-            elif isinstance(exc, FileNotFoundError):
-                not_found += 1
-            else:
-                other_io += 1
-
-            if len(samples) < SAMPLE_CAP:
-                try:
-                    samples.append(str(path))
-                except Exception:
-                    samples.append("<unprintable-path>")
-
-        def walk(node):
-            nonlocal file_count, total_bytes, skipped_symlinks
-
-            # Policy: skip symlinks entirely (consistent with backup)
-            try:
-                if self._fs.is_symlink(node):
-                    skipped_symlinks += 1
-                    return
-            except Exception as e:
-                record_unreadable(node, e)
-                return
 
-            try:
-                if self._fs.is_dir(node):
-                    for child in self._fs.iterdir(node):
-                        walk(child)
-                    return
-            except Exception as e:
-                record_unreadable(node, e)
-                return
-
-            try:
-                if self._fs.is_file(node):
-                    try:
-                        st = self._fs.stat(node)
-                        file_count += 1
-                        total_bytes += int(getattr(st, "st_size", 0) or 0)
-
-                        # Read probe: detect locked/in-use files (Windows sharing violations)
-                        try:
-                            with node.open("rb") as f:
-                                f.read(1)
-                        except Exception as e:
-                            record_unreadable(node, e)
-                            return
-                    except Exception as e:
-                        record_unreadable(node, e)
-                    return
-            except Exception as e:
-                record_unreadable(node, e)
-                return
-
-            # Special nodes: ignore silently (consistent with backup)
-            return
-
-        # Traverse from root
-        walk(src_root)
+        inv = build_source_inventory(
+            fs=self._fs,
+            source_root=src_root,
+            strict=False,
+            probe_reads=True,
+            ignore=matcher_for_request(fs=self._fs, request=request, source_root=src_root),
+        )
 
         warnings: list[str] = []
-        if skipped_symlinks > 0:
+        if inv.skipped_symlinks > 0:
             warnings.append("Some symlinks were skipped by policy (safety).")
-        if (perm_denied + locked + not_found + other_io) > 0:
+        if inv.unreadable_count > 0:
             warnings.append("Some paths could not be read/statted during preflight; backup may refuse later if instability persists.")
 
         return PreflightReport(
             source_root=src_root,
             backup_root=backup_root,
-            file_count=file_count,
-            total_bytes=total_bytes,
-            skipped_symlinks=skipped_symlinks,
-            unreadable_permission_denied=perm_denied,
-            unreadable_locked_or_in_use=locked,
-            unreadable_not_found=not_found,
-            unreadable_other_io=other_io,
-            unreadable_samples=tuple(samples),
+            file_count=inv.file_count,
+            total_bytes=inv.total_bytes,
+            skipped_symlinks=inv.skipped_symlinks,
+            ignored_count=inv.ignored_count,
+            unreadable_permission_denied=inv.unreadable_permission_denied,
+            unreadable_locked_or_in_use=inv.unreadable_locked_or_in_use,
+            unreadable_not_found=inv.unreadable_not_found,
+            unreadable_other_io=inv.unreadable_other_io,
+            unreadable_samples=inv.unreadable_samples,
             warnings=tuple(warnings),
+            inventory=inv,
         )
 
 
@@ -216,7 +225,7 @@ class BackupEngine:
             incomplete_path=incomplete_path,
         )
 
-    def execute(self, request, cancel_check=None) -> BackupResult:
+    def execute(self, request, cancel_check=None, inventory: SourceInventory | None = None) -> BackupResult:
         started_at = datetime.now(timezone.utc)
         plan = self.plan(request)
 
@@ -243,27 +252,72 @@ class BackupEngine:
                 dry_run=True,
             )
 
+        # Phase 0 — source inventory: the single traversal every later phase consumes.
+        # A preflight inventory is reused only if it describes this exact source and ignore
+        # rules and saw every path: a non-strict walk leaves unreadable paths out of
+        # `entries`, and the snapshot must not silently omit them.
+        ignore = matcher_for_request(fs=self._fs, request=request, source_root=src_root)
+        if (
+            inventory is None
+            or inventory.source_root != src_root
+            or inventory.ignore_patterns != ignore.patterns
+            or inventory.unreadable_count != 0
+        ):
+            inventory = build_source_inventory(
+                fs=self._fs,
+                source_root=src_root,
+                strict=True,
+                ignore=ignore,
+                cancel_check=cancel_check,
+            )
+
+        durability = str(getattr(request, "durability", DURABILITY_PER_FILE) or DURABILITY_PER_FILE)
+        if durability not in (DURABILITY_PER_FILE, DURABILITY_BATCHED):
+            raise RuntimeError(f"Unsupported durability mode: {durability}")
+        layout = str(getattr(request, "storage_layout", LAYOUT_TREE) or LAYOUT_TREE)
+        if layout not in (LAYOUT_TREE, LAYOUT_OBJECTS):
+            raise RuntimeError(f"Unsupported storage layout: {layout}")
+
         # Phase 1 — create incomplete destination
         self._fs.mkdir(plan.incomplete_path, parents=True, exist_ok=False)
 
-        # Phase 2 — copy data
-        self._copy_tree(
+        prior = None
+        if getattr(request, "incremental", False):
+            prior = self._load_prior_snapshot(backup_root=backup_root, src_root=src_root)
+
+        objects = ObjectStore.for_vault(self._fs, backup_root) if layout == LAYOUT_OBJECTS else None
+
+        workers = int(getattr(request, "copy_workers", 1) or 1)
+        pipeline = None
+        if workers > 1:
+            pipeline = ParallelCopyPipeline(
+                workers=workers,
+                max_inflight_bytes=int(getattr(request, "max_inflight_bytes", 0) or 0) or DEFAULT_MAX_INFLIGHT_BYTES,
+                cancel_check=cancel_check,
+            )
+
+        # Phase 2 — copy data (hashing as we stream, so each source file is read once)
+        copied = self._copy_tree(
             src_root=request.source_root,
             dst_root=plan.incomplete_path,
             cancel_check=cancel_check,
+            prior=prior,
+            objects=objects,
+            pipeline=pipeline,
+            inventory=inventory,
+            durable=durability == DURABILITY_PER_FILE,
         )
 
-        # Ensure snapshot files are writable (required for verification/corruption tests)
-        try:
-            import os
-            for pth in plan.incomplete_path.rglob("*"):
+        # Ensure snapshot files are writable (required for verification/corruption tests).
+        # Reused files may be hardlinks to the prior snapshot's inode: left as they are.
+        if objects is None:
+            for cf in copied:
+                if cf.reused:
+                    continue
                 try:
-                    if pth.is_file():
-                        os.chmod(pth, 0o666)
+                    os.chmod(plan.incomplete_path / cf.rel_path, 0o666)
                 except Exception:
                     pass
-        except Exception:
-            pass
 
         # Phase 2.5 — write manifest (v2)
         source_name = self._source_name_for_request(request)
@@ -276,76 +330,355 @@ class BackupEngine:
             source_name=source_name,
             display_name=self._display_backup_name(source_name),
             backup_root=request.backup_root,
+            copied=copied,
+            storage_layout=layout,
+            ignore_patterns=inventory.ignore_patterns,
+        )
+
+        # Phase 2.9 — durability barrier: everything the snapshot references is on disk
+        # before the rename below makes it visible.
+        self._durability_barrier(
+            snapshot_dir=plan.incomplete_path,
+            inventory=inventory,
+            copied=copied,
+            objects=objects,
+            batched=durability == DURABILITY_BATCHED,
         )
 
         # Phase 3 — atomic finalize
         self._fs.rename(plan.incomplete_path, plan.backup_path)
+        self._fs.sync_barrier(dirs=[plan.backup_path.parent])
         self._finalize_snapshot_readonly(plan.backup_path)
         # Shared vault key lifecycle is bootstrap-authority driven (Section 4).
 
         finished_at = datetime.now(timezone.utc)
-        # Phase FINAL — rebuild snapshot index (authoritative refresh)
+        # Phase FINAL — add this snapshot to the index (full rebuild if the index is stale)
         try:
-            idx = rebuild_snapshot_index(
+            upsert_snapshot_index(
                 fs=self._fs,
                 backup_root=request.backup_root,
-            )
-            write_snapshot_index(
-                fs=self._fs,
-                index=idx,
+                snapshot_dir=plan.backup_path,
             )
         except Exception:
             # Do NOT fail backup if index rebuild fails
             pass
 
+        # Optional file-level catalog: created on request, kept current once it exists.
+        try:
+            self._update_catalog(request=request, snapshot_dir=plan.backup_path)
+        except Exception:
+            # Derived data only; sync_catalog() repairs it later.
+            pass
+
         return BackupResult(
             backup_id=plan.backup_id,
             backup_path=plan.backup_path,
             started_at=started_at,
             finished_at=finished_at,
             dry_run=False,
+            files_copied=sum(1 for cf in copied if not cf.reused),
+            files_reused=sum(1 for cf in copied if cf.reused),
+            worker_stats=pipeline.stats() if pipeline is not None else (),
         )
 
     # --------------------------------------------------------
     # Copy Engine
     # --------------------------------------------------------
 
-    def _copy_tree(self, *, src_root: Path, dst_root: Path, cancel_check=None) -> None:
-        if self._fs.is_file(src_root):
-            if cancel_check is not None and bool(cancel_check()):
-                raise RuntimeError("Cancelled by operator.")
-            self._copy_node(src=src_root, dst=dst_root / src_root.name, cancel_check=cancel_check)
-            return
+    def _copy_tree(
+        self,
+        *,
+        src_root: Path,
+        dst_root: Path,
+        cancel_check=None,
+        prior: PriorSnapshot | None = None,
+        objects: ObjectStore | None = None,
+        pipeline: ParallelCopyPipeline | None = None,
+        inventory: SourceInventory | None = None,
+        durable: bool = True,
+    ) -> list[CopiedFile]:
+        """
+        Copy the inventoried source files into dst_root and return one record per file.
 
-        for child in self._fs.iterdir(src_root):
-            if cancel_check is not None and bool(cancel_check()):
-                raise RuntimeError("Cancelled by operator.")
-            self._copy_node(src=child, dst=dst_root / child.name, cancel_check=cancel_check)
+        The inventory already applied the symlink/special-file skip policy, so this
+        phase never lists or stats the source tree itself. With a pipeline, only the
+        file copies run on the worker pool; records keep inventory order either way.
+        """
+        if inventory is None:
+            inventory = build_source_inventory(
+                fs=self._fs,
+                source_root=src_root,
+                strict=True,
+                cancel_check=cancel_check,
+            )
 
-    def _copy_node(self, *, src: Path, dst: Path, cancel_check=None) -> None:
-        if cancel_check is not None and bool(cancel_check()):
-            raise RuntimeError("Cancelled by operator.")
+        ctx = _CopyContext(
+            cancel_check=cancel_check,
+            prior=prior,
+            objects=objects,
+            pipeline=pipeline,
+            durable=durable,
+        )
+        copied: list[CopiedFile] = []
 
-        # Skip symlinks (policy)
-        if self._fs.is_symlink(src):
-            return
+        try:
+            for entry in inventory.entries:
+                ctx.check_cancel()
+                dst = dst_root / entry.rel_path
+
+                if entry.kind == "dir":
+                    if objects is None:
+                        self._fs.mkdir(dst, parents=True, exist_ok=True)
+                    continue
+
+                if objects is None:
+                    self._fs.mkdir(dst.parent, parents=True, exist_ok=True)
+                src = inventory.base / entry.rel_path
+
+                if pipeline is not None:
+                    pipeline.submit(
+                        size=entry.size,
+                        job=partial(self._copy_file, src=src, dst=dst, entry=entry, ctx=ctx),
+                    )
+                    continue
+                copied.append(self._copy_file(src=src, dst=dst, entry=entry, ctx=ctx))
+        except PipelineStopped:
+            # A worker failed; finish() below re-raises the first failure in inventory order.
+            pass
+        except BaseException:
+            if pipeline is not None:
+                pipeline.abort()
+            raise
 
-        if self._fs.is_dir(src):
-            self._fs.mkdir(dst, parents=True, exist_ok=True)
-            for child in self._fs.iterdir(src):
-                if cancel_check is not None and bool(cancel_check()):
-                    raise RuntimeError("Cancelled by operator.")
-                self._copy_node(src=child, dst=dst / child.name, cancel_check=cancel_check)
-            return
+        if pipeline is not None:
+            copied = pipeline.finish()
+        return copied
+
+    def _durability_barrier(
+        self,
+        *,
+        snapshot_dir: Path,
+        inventory: SourceInventory,
+        copied: list[CopiedFile],
+        objects: ObjectStore | None,
+        batched: bool,
+    ) -> None:
+        """
+        Flush the incomplete snapshot before it is committed.
+
+        Directory entries and the manifest are always flushed. File data is included
+        only in batched mode; per-file mode already fsynced each copy.
+        """
+        files: list[Path] = []
+        dirs: dict[Path, None] = {}
+
+        if objects is None:
+            for e in inventory.entries:
+                if e.kind == "dir":
+                    dirs[snapshot_dir / e.rel_path] = None
+            for cf in copied:
+                if batched or cf.reused:
+                    # Reused files are reflinks/hardlinks: new metadata even without new data.
+                    files.append(snapshot_dir / cf.rel_path)
+        else:
+            for cf in copied:
+                obj = objects.path_for(cf.digest_hex)
+                dirs[obj.parent] = None
+                if batched and not cf.reused:
+                    files.append(obj)
+            dirs[objects.root] = None
+
+        files.append(snapshot_dir / "manifest.json")
+        for sidecar in (PATH_INDEX_NAME, SUMMARY_NAME):
+            if self._fs.exists(snapshot_dir / sidecar):
+                files.append(snapshot_dir / sidecar)
+        dirs[snapshot_dir] = None
+        self._fs.sync_barrier(files=files, dirs=list(dirs))
+
+    def _copy_file(self, *, src: Path, dst: Path, entry: InventoryEntry, ctx: _CopyContext) -> CopiedFile:
+        rel = entry.rel_path
+
+        if ctx.prior is not None:
+            reused = self._try_reuse_prior(src=src, entry=entry, dst=dst, ctx=ctx)
+            if reused is not None:
+                return reused
+
+        if ctx.objects is not None:
+            hc = ctx.objects.ingest(src, cancel_check=ctx.cancel_check, durable=ctx.durable)
+        else:
+            hc = self._fs.copy_file_hashed(
+                src, dst, algo="sha256", cancel_check=ctx.cancel_check, durable=ctx.durable
+            )
 
-        if self._fs.is_file(src):
-            self._fs.mkdir(dst.parent, parents=True, exist_ok=True)
-            if cancel_check is not None and bool(cancel_check()):
-                raise RuntimeError("Cancelled by operator.")
-            self._fs.copy_file(src, dst, cancel_check=cancel_check)
+        # Only record a fingerprint if the file was stable for the whole copy; otherwise the
+        # next incremental run must not trust it.
+        mtime_ns: int | None = None
+        inode: int | None = None
+        try:
+            st_after = self._fs.stat(src)
+            if (
+                _stat_fingerprint(st_after)[0] == entry.mtime_ns
+                and st_after.st_size == entry.size == hc.size
+            ):
+                mtime_ns, inode = _stat_fingerprint(st_after)
+        except OSError:
+            pass
+
+        return CopiedFile(
+            rel_path=rel,
+            size=hc.size,
+            digest_hex=hc.digest.hex,
+            mtime_ns=mtime_ns,
+            inode=inode,
+        )
+
+    def _try_reuse_prior(
+        self,
+        *,
+        src: Path,
+        entry: InventoryEntry,
+        dst: Path,
+        ctx: _CopyContext,
+    ) -> CopiedFile | None:
+        prior = ctx.prior
+        rel = entry.rel_path
+        prev = prior.entries.get(rel.as_posix())
+        if prev is None:
+            return None
+
+        size, mtime_ns, inode = entry.size, entry.mtime_ns, entry.inode
+        if not inode:
+            # Listing-provided stat without a file id (Windows scandir): ask for a full stat.
+            try:
+                st = self._fs.stat(src)
+            except OSError:
+                return None
+            size = int(st.st_size)
+            mtime_ns, inode = _stat_fingerprint(st)
+
+        if (
+            prev.get("size") != size
+            or prev.get("mtime_ns") != mtime_ns
+            or prev.get("inode") != inode
+        ):
+            return None
+
+        digest_hex = str(prev["digest_hex"])
+        try:
+            if ctx.objects is not None:
+                # Content-addressed target: referencing the existing object is the whole copy.
+                if not ctx.objects.has(digest_hex, size=size):
+                    return None
+            elif prior.layout != LAYOUT_TREE:
+                # clone_file may hardlink: a store object must never become a tree file
+                # that can be written through.
+                return None
+            else:
+                prior_file = prior.file_path(rel=rel, digest_hex=digest_hex)
+                if self._fs.stat(prior_file).st_size != size:
+                    return None
+                self._fs.clone_file(prior_file, dst)
+        except (OSError, SnapshotCorrupt):
+            # Different volume, missing file, no link support: fall back to a real copy.
+            return None
+
+        return CopiedFile(
+            rel_path=rel,
+            size=int(prev["size"]),
+            digest_hex=digest_hex,
+            mtime_ns=mtime_ns,
+            inode=inode,
+            reused=True,
+        )
+
+    def _update_catalog(self, *, request: BackupRequest, snapshot_dir: Path) -> None:
+        existed = catalog_path_for_backup_root(request.backup_root).exists()
+        catalog = VaultCatalog.open(request.backup_root, create=request.update_catalog)
+        if catalog is None:
             return
+        hmac_key = load_manifest_hmac_key(vault_root=request.backup_root)
+        with catalog:
+            if existed:
+                catalog_snapshot(catalog, fs=self._fs, snapshot_dir=snapshot_dir, hmac_key=hmac_key)
+            else:
+                # New catalog: import the snapshots that predate it as well.
+                sync_catalog(catalog, fs=self._fs, backup_root=request.backup_root, hmac_key=hmac_key)
+
+    # --------------------------------------------------------
+    # Incremental base
+    # --------------------------------------------------------
+
+    def _find_prior_snapshot_dir(self, *, backup_root: Path, src_root: Path) -> Path | None:
+        wanted = str(src_root)
+        storage_root = self._snapshot_storage_root(backup_root)
+
+        # Fast path: snapshot index rows carry source_root (newest first by snapshot id).
+        idx = load_snapshot_index(fs=self._fs, backup_root=backup_root)
+        if idx is not None:
+            rows = [r for r in idx.snapshots if isinstance(r, dict) and r.get("source_root") == wanted]
+            rows.sort(key=lambda r: str(r.get("snapshot_id") or ""), reverse=True)
+            for row in rows:
+                candidate = storage_root / str(row.get("snapshot_id") or "")
+                if row.get("snapshot_id") and self._fs.is_dir(candidate):
+                    return candidate
+
+        # Slow path: walk manifests newest-first and stop at the first match.
+        for ref in list_snapshots(fs=self._fs, backup_root=backup_root):
+            try:
+                md = read_snapshot_metadata(fs=self._fs, snapshot_dir=ref.snapshot_dir)
+            except Exception:
+                continue
+            if md.source_root == wanted:
+                return ref.snapshot_dir
 
-        # Skip special filesystem nodes silently for now
+        return None
+
+    def _load_prior_snapshot(self, *, backup_root: Path, src_root: Path) -> PriorSnapshot | None:
+        """
+        Locate and load the reuse base for an incremental backup (best-effort).
+
+        Only manifests that pass keyed integrity verification are trusted as a source of
+        digests; anything else degrades to a full backup.
+        """
+        try:
+            snapshot_dir = self._find_prior_snapshot_dir(backup_root=backup_root, src_root=src_root)
+            if snapshot_dir is None:
+                return None
+
+            raw = self._fs.read_text(snapshot_dir / "manifest.json")
+            manifest = json.loads(raw)
+            hmac_key = load_manifest_hmac_key(vault_root=backup_root)
+            ok, reason = verify_manifest_text_integrity(raw, hmac_key=hmac_key, manifest=manifest)
+            if not ok or reason != "ok":
+                return None
+            if manifest.get("manifest_version") != 2 or manifest.get("checksum_algo") != "sha256":
+                return None
+            layout = storage_layout_of(manifest)
+
+            entries: dict[str, dict] = {}
+            for item in manifest.get("files") or []:
+                if not isinstance(item, dict):
+                    continue
+                rel = item.get("path")
+                dh = item.get("digest_hex")
+                if not isinstance(rel, str) or not isinstance(dh, str) or len(dh) != 64:
+                    continue
+                if not isinstance(item.get("size"), int):
+                    continue
+                if not isinstance(item.get("mtime_ns"), int) or not isinstance(item.get("inode"), int):
+                    continue
+                entries[rel] = item
+        except Exception:
+            return None
+
+        if not entries:
+            return None
+        return PriorSnapshot(
+            snapshot_dir=snapshot_dir,
+            entries=entries,
+            vault_root=backup_root,
+            layout=layout,
+        )
 
     # --------------------------------------------------------
     # Manifest (v2)
@@ -362,35 +695,53 @@ class BackupEngine:
         source_name: str,
         display_name: str,
         backup_root: Path | None = None,
+        copied: list[CopiedFile] | None = None,
+        storage_layout: str = LAYOUT_TREE,
+        ignore_patterns: Sequence[str] = (),
     ) -> None:
         if backup_root is None:
             backup_root = dst_root.parent
 
-        files: list[dict[str, object]] = []
         algo = "sha256"
 
-        for rel_path in self._iter_files_relative(src_root):
-            src = src_root / rel_path if not self._fs.is_file(src_root) else src_root.parent / rel_path
-            st = self._fs.stat(src)
-            d = hash_path(self._fs, src, algo=algo)
-
-            files.append(
-                {
-                    "path": rel_path.as_posix(),
-                    "size": st.st_size,
+        if copied is None:
+            # Legacy path: no copy records available, re-read the source to hash it.
+            copied = []
+            for rel_path in self._iter_files_relative(src_root):
+                src = src_root / rel_path if not self._fs.is_file(src_root) else src_root.parent / rel_path
+                st = self._fs.stat(src)
+                d = hash_path(self._fs, src, algo=algo)
+                copied.append(CopiedFile(rel_path=rel_path, size=st.st_size, digest_hex=d.hex))
+
+        def file_entries():
+            # Size + digest come from the bytes actually written during the copy phase.
+            for cf in copied:
+                entry: dict[str, object] = {
+                    "path": cf.rel_path.as_posix(),
+                    "size": cf.size,
                     "type": "file",
-                    "digest_hex": d.hex,
+                    "digest_hex": cf.digest_hex,
                 }
-            )
+                if cf.mtime_ns is not None and cf.inode is not None:
+                    entry["mtime_ns"] = cf.mtime_ns
+                    entry["inode"] = cf.inode
+                yield entry
 
+        # Everything but "files"; the file list is streamed straight to disk below.
         manifest = {
             "manifest_version": 2,
             "backup_id": backup_id,
+            "source_root": str(src_root.expanduser().resolve()),
             "source_name": source_name,
             "display_name": display_name,
             "checksum_algo": algo,
-            "files": files,
         }
+        if storage_layout != LAYOUT_TREE:
+            # Signed with the rest of the manifest, so the layout cannot be flipped later.
+            manifest["storage_layout"] = storage_layout
+        if ignore_patterns:
+            # Record what was deliberately left out, so "missing" files are explainable later.
+            manifest["ignore_patterns"] = list(ignore_patterns)
 
         # --- Business seat ownership tagging (SAFE optional) ---
         try:
@@ -440,14 +791,35 @@ class BackupEngine:
             raise SnapshotCorrupt(
                 "Business vault manifest HMAC key is missing; refusing to create snapshot."
             )
-        manifest = add_integrity_block(manifest, hmac_key=hmac_key)
+        # Byte-identical to json.dumps(add_integrity_block(...), indent=2, sort_keys=True),
+        # without holding the file list or the serialized document in memory.
+        integrity = write_manifest_stream(
+            self._fs,
+            dst_root / "manifest.json",
+            header=manifest,
+            files=file_entries(),
+            hmac_key=hmac_key,
+        )
 
-        manifest_path = dst_root / "manifest.json"
+        # Signed path index: header and entries for point/subtree reads without the manifest.
+        write_path_index(
+            self._fs,
+            dst_root / PATH_INDEX_NAME,
+            header=manifest,
+            entries=file_entries(),
+            manifest_digest_hex=integrity["digest_hex"],
+            hmac_key=hmac_key,
+        )
 
-        self._fs.write_text(
-            manifest_path,
-            json.dumps(manifest, indent=2, sort_keys=True),
-            encoding="utf-8",
+        # Signed counts/identity for listings and index rebuilds (no file list parse).
+        write_snapshot_summary(
+            self._fs,
+            dst_root / SUMMARY_NAME,
+            header=manifest,
+            file_count=len(copied),
+            total_bytes=sum(cf.size for cf in copied),
+            manifest_digest_hex=integrity["digest_hex"],
+            hmac_key=hmac_key,
         )
 
     def _iter_files_relative(self, root: Path):
@@ -455,19 +827,25 @@ class BackupEngine:
             yield Path(root.name)
             return
 
-        for child in self._fs.iterdir(root):
+        for child in self._fs.scandir(root):
             yield from self._iter_files_relative_inner(root=root, node=child)
 
-    def _iter_files_relative_inner(self, *, root: Path, node: Path):
-        if self._fs.is_symlink(node):
+    def _iter_files_relative_inner(self, *, root: Path, node: FsEntry):
+        if node.is_symlink():
             return
 
-        if self._fs.is_dir(node):
-            for child in self._fs.iterdir(node):
+        if node.is_dir(follow_symlinks=False):
+            for child in self._fs.scandir(node.path):
                 yield from self._iter_files_relative_inner(root=root, node=child)
             return
 
-        if self._fs.is_file(node):
-            yield node.relative_to(root)
+        if node.is_file(follow_symlinks=False):
+            yield node.path.relative_to(root)
             return
 
+
+def _stat_fingerprint(st) -> tuple[int, int]:
+    mtime_ns = getattr(st, "st_mtime_ns", None)
+    if mtime_ns is None:
+        mtime_ns = int(float(getattr(st, "st_mtime", 0) or 0) * 1_000_000_000)
+    return int(mtime_ns), int(getattr(st, "st_ino", 0) or 0)
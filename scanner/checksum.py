@@ -15,6 +15,16 @@ class Digest:
     hex: str
 
 
+@dataclass(frozen=True)
+class HashedCopy:
+    """
+    Result of a copy that hashed the bytes while streaming them.
+    `size` is the number of bytes actually copied (and hashed).
+    """
+    digest: Digest
+    size: int
+
+
 def hash_stream(
     stream: BinaryIO, *, algo: str = "sha256", chunk_size: int = 1024 * 1024
 ) -> Digest:
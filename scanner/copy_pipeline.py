@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_INFLIGHT_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CopyWorkerStats:
+    """Per-worker throughput for one backup copy phase."""
+    worker: str
+    files: int
+    bytes: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes / self.seconds
+
+
+class ParallelCopyPipeline(Generic[T]):
+    """
+    Bounded worker pool for file copies.
+
+    - At most `workers` copies run at once.
+    - submit() blocks while admitting the job would push in-flight bytes past
+      `max_inflight_bytes` (a single file larger than the cap is admitted alone).
+    - Results are returned in submission order; the first failure in submission
+      order is re-raised, so outcomes do not depend on thread scheduling.
+
+    The caller keeps traversal (and its skip policy) on its own thread; only the
+    per-file work runs on the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+        cancel_check=None,
+        thread_name_prefix: str = "devvault-copy",
+    ):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix)
+        self._max_inflight = max(1, int(max_inflight_bytes))
+        self._cancel_check = cancel_check
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._failed: BaseException | None = None
+        self._futures: list[Future] = []
+        self._stats: dict[str, list[float]] = {}
+
+    def _check_cancel(self) -> None:
+        if self._cancel_check is not None and bool(self._cancel_check()):
+            raise RuntimeError("Cancelled by operator.")
+
+    def submit(self, *, size: int, job: Callable[[], T]) -> None:
+        size = max(0, int(size))
+        with self._cond:
+            while (
+                self._failed is None
+                and self._inflight > 0
+                and self._inflight + size > self._max_inflight
+            ):
+                self._cond.wait(timeout=0.2)
+                self._check_cancel()
+            if self._failed is not None:
+                # Stop feeding the pool; finish() reports the failure deterministically.
+                raise PipelineStopped()
+            self._inflight += size
+
+        self._futures.append(self._executor.submit(self._run, size, job))
+
+    def _run(self, size: int, job: Callable[[], T]) -> T:
+        started = time.monotonic()
+        try:
+            out = job()
+        except BaseException as e:
+            with self._cond:
+                if self._failed is None:
+                    self._failed = e
+                self._cond.notify_all()
+            raise
+        finally:
+            with self._cond:
+                self._inflight -= size
+                self._cond.notify_all()
+
+        elapsed = time.monotonic() - started
+        name = threading.current_thread().name
+        with self._cond:
+            st = self._stats.setdefault(name, [0, 0, 0.0])
+            st[0] += 1
+            st[1] += size
+            st[2] += elapsed
+        return out
+
+    def finish(self) -> list[T]:
+        """Wait for all submitted jobs and return their results in submission order."""
+        try:
+            results: list[T] = []
+            first_error: BaseException | None = None
+            for fut in self._futures:
+                try:
+                    res = fut.result()
+                except BaseException as e:
+                    if first_error is None:
+                        first_error = e
+                    continue
+                results.append(res)
+            if first_error is not None:
+                raise first_error
+            return results
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def abort(self) -> None:
+        """Stop accepting work, drop queued jobs and wait for running ones."""
+        with self._cond:
+            if self._failed is None:
+                self._failed = RuntimeError("Copy pipeline aborted.")
+            self._cond.notify_all()
+        for fut in self._futures:
+            fut.cancel()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> tuple[CopyWorkerStats, ...]:
+        with self._cond:
+            return tuple(
+                CopyWorkerStats(worker=name, files=int(v[0]), bytes=int(v[1]), seconds=float(v[2]))
+                for name, v in sorted(self._stats.items())
+            )
+
+
+class PipelineStopped(RuntimeError):
+    """Raised by submit() once a job has failed; the real error comes from finish()."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
@@ -71,14 +72,16 @@ def dir_size_bytes(
         p = stack.pop()
 
         try:
-            for entry in fs.iterdir(p):
+            # scandir entries carry the file type from the listing, so each file costs
+            # one stat (size) instead of is_dir + stat.
+            for entry in fs.scandir(p):
                 try:
-                    if fs.is_dir(entry):
+                    if entry.is_dir():
                         if entry.name.lower() in skip:
                             continue
-                        stack.append(entry)
+                        stack.append(entry.path)
                     else:
-                        total += fs.stat(entry).st_size
+                        total += entry.stat().st_size
                 except (PermissionError, FileNotFoundError, OSError):
                     continue
         except (PermissionError, FileNotFoundError, OSError):
@@ -137,8 +140,17 @@ def is_project_dir(
     if not fs.is_dir(p):
         return False, ""
 
+    # One listing answers the marker checks and the work-structure heuristic below.
     try:
-        if fs.is_dir(p / ".git"):
+        entries = fs.scandir(p)
+    except (PermissionError, FileNotFoundError, OSError):
+        return False, ""
+
+    try:
+        by_name = {os.path.normcase(e.name): e for e in entries}
+
+        git = by_name.get(os.path.normcase(".git"))
+        if git is not None and git.is_dir():
             return True, "has .git"
 
         for name in (
@@ -148,7 +160,7 @@ def is_project_dir(
             "go.mod",
             "requirements.txt",
         ):
-            if fs.exists(p / name):
+            if os.path.normcase(name) in by_name:
                 return True, f"has {name}"
 
     except (PermissionError, FileNotFoundError, OSError):
@@ -217,10 +229,10 @@ def is_project_dir(
         child_dir_names: set[str] = set()
         meaningful_file_count = 0
 
-        for child in fs.iterdir(p):
+        for child in entries:
             try:
                 name = child.name.strip().lower()
-                if fs.is_dir(child):
+                if child.is_dir():
                     child_dir_names.add(name)
                     continue
 
@@ -322,10 +334,10 @@ def scan_roots(
             except Exception:
                 pass
 
-            for child in fs.iterdir(dir_path):
+            for child in fs.scandir(dir_path):
 
                 try:
-                    if not fs.is_dir(child):
+                    if not child.is_dir():
                         continue
 
 
@@ -337,7 +349,7 @@ def scan_roots(
                     if name.startswith(".") and depth >= 1:
                         continue
 
-                    walk(child, depth + 1)
+                    walk(child.path, depth + 1)
 
                 except (PermissionError, FileNotFoundError, OSError):
                     dirs_skipped += 1
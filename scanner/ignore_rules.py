@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from scanner.ports.filesystem import FileSystemPort
+
+# Per-project ignore files honored (root of the source only) when enabled.
+IGNORE_FILE_NAMES = (".gitignore", ".devvaultignore")
+
+# Characters escaped inside a translated [...] class: only "-" keeps a meaning (ranges).
+_CLASS_SPECIALS = frozenset("\\[]^&~|")
+
+
+@dataclass(frozen=True)
+class _Rule:
+    pattern: str
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+
+
+def _translate_glob(pat: str) -> str:
+    """Translate one gitignore-style glob body into a regex (no anchors)."""
+    out: list[str] = []
+    i, n = 0, len(pat)
+    while i < n:
+        c = pat[i]
+        if c == "*":
+            if pat.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pat.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            # As in fnmatch/git, a "]" right after "[" (or "[!", "[^") is a class member.
+            j = i + 1
+            if j < n and pat[j] in "!^":
+                j += 1
+            if j < n and pat[j] == "]":
+                j += 1
+            j = pat.find("]", j)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pat[i + 1 : j]
+                negate = body[:1] in ("!", "^")
+                if negate:
+                    body = body[1:]
+                members = "".join("\\" + ch if ch in _CLASS_SPECIALS else ch for ch in body)
+                out.append("[" + ("^" if negate else "") + members + "]")
+                i = j + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pat[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _compile_rule(raw: str, *, flags: int) -> _Rule | None:
+    line = raw.rstrip("\r\n")
+    if not line.strip() or line.lstrip().startswith("#"):
+        return None
+    line = line.strip()
+
+    negate = False
+    if line.startswith("!"):
+        negate = True
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # gitignore: a slash anywhere but the end anchors the pattern to the source root.
+    anchored = "/" in line
+    glob = line.lstrip("/")
+    prefix = "^" if anchored else "^(?:.*/)?"
+    try:
+        regex = re.compile(prefix + _translate_glob(glob) + "$", flags)
+    except re.error:
+        # Still not a valid class (say, a reversed range "[z-a]"): match the text literally
+        # rather than let one bad line abort the walk.
+        regex = re.compile(prefix + re.escape(glob) + "$", flags)
+
+    return _Rule(
+        pattern=raw.strip(),
+        regex=regex,
+        negate=negate,
+        dir_only=dir_only,
+    )
+
+
+class IgnoreMatcher:
+    """
+    Compiled gitignore-style matcher over source-relative POSIX paths.
+
+    Supported: `*`, `?`, `[...]`, `**`, leading `/` anchoring, trailing `/`
+    (directories only), `!` negation (last matching rule wins) and `#` comments.
+    Callers prune ignored directories before descending, so - as with git - a
+    file under an ignored directory cannot be re-included.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        rules = [r for r in (_compile_rule(p, flags=flags) for p in patterns) if r is not None]
+        self._rules: tuple[_Rule, ...] = tuple(rules)
+        self.patterns: tuple[str, ...] = tuple(r.pattern for r in rules)
+
+        # Without negations the verdict is "any rule matches": fold into one regex per kind.
+        self._combined: dict[bool, re.Pattern | None] | None = None
+        if not any(r.negate for r in rules):
+            self._combined = {
+                True: _combine([r.regex for r in rules], flags),
+                False: _combine([r.regex for r in rules if not r.dir_only], flags),
+            }
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def is_ignored(self, rel_path: str | Path, *, is_dir: bool) -> bool:
+        rel = rel_path.as_posix() if isinstance(rel_path, Path) else str(rel_path)
+        if not rel or not self._rules:
+            return False
+
+        if self._combined is not None:
+            rx = self._combined[bool(is_dir)]
+            return rx is not None and rx.match(rel) is not None
+
+        ignored = False
+        for rule in self._rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(rel):
+                ignored = not rule.negate
+        return ignored
+
+
+def _combine(regexes: Sequence[re.Pattern], flags: int) -> re.Pattern | None:
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{r.pattern})" for r in regexes), flags)
+
+
+def read_ignore_files(*, fs: FileSystemPort, source_root: Path) -> list[str]:
+    """Patterns from .gitignore/.devvaultignore at the source root (missing files are fine)."""
+    out: list[str] = []
+    for name in IGNORE_FILE_NAMES:
+        p = source_root / name
+        try:
+            if not fs.is_file(p):
+                continue
+            out.extend(fs.read_text(p, encoding="utf-8").splitlines())
+        except (OSError, UnicodeDecodeError):
+            continue
+    return out
+
+
+def matcher_for_request(*, fs: FileSystemPort, request, source_root: Path) -> IgnoreMatcher:
+    patterns = list(getattr(request, "ignore_patterns", ()) or ())
+    if getattr(request, "use_ignore_files", False) and fs.is_dir(source_root):
+        patterns = read_ignore_files(fs=fs, source_root=source_root) + patterns
+    return IgnoreMatcher(patterns)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from scanner.ports.filesystem import FileSystemPort
+
+T = TypeVar("T")
+
+# Parsed JSON (dicts/str/int objects) costs several times its text size.
+_PARSED_BYTES_PER_TEXT_BYTE = 6
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class _Entry:
+    fingerprint: Tuple[int, int, int]
+    manifest: Dict[str, Any]
+    cost: int
+    derived: Dict[str, Any] = field(default_factory=dict)
+
+
+class ManifestCache:
+    """
+    Process-wide LRU of parsed manifest.json documents.
+
+    - Entries are keyed by path and revalidated on every access against the file's
+      (size, mtime_ns, inode); a rewritten manifest is re-read, never served stale.
+    - The cache is bounded by an estimate of parsed size, not by entry count.
+    - Returned manifests are shared: callers must treat them as read-only.
+    - derive() memoizes values computed from a manifest (e.g. snapshot metadata) for
+      as long as the manifest entry itself stays valid.
+    """
+
+    def __init__(self, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _fingerprint(fs: FileSystemPort, path: Path) -> Tuple[int, int, int]:
+        st = fs.stat(path)
+        mtime_ns = getattr(st, "st_mtime_ns", None)
+        if mtime_ns is None:
+            mtime_ns = int(st.st_mtime * 1_000_000_000)
+        return int(st.st_size), int(mtime_ns), int(getattr(st, "st_ino", 0) or 0)
+
+    def _lookup(self, key: str, fp: Tuple[int, int, int]) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.fingerprint != fp:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.cost
+            if entry.cost > self.max_bytes:
+                # Larger than the whole budget: serve it, but do not evict everything for it.
+                return
+            self._entries[key] = entry
+            self._bytes += entry.cost
+            while self._bytes > self.max_bytes and self._entries:
+                _k, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.cost
+
+    def _entry(self, fs: FileSystemPort, path: Path) -> _Entry:
+        key = str(path)
+        fp = self._fingerprint(fs, path)
+        entry = self._lookup(key, fp)
+        if entry is not None:
+            return entry
+
+        manifest = json.loads(fs.read_text(path))
+        entry = _Entry(
+            fingerprint=fp,
+            manifest=manifest,
+            cost=fp[0] * _PARSED_BYTES_PER_TEXT_BYTE,
+        )
+        # Only cache if the file did not change while it was being read.
+        if self._fingerprint(fs, path) == fp:
+            self._store(key, entry)
+        return entry
+
+    def load(self, fs: FileSystemPort, path: Path) -> Any:
+        """Parsed JSON of `path` (json.JSONDecodeError / OSError propagate, nothing is cached)."""
+        return self._entry(fs, path).manifest
+
+    def derive(self, fs: FileSystemPort, path: Path, name: str, compute: Callable[[Any], T]) -> T:
+        """compute(manifest), memoized per manifest version. Exceptions are not cached."""
+        entry = self._entry(fs, path)
+        if name in entry.derived:
+            return entry.derived[name]
+        value = compute(entry.manifest)
+        with self._lock:
+            entry.derived[name] = value
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def approx_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+MANIFEST_CACHE = ManifestCache()
+
+
+def load_manifest_cached(fs: FileSystemPort, path: Path) -> Any:
+    """Parsed manifest.json via the process-wide cache (read-only result)."""
+    return MANIFEST_CACHE.load(fs, path)
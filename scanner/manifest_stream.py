@@ -0,0 +1,289 @@
+"""
+Streaming manifest I/O.
+
+The bytes produced here are exactly json.dumps(manifest, indent=2, sort_keys=True)
+with the manifest_integrity block, i.e. ordinary v2 manifests: every reader keeps
+working and the digest is the one add_integrity_block() would compute. Streaming is
+possible because of the canonical key order:
+
+- "files" sorts before "manifest_integrity", so the (large) file list is written and
+  hashed before the digest is needed;
+- the keys after "manifest_integrity" are small header fields, hashed before the
+  integrity block is written in front of them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+from scanner.integrity_keys import ManifestHmacKey
+from scanner.manifest_integrity import verify_manifest_integrity
+from scanner.ports.filesystem import FileSystemPort
+
+
+_INTEGRITY_KEY = "manifest_integrity"
+_FILES_KEY = "files"
+_CHUNK = 1024 * 1024
+
+# Canonical layout of the integrity block (integrity dict keys sort as algo, digest_hex).
+_INTEGRITY_MARKER = b',\n  "manifest_integrity": {\n'
+_INTEGRITY_BODY = re.compile(
+    rb'    "algo": "(sha256|hmac-sha256)",\n'
+    rb'    "digest_hex": "([0-9a-f]{64})"\n'
+    rb"  }(,?)\n"
+)
+_INTEGRITY_BODY_MAX = 160
+
+
+def _new_mac(hmac_key: ManifestHmacKey | None):
+    if hmac_key is None:
+        return hashlib.sha256()
+    return hmac.new(hmac_key.key_bytes, digestmod=hashlib.sha256)
+
+
+def _item(key: str, value: Any) -> str:
+    body = json.dumps(value, indent=2, sort_keys=True).replace("\n", "\n  ")
+    return f"  {json.dumps(key)}: {body}"
+
+
+def _iter_files_item(files: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    yield f"  {json.dumps(_FILES_KEY)}: "
+    first = True
+    for entry in files:
+        body = json.dumps(entry, indent=2, sort_keys=True).replace("\n", "\n    ")
+        yield ("[\n    " if first else ",\n    ") + body
+        first = False
+    yield "[]" if first else "\n  ]"
+
+
+def write_manifest_stream(
+    fs: FileSystemPort,
+    path: Path,
+    *,
+    header: Dict[str, Any],
+    files: Iterable[Dict[str, Any]],
+    hmac_key: ManifestHmacKey | None = None,
+) -> Dict[str, str]:
+    """
+    Write a manifest whose "files" list comes from an iterable, in constant memory.
+
+    The digest is fed incrementally while writing; returns the integrity block.
+    """
+    if _FILES_KEY in header or _INTEGRITY_KEY in header:
+        raise ValueError("header must not contain 'files' or 'manifest_integrity'")
+
+    keys = sorted([*header, _FILES_KEY])
+    before = [k for k in keys if k < _INTEGRITY_KEY]
+    after = [k for k in keys if k > _INTEGRITY_KEY]
+
+    mac = _new_mac(hmac_key)
+    algo = "sha256" if hmac_key is None else "hmac-sha256"
+
+    with fs.open_write(path) as w:
+
+        def emit(s: str, *, signed: bool = True) -> None:
+            b = s.encode("utf-8")
+            if signed:
+                mac.update(b)
+            w.write(b)
+
+        emit("{\n")
+        for i, k in enumerate(before):
+            if i:
+                emit(",\n")
+            if k == _FILES_KEY:
+                for part in _iter_files_item(files):
+                    emit(part)
+            else:
+                emit(_item(k, header[k]))
+
+        # "files" is always in `before`, so the integrity item never opens the object.
+        tail = "".join(",\n" + _item(k, header[k]) for k in after) + "\n}"
+        mac.update(tail.encode("utf-8"))
+        integrity = {"algo": algo, "digest_hex": mac.hexdigest()}
+
+        emit(",\n" + _item(_INTEGRITY_KEY, integrity), signed=False)
+        emit(tail, signed=False)
+
+    return integrity
+
+
+def _verify_chunks(
+    chunks: Iterator[bytes],
+    *,
+    hmac_key: ManifestHmacKey | None,
+    fallback: Callable[[], Dict[str, Any]],
+) -> Tuple[bool, str]:
+    """
+    Verify the integrity of canonical manifest bytes without parsing them.
+
+    Anything that is not in the canonical layout, and any digest mismatch, is
+    decided by verify_manifest_integrity() on the parsed document instead, so the
+    verdict always equals the dict-based check.
+    """
+
+    def slow() -> Tuple[bool, str]:
+        return verify_manifest_integrity(fallback(), hmac_key=hmac_key)
+
+    mac = _new_mac(hmac_key)
+    keep = len(_INTEGRITY_MARKER) - 1
+    buf = b""
+
+    # 1) Sign everything up to the integrity block.
+    while True:
+        chunk = next(chunks, b"")
+        if not chunk:
+            return slow()
+        buf += chunk
+        i = buf.find(_INTEGRITY_MARKER)
+        if i >= 0:
+            mac.update(buf[:i])
+            buf = buf[i + len(_INTEGRITY_MARKER) :]
+            break
+        if len(buf) > keep:
+            mac.update(buf[:-keep])
+            buf = buf[-keep:]
+
+    # 2) Parse the block strictly.
+    while len(buf) < _INTEGRITY_BODY_MAX:
+        chunk = next(chunks, b"")
+        if not chunk:
+            break
+        buf += chunk
+    m = _INTEGRITY_BODY.match(buf)
+    if m is None:
+        return slow()
+    algo = m.group(1).decode("ascii")
+    digest_hex = m.group(2).decode("ascii")
+
+    if algo == "hmac-sha256" and hmac_key is None:
+        return False, "missing-hmac-key"
+    if (algo == "hmac-sha256") != (hmac_key is not None):
+        # sha256-sealed manifest read with a key at hand: rare, use the dict path.
+        return slow()
+
+    # 3) Sign the rest with the separator the block displaced.
+    mac.update(b",\n" if m.group(3) else b"\n")
+    mac.update(buf[m.end() :])
+    for chunk in chunks:
+        mac.update(chunk)
+
+    if hmac.compare_digest(mac.hexdigest(), digest_hex):
+        return True, "ok"
+    return slow()
+
+
+def verify_manifest_text_integrity(
+    text: str,
+    *,
+    hmac_key: ManifestHmacKey | None,
+    manifest: Dict[str, Any],
+) -> Tuple[bool, str]:
+    """verify_manifest_integrity() for a manifest already read (and parsed) from disk.
+
+    Hashes the text as read instead of re-serializing the parsed document.
+    """
+    chunks = (text[i : i + _CHUNK].encode("utf-8") for i in range(0, len(text), _CHUNK))
+    return _verify_chunks(chunks, hmac_key=hmac_key, fallback=lambda: manifest)
+
+
+def verify_manifest_file_integrity(
+    fs: FileSystemPort,
+    path: Path,
+    *,
+    hmac_key: ManifestHmacKey | None,
+) -> Tuple[bool, str]:
+    """verify_manifest_integrity() for a manifest file, in constant memory for canonical files."""
+    with fs.open_read(path) as f:
+        chunks = iter(lambda: f.read(_CHUNK), b"")
+        return _verify_chunks(
+            chunks,
+            hmac_key=hmac_key,
+            fallback=lambda: json.loads(fs.read_text(path)),
+        )
+
+
+def read_manifest_integrity_tail(fs: FileSystemPort, path: Path, *, window: int = 64 * 1024) -> Dict[str, str] | None:
+    """
+    Read the integrity block of a canonical manifest from its tail, without parsing it.
+
+    Only "files" precedes the block, so it sits within the last few KiB. Returns None
+    when the manifest is not in canonical layout. This does not verify the digest.
+    """
+    try:
+        with fs.open_read(path) as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - window))
+            tail = f.read()
+    except OSError:
+        return None
+
+    i = tail.rfind(_INTEGRITY_MARKER)
+    if i < 0:
+        return None
+    m = _INTEGRITY_BODY.match(tail, i + len(_INTEGRITY_MARKER))
+    if m is None:
+        return None
+    return {"algo": m.group(1).decode("ascii"), "digest_hex": m.group(2).decode("ascii")}
+
+
+_FILES_MARKER = b'\n  "files": '
+
+
+def read_manifest_header(fs: FileSystemPort, path: Path, *, window: int = 64 * 1024) -> Dict[str, Any] | None:
+    """
+    Parse every top-level field of a canonical manifest except "files" and
+    "manifest_integrity", reading only its head and tail.
+
+    The header keys sort around "files" and the integrity block, so they sit in the
+    first and last few KiB. Returns None when the manifest is not in canonical
+    layout. This does not verify the digest (see verify_manifest_file_integrity).
+    """
+    try:
+        with fs.open_read(path) as f:
+            head = b""
+            while True:
+                chunk = f.read(window)
+                if not chunk:
+                    return None
+                head += chunk
+                i = head.find(_FILES_MARKER)
+                if i >= 0:
+                    head = head[:i]
+                    break
+                if len(head) > 16 * window:
+                    return None
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - window))
+            tail = f.read()
+    except OSError:
+        return None
+
+    j = tail.rfind(_INTEGRITY_MARKER)
+    if j < 0:
+        return None
+    m = _INTEGRITY_BODY.match(tail, j + len(_INTEGRITY_MARKER))
+    if m is None:
+        return None
+
+    # head is "{" plus the items before "files" (each ending in ","); the items after
+    # the integrity block follow it up to the closing brace.
+    head = head.rstrip(b",")
+    rest = tail[m.end() :] if m.group(3) else b"}"
+    if head.strip() == b"{":
+        text = b"{\n" + rest if m.group(3) else b"{}"
+    else:
+        text = head + (b",\n" + rest if m.group(3) else b"\n}")
+
+    try:
+        header = json.loads(text.decode("utf-8"))
+    except ValueError:
+        return None
+    return header if isinstance(header, dict) else None
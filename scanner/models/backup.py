@@ -24,13 +24,99 @@ class BackupRequest:
     # If True, compute/plan without writing any output.
     dry_run: bool = False
 
-    # Optional ignore patterns (implementation-defined: glob-like patterns are typical)
+    # If True, files whose stat fingerprint (size, mtime, inode) matches the previous
+    # snapshot of the same source are cloned from it instead of re-copied/re-hashed.
+    incremental: bool = False
+
+    # "tree": each snapshot holds a full copy of the files.
+    # "objects": file content is stored once in <vault>/.devvault/objects keyed by sha256,
+    # and the snapshot holds only its (signed) manifest.
+    storage_layout: str = "tree"
+
+    # Copy concurrency: >1 copies files on a bounded worker pool (traversal stays serial).
+    copy_workers: int = 1
+
+    # Upper bound on bytes of files being copied concurrently (0 = engine default).
+    max_inflight_bytes: int = 0
+
+    # "per-file": fsync every file as it is copied.
+    # "batched": skip per-file fsyncs and flush the whole snapshot (data + directories)
+    # once, right before the atomic finalize rename. Same guarantee for the committed snapshot.
+    durability: str = "per-file"
+
+    # gitignore-style patterns relative to source_root; matching directories are pruned
+    # (never descended into), matching files are left out of the snapshot.
     ignore_patterns: Sequence[str] = ()
 
+    # If True, also honor .gitignore/.devvaultignore at the source root (before ignore_patterns).
+    use_ignore_files: bool = False
+
+    # If True, create <vault>/.devvault/catalog.sqlite (file-level path/digest index) when
+    # missing. An existing catalog is always kept current, whatever this flag says.
+    update_catalog: bool = False
+
     # For deterministic tests and traceability; defaults to "now" in UTC.
     requested_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+@dataclass(frozen=True, slots=True)
+class InventoryEntry:
+    """One regular file or directory in a source tree (symlinks/special nodes are never listed)."""
+    rel_path: Path
+    kind: str  # "file" | "dir"
+    size: int = 0
+    mtime_ns: int = 0
+    # 0 when the listing did not provide a file id (e.g. Windows scandir).
+    inode: int = 0
+
+
+@dataclass(frozen=True)
+class SourceInventory:
+    """
+    Single traversal of a backup source, shared by preflight and every backup phase.
+
+    Notes:
+    - `base` is the directory rel_paths are relative to (source_root, or its parent
+      when the source is a single file).
+    - Entries are in traversal order; parents always precede their children.
+    - A snapshot built from an inventory contains exactly the inventoried files.
+    """
+    source_root: Path
+    base: Path
+    entries: tuple[InventoryEntry, ...]
+
+    skipped_symlinks: int = 0
+    unreadable_permission_denied: int = 0
+    unreadable_locked_or_in_use: int = 0
+    unreadable_not_found: int = 0
+    unreadable_other_io: int = 0
+    unreadable_samples: tuple[str, ...] = ()
+
+    # Ignore rules the traversal was pruned with, and how many files/dirs they excluded.
+    ignore_patterns: tuple[str, ...] = ()
+    ignored_count: int = 0
+
+    def files(self) -> tuple[InventoryEntry, ...]:
+        return tuple(e for e in self.entries if e.kind == "file")
+
+    @property
+    def file_count(self) -> int:
+        return sum(1 for e in self.entries if e.kind == "file")
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.size for e in self.entries if e.kind == "file")
+
+    @property
+    def unreadable_count(self) -> int:
+        return (
+            self.unreadable_permission_denied
+            + self.unreadable_locked_or_in_use
+            + self.unreadable_not_found
+            + self.unreadable_other_io
+        )
+
+
 @dataclass(frozen=True)
 class PreflightReport:
     """
@@ -49,6 +135,9 @@ class PreflightReport:
     # Policy-based skips (currently: symlinks)
     skipped_symlinks: int = 0
 
+    # Files/dirs excluded by ignore rules (an ignored dir counts once; it is not descended into)
+    ignored_count: int = 0
+
     # Best-effort classification of paths we could not stat/read
     unreadable_permission_denied: int = 0
     unreadable_locked_or_in_use: int = 0
@@ -59,6 +148,9 @@ class PreflightReport:
     unreadable_samples: tuple[str, ...] = ()
     warnings: tuple[str, ...] = ()
 
+    # The traversal preflight performed; pass to BackupEngine.execute(inventory=...) to reuse it.
+    inventory: SourceInventory | None = field(default=None, repr=False, compare=False)
+
 
 @dataclass(frozen=True)
 class BackupResult:
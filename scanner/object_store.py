@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+from uuid import uuid4
+
+from scanner.checksum import HashedCopy
+from scanner.errors import SnapshotCorrupt
+from scanner.ports.filesystem import FileSystemPort
+
+INTERNAL_DIR_NAME = ".devvault"
+OBJECTS_DIR_NAME = "objects"
+INCOMING_DIR_NAME = ".incoming"
+
+# Manifest "storage_layout" values.
+LAYOUT_TREE = "tree"
+LAYOUT_OBJECTS = "objects"
+
+
+def object_store_root(backup_root: Path) -> Path:
+    return backup_root / INTERNAL_DIR_NAME / OBJECTS_DIR_NAME
+
+
+def object_path(store_root: Path, digest_hex: str) -> Path:
+    d = str(digest_hex or "").lower()
+    if len(d) != 64 or any(c not in "0123456789abcdef" for c in d):
+        raise SnapshotCorrupt("Invalid manifest entry: invalid digest format.")
+    return store_root / d[:2] / d
+
+
+def storage_layout_of(manifest: Dict[str, Any]) -> str:
+    """Return the manifest's storage layout (fail-closed on unknown values).
+
+    - tree (default / absent): file bytes live under the snapshot directory.
+    - objects: file bytes live once in <vault>/.devvault/objects, keyed by sha256.
+    """
+    layout = manifest.get("storage_layout")
+    if layout is None or layout == LAYOUT_TREE:
+        return LAYOUT_TREE
+    if layout == LAYOUT_OBJECTS:
+        if manifest.get("manifest_version") != 2 or manifest.get("checksum_algo") != "sha256":
+            raise SnapshotCorrupt("Invalid manifest: object storage requires sha256 manifest v2.")
+        return LAYOUT_OBJECTS
+    raise SnapshotCorrupt("Invalid manifest: unsupported storage layout.")
+
+
+def snapshot_file_path(
+    *,
+    snapshot_dir: Path,
+    vault_root: Path,
+    layout: str,
+    rel_path: Path,
+    digest_hex: str | None,
+) -> Path:
+    """Resolve where the bytes of one manifest entry are stored."""
+    if layout == LAYOUT_OBJECTS:
+        if digest_hex is None:
+            raise SnapshotCorrupt("Invalid manifest entry: missing digest.")
+        return object_path(object_store_root(vault_root), digest_hex)
+    return snapshot_dir / rel_path
+
+
+class ObjectStore:
+    """Content-addressed file store: <root>/<aa>/<sha256 hex>.
+
+    Objects are written once via temp file + atomic rename and shared by every
+    snapshot that references the same digest.
+    """
+
+    def __init__(self, fs: FileSystemPort, root: Path):
+        self._fs = fs
+        self.root = root
+
+    @classmethod
+    def for_vault(cls, fs: FileSystemPort, backup_root: Path) -> "ObjectStore":
+        return cls(fs=fs, root=object_store_root(backup_root))
+
+    def path_for(self, digest_hex: str) -> Path:
+        return object_path(self.root, digest_hex)
+
+    def has(self, digest_hex: str, *, size: int) -> bool:
+        p = self.path_for(digest_hex)
+        try:
+            return self._fs.is_file(p) and int(self._fs.stat(p).st_size) == int(size)
+        except OSError:
+            return False
+
+    def ingest(self, src: Path, *, cancel_check=None, durable: bool = True) -> HashedCopy:
+        """Copy src into the store, hashing while streaming; one object per digest.
+
+        durable=False defers the fsync of new objects to the caller's sync barrier.
+        """
+        incoming = self.root / INCOMING_DIR_NAME
+        self._fs.mkdir(incoming, parents=True, exist_ok=True)
+        tmp = incoming / f"{uuid4().hex}.tmp"
+
+        try:
+            hc = self._fs.copy_file_hashed(
+                src, tmp, algo="sha256", cancel_check=cancel_check, durable=durable
+            )
+
+            final = self.path_for(hc.digest.hex)
+            # One object per digest, but an existing object is never trusted: it may have
+            # rotted at the same size. The freshly hashed bytes always take its place.
+            if self._fs.exists(final):
+                if not durable:
+                    # Older snapshots reference that object: flush first, so a crash
+                    # cannot replace good bytes with unflushed ones.
+                    self._fs.sync_barrier(files=[tmp])
+            else:
+                self._fs.mkdir(final.parent, parents=True, exist_ok=True)
+            self._fs.rename(tmp, final)
+            return hc
+        except BaseException:
+            try:
+                if self._fs.exists(tmp):
+                    self._fs.unlink(tmp)
+            except Exception:
+                pass
+            raise
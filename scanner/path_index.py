@@ -0,0 +1,448 @@
+"""
+Sorted, prefix-compressed path index stored next to manifest.json (manifest.idx).
+
+The index is a signed derivative of manifest.json (v2): it carries the manifest
+header (everything but "files" and the integrity block), the file count and total
+size, and every file entry. It answers "which entry is at this path / under this
+directory?" and "what is this snapshot?" by reading a few kilobytes instead of
+reading, authenticating and parsing the whole manifest.
+
+Layout (all integers are LEB128 varints unless noted):
+
+    MAGIC | manifest digest (32 raw bytes)
+    block*                      entries sorted by UTF-8 path bytes; prefix sharing
+                                restarts at every block
+    footer                      header section (length + canonical JSON), then per
+                                block: offset, length, count, first path, MAC
+    trailer                     u64 footer offset | u64 footer length | footer MAC | MAGIC
+
+Every block and the footer carry their own MAC (HMAC-SHA256 with the vault manifest
+key), bound to the manifest digest taken from manifest.json's integrity block. With
+a vault key that makes the index an authenticated statement on its own: a reader
+trusts what it reads from it without re-reading the manifest, and an index can never
+be paired with another snapshot's manifest. Without a key the MACs are plain sha256,
+which detects corruption exactly as an unkeyed manifest does.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import hmac
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from scanner.integrity_keys import ManifestHmacKey
+from scanner.errors import SnapshotCorrupt
+from scanner.manifest_stream import read_manifest_integrity_tail, verify_manifest_text_integrity
+from scanner.ports.filesystem import FileSystemPort
+from scanner.restore_selection import path_selected, selection_roots
+
+
+PATH_INDEX_NAME = "manifest.idx"
+
+_MAGIC = b"DVPIDX02"  # DVPIDX01 (no header section) is treated as absent
+_BLOCK_ENTRIES = 128
+_TRAILER = struct.Struct("<QQ32s8s")
+_HAS_FINGERPRINT = 0x01
+
+
+class PathIndexError(ValueError):
+    """The index is missing, damaged, or does not belong to the snapshot's manifest."""
+
+
+def _mac(hmac_key: ManifestHmacKey | None, *parts: bytes) -> bytes:
+    h = hashlib.sha256() if hmac_key is None else hmac.new(hmac_key.key_bytes, digestmod=hashlib.sha256)
+    for p in parts:
+        h.update(p)
+    return h.digest()
+
+
+def _put_varint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise ValueError("varint must be non-negative")
+    while True:
+        b = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(b | 0x80)
+        else:
+            out.append(b)
+            return
+
+
+def _get_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    n = 0
+    shift = 0
+    while True:
+        if pos >= len(buf):
+            raise PathIndexError("truncated varint")
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return n, pos
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n // 2 if not n & 1 else -(n + 1) // 2
+
+
+def _shared_prefix(a: bytes, b: bytes) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _encode_block(entries: List[Tuple[bytes, Dict[str, Any]]]) -> bytes:
+    out = bytearray()
+    prev = b""
+    for key, e in entries:
+        shared = _shared_prefix(prev, key)
+        _put_varint(out, shared)
+        _put_varint(out, len(key) - shared)
+        out += key[shared:]
+        _put_varint(out, int(e["size"]))
+        out += bytes.fromhex(str(e["digest_hex"]))
+        mtime_ns, inode = e.get("mtime_ns"), e.get("inode")
+        if isinstance(mtime_ns, int) and isinstance(inode, int):
+            out.append(_HAS_FINGERPRINT)
+            _put_varint(out, _zigzag(mtime_ns))
+            _put_varint(out, inode)
+        else:
+            out.append(0)
+        prev = key
+    return bytes(out)
+
+
+def _decode_block(buf: bytes) -> Iterator[Tuple[bytes, Dict[str, Any]]]:
+    pos = 0
+    prev = b""
+    while pos < len(buf):
+        shared, pos = _get_varint(buf, pos)
+        n, pos = _get_varint(buf, pos)
+        key = prev[:shared] + buf[pos : pos + n]
+        pos += n
+        size, pos = _get_varint(buf, pos)
+        digest = buf[pos : pos + 32]
+        pos += 32
+        if len(digest) != 32 or pos >= len(buf):
+            raise PathIndexError("truncated entry")
+        flags = buf[pos]
+        pos += 1
+        entry: Dict[str, Any] = {
+            "path": key.decode("utf-8"),
+            "size": size,
+            "type": "file",
+            "digest_hex": digest.hex(),
+        }
+        if flags & _HAS_FINGERPRINT:
+            zz, pos = _get_varint(buf, pos)
+            inode, pos = _get_varint(buf, pos)
+            entry["mtime_ns"] = _unzigzag(zz)
+            entry["inode"] = inode
+        prev = key
+        yield key, entry
+
+
+def write_path_index(
+    fs: FileSystemPort,
+    path: Path,
+    *,
+    header: Dict[str, Any],
+    entries: Iterable[Dict[str, Any]],
+    manifest_digest_hex: str,
+    hmac_key: ManifestHmacKey | None,
+) -> None:
+    """Write the index for a manifest header and its entries (v2 file entry dicts, any order)."""
+    digest = bytes.fromhex(manifest_digest_hex)
+    if len(digest) != 32:
+        raise ValueError("manifest digest must be 32 bytes")
+
+    keyed = sorted(((str(e["path"]).encode("utf-8"), e) for e in entries), key=lambda t: t[0])
+
+    meta = json.dumps(
+        {
+            "header": {k: v for k, v in header.items() if k not in ("files", "manifest_integrity")},
+            "file_count": len(keyed),
+            "total_bytes": sum(int(e["size"]) for _k, e in keyed),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    head = _MAGIC + digest
+    footer = bytearray()
+    _put_varint(footer, len(meta))
+    footer += meta
+    _put_varint(footer, (len(keyed) + _BLOCK_ENTRIES - 1) // _BLOCK_ENTRIES)
+
+    with fs.open_write(path) as w:
+        w.write(head)
+        offset = len(head)
+        for bi, start in enumerate(range(0, len(keyed), _BLOCK_ENTRIES)):
+            chunk = keyed[start : start + _BLOCK_ENTRIES]
+            block = _encode_block(chunk)
+            w.write(block)
+
+            first = chunk[0][0]
+            _put_varint(footer, offset)
+            _put_varint(footer, len(block))
+            _put_varint(footer, len(chunk))
+            _put_varint(footer, len(first))
+            footer += first
+            footer += _mac(hmac_key, b"block", digest, struct.pack("<Q", bi), block)
+            offset += len(block)
+
+        footer_bytes = bytes(footer)
+        w.write(footer_bytes)
+        w.write(
+            _TRAILER.pack(
+                offset,
+                len(footer_bytes),
+                _mac(hmac_key, b"footer", head, footer_bytes),
+                _MAGIC,
+            )
+        )
+
+
+class PathIndex:
+    """Read side of manifest.idx. Use open(); every read block is MAC-checked."""
+
+    def __init__(
+        self,
+        *,
+        fs: FileSystemPort,
+        path: Path,
+        manifest_digest: bytes,
+        hmac_key: ManifestHmacKey | None,
+        header: Dict[str, Any],
+        total_bytes: int,
+        blocks: List[Tuple[int, int, int, bytes, bytes]],
+    ):
+        self._fs = fs
+        self._path = path
+        self._digest = manifest_digest
+        self._key = hmac_key
+        # (offset, length, entry count, first path bytes, MAC)
+        self._blocks = blocks
+        self._first_keys = [b[3] for b in blocks]
+        # The manifest header (without "files"), as signed into the index.
+        self.header = header
+        self.total_bytes = total_bytes
+
+    @classmethod
+    def open(
+        cls,
+        fs: FileSystemPort,
+        snapshot_dir: Path,
+        *,
+        hmac_key: ManifestHmacKey | None,
+    ) -> "PathIndex":
+        """
+        Open the index of a snapshot, bound to its manifest's integrity digest.
+
+        Raises PathIndexError when the index is absent, damaged, or belongs to a
+        different manifest; callers then fall back to manifest.json.
+        """
+        path = snapshot_dir / PATH_INDEX_NAME
+        integrity = read_manifest_integrity_tail(fs, snapshot_dir / "manifest.json")
+        if integrity is None:
+            raise PathIndexError("manifest has no canonical integrity block")
+        expected_algo = "sha256" if hmac_key is None else "hmac-sha256"
+        if integrity["algo"] != expected_algo:
+            raise PathIndexError("manifest sealed with a different algorithm")
+        digest = bytes.fromhex(integrity["digest_hex"])
+
+        try:
+            with fs.open_read(path) as f:
+                head = f.read(len(_MAGIC) + 32)
+                f.seek(0, 2)
+                size = f.tell()
+                if size < len(head) + _TRAILER.size:
+                    raise PathIndexError("index too small")
+                f.seek(size - _TRAILER.size)
+                footer_off, footer_len, footer_mac, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+                if footer_off + footer_len + _TRAILER.size != size:
+                    raise PathIndexError("index trailer is inconsistent")
+                f.seek(footer_off)
+                footer = f.read(footer_len)
+        except OSError as e:
+            raise PathIndexError(f"index unreadable: {e}") from None
+
+        if head[: len(_MAGIC)] != _MAGIC or magic != _MAGIC:
+            raise PathIndexError("not a path index")
+        if head[len(_MAGIC) :] != digest:
+            raise PathIndexError("index belongs to a different manifest")
+        if not hmac.compare_digest(footer_mac, _mac(hmac_key, b"footer", head, footer)):
+            raise PathIndexError("index footer failed verification")
+
+        meta_len, pos = _get_varint(footer, 0)
+        try:
+            meta = json.loads(footer[pos : pos + meta_len].decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise PathIndexError("index header section is not valid JSON") from None
+        pos += meta_len
+        header = meta.get("header") if isinstance(meta, dict) else None
+        file_count = meta.get("file_count") if isinstance(meta, dict) else None
+        total_bytes = meta.get("total_bytes") if isinstance(meta, dict) else None
+        if not isinstance(header, dict) or not isinstance(file_count, int) or not isinstance(total_bytes, int):
+            raise PathIndexError("index header section is malformed")
+
+        blocks: List[Tuple[int, int, int, bytes, bytes]] = []
+        n, pos = _get_varint(footer, pos)
+        for _ in range(n):
+            off, pos = _get_varint(footer, pos)
+            length, pos = _get_varint(footer, pos)
+            count, pos = _get_varint(footer, pos)
+            klen, pos = _get_varint(footer, pos)
+            first = footer[pos : pos + klen]
+            pos += klen
+            mac = footer[pos : pos + 32]
+            pos += 32
+            blocks.append((off, length, count, first, mac))
+        if sum(b[2] for b in blocks) != file_count:
+            raise PathIndexError("index file count does not match its blocks")
+
+        return cls(
+            fs=fs,
+            path=path,
+            manifest_digest=digest,
+            hmac_key=hmac_key,
+            header=header,
+            total_bytes=total_bytes,
+            blocks=blocks,
+        )
+
+    def __len__(self) -> int:
+        return sum(b[2] for b in self._blocks)
+
+    def _read_block(self, i: int) -> List[Tuple[bytes, Dict[str, Any]]]:
+        off, length, _count, _first, mac = self._blocks[i]
+        with self._fs.open_read(self._path) as f:
+            f.seek(off)
+            data = f.read(length)
+        expected = _mac(self._key, b"block", self._digest, struct.pack("<Q", i), data)
+        if len(data) != length or not hmac.compare_digest(mac, expected):
+            raise PathIndexError("index block failed verification")
+        return list(_decode_block(data))
+
+    def lookup(self, rel_path: str) -> Dict[str, Any] | None:
+        """Manifest entry for one snapshot-relative POSIX path, or None."""
+        key = rel_path.encode("utf-8")
+        i = bisect.bisect_right(self._first_keys, key) - 1
+        if i < 0:
+            return None
+        for k, entry in self._read_block(i):
+            if k == key:
+                return entry
+            if k > key:
+                break
+        return None
+
+    def contains(self, rel_path: str) -> bool:
+        return self.lookup(rel_path) is not None
+
+    def iter_subtree(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Entries at `prefix` itself (a file) or anywhere below it (a directory), sorted."""
+        prefix = prefix.strip("/")
+        if not prefix:
+            for i in range(len(self._blocks)):
+                for _k, entry in self._read_block(i):
+                    yield entry
+            return
+
+        exact = prefix.encode("utf-8")
+        below = exact + b"/"
+        i = max(0, bisect.bisect_right(self._first_keys, exact) - 1)
+        while i < len(self._blocks):
+            if self._first_keys[i] > below and not self._first_keys[i].startswith(below):
+                return
+            for k, entry in self._read_block(i):
+                if k == exact or k.startswith(below):
+                    yield entry
+                elif k > below:
+                    return
+            i += 1
+
+
+def open_path_index(
+    fs: FileSystemPort,
+    snapshot_dir: Path,
+    *,
+    hmac_key: ManifestHmacKey | None,
+) -> PathIndex | None:
+    """PathIndex.open(), or None when the snapshot has no usable index."""
+    try:
+        return PathIndex.open(fs, snapshot_dir, hmac_key=hmac_key)
+    except (PathIndexError, ValueError):
+        return None
+
+
+def read_indexed_selection(
+    fs: FileSystemPort,
+    snapshot_dir: Path,
+    include: Iterable[str],
+    *,
+    hmac_key: ManifestHmacKey | None,
+) -> Dict[str, Any] | None:
+    """
+    Manifest header plus only the "files" entries matching include, read from manifest.idx.
+
+    Of manifest.json only the integrity tail is read; the header and entries are
+    authenticated by the index MACs. Returns None when the snapshot has no usable
+    index, and the caller then reads manifest.json itself, which decides every refusal.
+    """
+    include = tuple(include)
+    index = open_path_index(fs, snapshot_dir, hmac_key=hmac_key)
+    if index is None or index.header.get("manifest_version") != 2:
+        return None
+
+    selected: Dict[str, Dict[str, Any]] = {}
+    try:
+        for root in selection_roots(include):
+            for entry in index.iter_subtree(root):
+                if path_selected(entry["path"], include):
+                    selected[entry["path"]] = entry
+    except (PathIndexError, ValueError, OSError):
+        return None
+
+    return {**index.header, "files": [selected[p] for p in sorted(selected)]}
+
+
+def lookup_snapshot_path(
+    fs: FileSystemPort,
+    snapshot_dir: Path,
+    rel_path: str,
+    *,
+    hmac_key: ManifestHmacKey | None,
+) -> Dict[str, Any] | None:
+    """
+    Manifest entry for rel_path in a snapshot, or None.
+
+    Uses manifest.idx when present and valid; otherwise parses (and verifies)
+    manifest.json.
+    """
+    index = open_path_index(fs, snapshot_dir, hmac_key=hmac_key)
+    if index is not None:
+        return index.lookup(rel_path)
+
+    text = fs.read_text(snapshot_dir / "manifest.json")
+    manifest = json.loads(text)
+    ok, _reason = verify_manifest_text_integrity(text, hmac_key=hmac_key, manifest=manifest)
+    if not ok:
+        raise SnapshotCorrupt("Invalid manifest: integrity check failed.")
+    for item in manifest.get("files") or []:
+        if isinstance(item, dict) and item.get("path") == rel_path:
+            return item
+    return None
@@ -2,7 +2,26 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import BinaryIO, Iterator, Protocol
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Protocol
+
+if TYPE_CHECKING:
+    from scanner.checksum import HashedCopy
+
+
+class FsEntry(Protocol):
+    """
+    Directory entry with type/stat information cached from the directory listing.
+
+    Mirrors os.DirEntry: methods take follow_symlinks (default True) and only
+    touch the filesystem when the listing did not already provide the answer.
+    """
+    name: str
+    path: Path
+
+    def is_symlink(self) -> bool: ...
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool: ...
+    def is_file(self, *, follow_symlinks: bool = True) -> bool: ...
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result: ...
 
 
 class FileSystemPort(Protocol):
@@ -12,10 +31,28 @@ class FileSystemPort(Protocol):
     def is_symlink(self, path: Path) -> bool: ...
     def is_file(self, path: Path) -> bool: ...
     def iterdir(self, path: Path) -> Iterator[Path]: ...
+    def scandir(self, path: Path) -> list[FsEntry]: ...
+    def entry(self, path: Path) -> FsEntry: ...
+    def walk(self, root: Path, *, prune=None) -> Iterator[FsEntry]: ...
     def stat(self, path: Path) -> os.stat_result: ...
     def read_text(self, path: Path, *, encoding: str = "utf-8") -> str: ...
     def write_text(self, path: Path, data: str, *, encoding: str = "utf-8") -> None: ...
     def open_read(self, path: Path) -> BinaryIO: ...
+    def open_write(self, path: Path) -> BinaryIO: ...
     def unlink(self, path: Path) -> None: ...
+    def rmdir(self, path: Path) -> None: ...
+    def set_mtime_ns(self, path: Path, mtime_ns: int) -> None: ...
     def rename(self, src: Path, dst: Path) -> None: ...
     def copy_file(self, src: Path, dst: Path) -> None: ...
+    def copy_file_hashed(
+        self,
+        src: Path,
+        dst: Path,
+        *,
+        algo: str = "sha256",
+        cancel_check=None,
+        durable: bool = True,
+        exclusive: bool = False,
+    ) -> "HashedCopy": ...
+    def sync_barrier(self, *, files: Iterable[Path] = (), dirs: Iterable[Path] = ()) -> None: ...
+    def clone_file(self, src: Path, dst: Path) -> None: ...
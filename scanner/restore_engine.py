@@ -3,15 +3,24 @@ from __future__ import annotations
 from scanner.errors import SnapshotCorrupt, RestoreRefused
 
 import json
+import os
+import stat
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from uuid import uuid4
 
 from scanner.checksum import hash_path
-from scanner.manifest_integrity import verify_manifest_integrity
+from scanner.copy_pipeline import DEFAULT_MAX_INFLIGHT_BYTES, ParallelCopyPipeline, PipelineStopped
+from scanner.manifest_stream import verify_manifest_text_integrity
+from scanner.ignore_rules import IgnoreMatcher
 from scanner.integrity_keys import load_manifest_hmac_key
 from scanner.manifest_schema import validate_crypto_stanza
-from scanner.ports.filesystem import FileSystemPort
+from scanner.object_store import LAYOUT_TREE, snapshot_file_path, storage_layout_of
+from scanner.path_index import read_indexed_selection
+from scanner.ports.filesystem import FileSystemPort, FsEntry
+from scanner.restore_selection import normalize_selectors, path_selected
 
 
 @dataclass(frozen=True)
@@ -19,6 +28,52 @@ class RestoreRequest:
     snapshot_dir: Path
     destination_dir: Path
 
+    # >1 applies files (hashed copy + sha256 check + rename) on a bounded worker pool.
+    # Staging/promotion and fail-closed semantics are unchanged; the reported
+    # failure is the first one in manifest order.
+    workers: int = 1
+
+    # Snapshot-relative paths or globs to restore (see restore_selection); empty
+    # restores the whole snapshot. Only matching entries are checked and copied.
+    include: tuple[str, ...] = ()
+
+    # Sync into an existing (possibly non-empty) destination: files whose size and
+    # mtime, or else sha256, already match the manifest are left alone; the rest
+    # are rewritten through staged temp files. Requires a v2 manifest.
+    sync: bool = False
+    # With sync: also remove destination files (and emptied directories) that are
+    # not in the snapshot, limited to the selection when include is set.
+    delete_extras: bool = False
+
+
+@dataclass(frozen=True)
+class RestoreResult:
+    files_restored: int  # written from the snapshot
+    files_unchanged: int = 0  # sync: already correct, left in place
+    files_removed: int = 0  # sync + delete_extras: extras removed from the destination
+
+
+_RESTORE_MANIFEST_NAME = "_restore_manifest.txt"
+
+
+def _ignored_with_parents(ignore: IgnoreMatcher, rel: str, *, is_dir: bool) -> bool:
+    """Whether the backup's walk would have skipped rel (itself or a pruned parent)."""
+    parent = rel.rpartition("/")[0]
+    while parent:
+        if ignore.is_ignored(parent, is_dir=True):
+            return True
+        parent = parent.rpartition("/")[0]
+    return ignore.is_ignored(rel, is_dir=is_dir)
+
+
+@dataclass(frozen=True)
+class RestorePlan:
+    # (snapshot source, relative path, size, digest_hex or None for v1), manifest order
+    to_copy: list[tuple[Path, Path, int, str | None]]
+    is_v2: bool
+    mtimes: dict[Path, int]  # relative path -> source mtime_ns, where recorded
+    ignore_patterns: tuple[str, ...] = ()  # the backup's ignore rules, as recorded in the manifest
+
 
 class RestoreEngine:
     def __init__(self, fs: FileSystemPort):
@@ -76,7 +131,7 @@ class RestoreEngine:
         snapshot_id: str,
         mappings: list[tuple[Path, Path]],
     ) -> None:
-        manifest_path = destination_dir / "_restore_manifest.txt"
+        manifest_path = destination_dir / _RESTORE_MANIFEST_NAME
         manifest_text = self._build_restore_manifest_text(
             snapshot_id=snapshot_id,
             restored_at=datetime.now(timezone.utc).isoformat(),
@@ -84,49 +139,319 @@ class RestoreEngine:
         )
         self.fs.write_text(manifest_path, manifest_text, encoding="utf-8")
 
-    def restore(self, req: RestoreRequest, cancel_check=None) -> None: # Section7 runtime fix
+    def restore(self, req: RestoreRequest, cancel_check=None) -> RestoreResult: # Section7 runtime fix
         # --- Validate snapshot ---
-        if not self.fs.exists(req.snapshot_dir):
+        self._validate_snapshot_dir(req.snapshot_dir)
+
+        sync = bool(getattr(req, "sync", False))
+        delete_extras = bool(getattr(req, "delete_extras", False))
+        if delete_extras and not sync:
+            raise RuntimeError("Unsupported restore option: delete_extras requires sync.")
+
+        # --- Validate destination (do not create yet) ---
+        if self.fs.exists(req.destination_dir):
+            if not self.fs.is_dir(req.destination_dir):
+                raise RestoreRefused("Destination exists but is not a directory.")
+            if not sync and any(self.fs.iterdir(req.destination_dir)):
+                raise RestoreRefused("Destination directory must be empty.")
+        else:
+            # Nothing to sync against: an ordinary staged restore.
+            sync = delete_extras = False
+
+        workers = int(getattr(req, "workers", 1) or 1)
+        if workers < 1:
+            raise RuntimeError(f"Unsupported restore worker count: {workers}")
+
+        include = normalize_selectors(getattr(req, "include", ()) or ())
+
+        plan = self._plan(
+            req.snapshot_dir,
+            include,
+            require_v2="Sync restore requires a v2 manifest with sha256 digests." if sync else None,
+        )
+        to_copy, is_v2 = plan.to_copy, plan.is_v2
+
+        if sync:
+            return self._sync_restore(
+                req,
+                to_copy,
+                mtimes=plan.mtimes,
+                ignore_patterns=plan.ignore_patterns,
+                include=include,
+                delete_extras=delete_extras,
+                workers=workers,
+            )
+
+        # --- Apply restore (now we touch destination) ---
+        # If destination does not exist, stage into a sibling directory and only promote on success.
+        staged = False
+        stage_dir = req.destination_dir.parent / (req.destination_dir.name + ".devvault.staging")
+        restore_root = req.destination_dir
+
+        if not self.fs.exists(req.destination_dir):
+            if self.fs.exists(stage_dir):
+                raise RestoreRefused("Refusing restore: staging directory already exists.")
+            self.fs.mkdir(stage_dir, parents=True)
+            restore_root = stage_dir
+            staged = True
+
+        restored_mappings = self._apply_all(to_copy, restore_root=restore_root, is_v2=is_v2, workers=workers)
+
+        # Promote staged restore only after all files verified.
+        if staged:
+            self.fs.rename(stage_dir, req.destination_dir)
+
+        self._write_restore_manifest(
+            destination_dir=req.destination_dir,
+            snapshot_id=req.snapshot_dir.name,
+            mappings=restored_mappings,
+        )
+        return RestoreResult(files_restored=len(to_copy))
+
+    def _snapshot_file_stat(
+        self,
+        src: Path,
+        listings: dict[Path, dict[str, FsEntry] | None] | None,
+    ) -> os.stat_result | None:
+        """
+        stat of a snapshot file, or None when it is missing or not a regular file.
+
+        With listings (tree layout), each source directory is listed once (on first
+        use, so refusals still come in manifest order) and entries are answered from
+        the listing instead of three metadata calls per file. Names the listing does
+        not hold exactly (say, a different case on a case-insensitive volume) are
+        decided by exists/is_file/stat as before.
+
+        Without listings (objects layout) the file is stat'ed directly: an object shard
+        holds every snapshot's objects, so listing it costs more than the entries a
+        restore needs from it.
+        """
+        if listings is None:
+            try:
+                st = self.fs.stat(src)
+            except OSError:
+                return None
+            return st if stat.S_ISREG(st.st_mode) else None
+
+        parent = src.parent
+        if parent not in listings:
+            try:
+                listings[parent] = {e.name: e for e in self.fs.scandir(parent)}
+            except OSError:
+                listings[parent] = None
+        listing = listings[parent]
+        e = listing.get(src.name) if listing is not None else None
+
+        if e is None:
+            if not self.fs.exists(src) or not self.fs.is_file(src):
+                return None
+            return self.fs.stat(src)
+        if not e.is_file():
+            return None
+        return e.stat()
+
+    def _apply_all(
+        self,
+        to_copy: list[tuple[Path, Path, int, str | None]],
+        *,
+        restore_root: Path,
+        is_v2: bool,
+        workers: int,
+    ) -> list[tuple[Path, Path]]:
+        # Directories first (serially), so concurrent file applies never race on mkdir.
+        parents: dict[Path, None] = {}
+        for _src, rel_path, _size, _digest_hex in to_copy:
+            parents[(restore_root / rel_path).parent] = None
+        for parent in parents:
+            if not self.fs.exists(parent):
+                self.fs.mkdir(parent, parents=True)
+
+        if workers > 1:
+            return self._apply_parallel(to_copy, restore_root=restore_root, is_v2=is_v2, workers=workers)
+        return [
+            self._apply_file(src, rel_path, size, digest_hex, restore_root=restore_root, is_v2=is_v2)
+            for src, rel_path, size, digest_hex in to_copy
+        ]
+
+    def _sync_restore(
+        self,
+        req: RestoreRequest,
+        to_copy: list[tuple[Path, Path, int, str | None]],
+        *,
+        mtimes: dict[Path, int],
+        ignore_patterns: tuple[str, ...],
+        include: tuple[str, ...],
+        delete_extras: bool,
+        workers: int,
+    ) -> RestoreResult:
+        """
+        Bring an existing destination in line with the planned entries.
+
+        Not staged as a whole: each rewritten file is still copied to a temp file,
+        checked against its digest and renamed into place, so after a failure every
+        file is either its old or its restored version. Extras are only removed once
+        every file has been applied, and only regular files the backup would have
+        captured: symlinks, special files and paths matched by the snapshot's ignore
+        rules were left out of the backup on purpose and are never deleted.
+        """
+        dest = req.destination_dir
+        # One listing of the destination; symlinks are never followed.
+        existing = {e.path.relative_to(dest).as_posix(): e for e in self.fs.walk(dest)}
+        planned = {rel_path.as_posix() for _src, rel_path, _size, _digest_hex in to_copy}
+
+        # Refuse layouts a restore could only resolve by deleting data or by writing
+        # through a symlink out of the destination.
+        for rel in planned:
+            e = existing.get(rel)
+            if e is not None and e.is_dir(follow_symlinks=False):
+                raise RestoreRefused(f"Sync restore refused: destination path is a directory: {rel}")
+            parent = rel.rpartition("/")[0]
+            while parent:
+                e = existing.get(parent)
+                if e is not None and (e.is_symlink() or not e.is_dir(follow_symlinks=False)):
+                    raise RestoreRefused(f"Sync restore refused: destination path is not a directory: {parent}")
+                parent = parent.rpartition("/")[0]
+
+        to_write: list[tuple[Path, Path, int, str | None]] = []
+        unchanged: list[Path] = []
+        for item in to_copy:
+            _src, rel_path, size, digest_hex = item
+            e = existing.get(rel_path.as_posix())
+            if e is not None and e.is_file(follow_symlinks=False):
+                st = e.stat(follow_symlinks=False)
+                if st.st_size == size:
+                    mtime_ns = mtimes.get(rel_path)
+                    if mtime_ns is not None and st.st_mtime_ns == mtime_ns:
+                        unchanged.append(rel_path)
+                        continue
+                    if hash_path(self.fs, e.path, algo="sha256").hex == digest_hex:
+                        unchanged.append(rel_path)
+                        # Stamp the snapshot mtime so the next sync skips it without hashing.
+                        if mtime_ns is not None:
+                            self.fs.set_mtime_ns(e.path, mtime_ns)
+                        continue
+            to_write.append(item)
+
+        self._apply_all(to_write, restore_root=dest, is_v2=True, workers=workers)
+        for _src, rel_path, _size, _digest_hex in to_write:
+            mtime_ns = mtimes.get(rel_path)
+            if mtime_ns is not None:
+                self.fs.set_mtime_ns(dest / rel_path, mtime_ns)
+
+        removed = 0
+        if delete_extras:
+            keep_dirs = {rel.rpartition("/")[0] for rel in planned}
+            for d in list(keep_dirs):
+                while d:
+                    d = d.rpartition("/")[0]
+                    keep_dirs.add(d)
+
+            ignore = IgnoreMatcher(ignore_patterns)
+            extra_dirs: list[str] = []
+            for rel, e in existing.items():
+                if rel in planned or rel == _RESTORE_MANIFEST_NAME:
+                    continue
+                if include and not path_selected(rel, include):
+                    continue
+                if e.is_symlink():
+                    continue
+                is_dir = e.is_dir(follow_symlinks=False)
+                if ignore and _ignored_with_parents(ignore, rel, is_dir=is_dir):
+                    continue
+                if is_dir:
+                    if rel not in keep_dirs:
+                        extra_dirs.append(rel)
+                    continue
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                self.fs.unlink(e.path)
+                removed += 1
+
+            # Deepest first; a directory that still holds unselected files stays.
+            for rel in sorted(extra_dirs, key=lambda r: r.count("/"), reverse=True):
+                try:
+                    self.fs.rmdir(dest / rel)
+                except OSError:
+                    pass
+
+        self._write_restore_manifest(
+            destination_dir=dest,
+            snapshot_id=req.snapshot_dir.name,
+            mappings=[(rel_path, rel_path) for _src, rel_path, _size, _digest_hex in to_copy],
+        )
+        return RestoreResult(
+            files_restored=len(to_write),
+            files_unchanged=len(unchanged),
+            files_removed=removed,
+        )
+
+    def plan(
+        self,
+        snapshot_dir: Path,
+        include: tuple[str, ...] = (),
+        *,
+        require_v2: str | None = None,
+    ) -> RestorePlan:
+        """The validated, preflighted entries a restore of snapshot_dir would apply."""
+        self._validate_snapshot_dir(snapshot_dir)
+        return self._plan(snapshot_dir, normalize_selectors(include), require_v2=require_v2)
+
+    def _validate_snapshot_dir(self, snapshot_dir: Path) -> None:
+        if not self.fs.exists(snapshot_dir):
             raise SnapshotCorrupt("Snapshot directory does not exist.")
 
-        if not self.fs.is_dir(req.snapshot_dir):
+        if not self.fs.is_dir(snapshot_dir):
             raise SnapshotCorrupt("Snapshot path is not a directory.")
 
         # Safety boundary: never restore from an incomplete snapshot directory name.
-        if req.snapshot_dir.name.startswith(".incomplete-"):
+        if snapshot_dir.name.startswith(".incomplete-"):
             raise SnapshotCorrupt("Refusing to restore from an incomplete snapshot.")
 
-        manifest_path = req.snapshot_dir / "manifest.json"
+        manifest_path = snapshot_dir / "manifest.json"
         if not self.fs.exists(manifest_path):
             raise SnapshotCorrupt("Snapshot is missing manifest.json")
 
-        # --- Validate destination (do not create yet) ---
-        if self.fs.exists(req.destination_dir):
-            if not self.fs.is_dir(req.destination_dir):
-                raise RestoreRefused("Destination exists but is not a directory.")
-            if any(self.fs.iterdir(req.destination_dir)):
-                raise RestoreRefused("Destination directory must be empty.")
-
-        # --- Load + validate manifest (fail closed) ---
-        try:
-            manifest = json.loads(self.fs.read_text(manifest_path))
-        except json.JSONDecodeError:
-            raise RuntimeError(
-                f"Snapshot manifest is invalid JSON; refusing restore. Path: {manifest_path}"
-            ) from None
-
+    def _plan(
+        self,
+        snapshot_dir: Path,
+        include: tuple[str, ...],
+        *,
+        require_v2: str | None = None,
+    ) -> RestorePlan:
+        """
+        Authenticate the manifest and preflight the (selected) entries; nothing is
+        written. require_v2 is the refusal for a manifest without digests, if any.
+        """
+        manifest_path = snapshot_dir / "manifest.json"
         hmac_key = load_manifest_hmac_key(
-            vault_root=self._vault_root_for_snapshot(req.snapshot_dir)
+            vault_root=self._vault_root_for_snapshot(snapshot_dir)
         )
 
-        ok, reason = verify_manifest_integrity(manifest, hmac_key=hmac_key)
-        if not ok:
-            if reason == "missing-hmac-key":
-                raise SnapshotCorrupt("Business vault manifest HMAC key is missing; refusing restore.")
-            raise SnapshotCorrupt("Invalid manifest: integrity check failed.")
+        # --- Load + validate manifest (fail closed) ---
+        # A selection is read from the signed path index when there is one: the header and
+        # the selected entries, without reading the rest of the manifest.
+        planned = read_indexed_selection(self.fs, snapshot_dir, include, hmac_key=hmac_key) if include else None
+        if planned is not None:
+            manifest = planned
+        else:
+            try:
+                manifest_text = self.fs.read_text(manifest_path)
+                manifest = json.loads(manifest_text)
+            except json.JSONDecodeError:
+                raise RuntimeError(
+                    f"Snapshot manifest is invalid JSON; refusing restore. Path: {manifest_path}"
+                ) from None
+
+            ok, reason = verify_manifest_text_integrity(
+                manifest_text, hmac_key=hmac_key, manifest=manifest
+            )
+            if not ok:
+                if reason == "missing-hmac-key":
+                    raise SnapshotCorrupt("Business vault manifest HMAC key is missing; refusing restore.")
+                raise SnapshotCorrupt("Invalid manifest: integrity check failed.")
 
         validate_crypto_stanza(manifest)
-        self._validate_snapshot_identity(snapshot_dir=req.snapshot_dir, manifest=manifest)
+        self._validate_snapshot_identity(snapshot_dir=snapshot_dir, manifest=manifest)
 
         files = manifest.get("files")
         if not isinstance(files, list):
@@ -139,9 +464,17 @@ class RestoreEngine:
         if is_v2 and checksum_algo != "sha256":
             raise SnapshotCorrupt("Invalid manifest: unsupported checksum algorithm.")
 
+        if require_v2 is not None and not is_v2:
+            raise RestoreRefused(require_v2)
+
+        layout = storage_layout_of(manifest)
+        vault_root = self._vault_root_for_snapshot(snapshot_dir)
+
         # Preflight: validate paths + source file existence + size before touching destination.
         # For v2, also validate digest fields are present and plausible.
         to_copy: list[tuple[Path, Path, int, str | None]] = []
+        listings: dict[Path, dict[str, FsEntry] | None] | None = {} if layout == LAYOUT_TREE else None
+        mtimes: dict[Path, int] = {}
 
         for item in files:
             rel = item.get("path")
@@ -167,84 +500,126 @@ class RestoreEngine:
             if rel_path.is_absolute() or ".." in rel_path.parts:
                 raise SnapshotCorrupt("Invalid manifest entry: unsafe path.")
 
-            src = req.snapshot_dir / rel_path
+            if include and not path_selected(rel, include):
+                continue
+
+            src = snapshot_file_path(
+                snapshot_dir=snapshot_dir,
+                vault_root=vault_root,
+                layout=layout,
+                rel_path=rel_path,
+                digest_hex=digest_hex,
+            )
             dst_rel = rel_path
 
-            if not self.fs.exists(src) or not self.fs.is_file(src):
+            st = self._snapshot_file_stat(src, listings)
+            if st is None:
                 raise SnapshotCorrupt("Snapshot is corrupt: referenced file missing.")
-
-            st = self.fs.stat(src)
             if st.st_size != size:
                 raise SnapshotCorrupt("Snapshot is corrupt: file size mismatch.")
 
             to_copy.append((src, dst_rel, size, digest_hex))
+            if isinstance(item.get("mtime_ns"), int):
+                mtimes[dst_rel] = item["mtime_ns"]
+
+        if include and not to_copy:
+            raise RestoreRefused("No snapshot entries match the restore selection.")
+
+        ignore_patterns = manifest.get("ignore_patterns")
+        return RestorePlan(
+            to_copy=to_copy,
+            is_v2=is_v2,
+            mtimes=mtimes,
+            ignore_patterns=tuple(p for p in ignore_patterns if isinstance(p, str))
+            if isinstance(ignore_patterns, list)
+            else (),
+        )
 
-        # --- Apply restore (now we touch destination) ---
-        # If destination does not exist, stage into a sibling directory and only promote on success.
-        staged = False
-        stage_dir = req.destination_dir.parent / (req.destination_dir.name + ".devvault.staging")
-        restore_root = req.destination_dir
-
-        if not self.fs.exists(req.destination_dir):
-            if self.fs.exists(stage_dir):
-                raise RestoreRefused("Refusing restore: staging directory already exists.")
-            self.fs.mkdir(stage_dir, parents=True)
-            restore_root = stage_dir
-            staged = True
-
-        restored_mappings: list[tuple[Path, Path]] = []
-
-        for src, rel_path, _size, digest_hex in to_copy:
-            dst = restore_root / rel_path
-
-            parent = dst.parent
-            if not self.fs.exists(parent):
-                self.fs.mkdir(parent, parents=True)
-
-            if not is_v2:
+    def _apply_parallel(
+        self,
+        to_copy: list[tuple[Path, Path, int, str | None]],
+        *,
+        restore_root: Path,
+        is_v2: bool,
+        workers: int,
+    ) -> list[tuple[Path, Path]]:
+        pipeline = ParallelCopyPipeline(
+            workers=workers,
+            max_inflight_bytes=DEFAULT_MAX_INFLIGHT_BYTES,
+            thread_name_prefix="devvault-restore",
+        )
+        try:
+            for src, rel_path, size, digest_hex in to_copy:
                 try:
-                    self.fs.copy_file(src, dst)
-                    restored_mappings.append((rel_path, rel_path))
-                    continue
-                except Exception as e:
-                    raise RuntimeError(
-                        "Restore file apply failed: "
-                        f"src={src} | dst={dst} | rel={rel_path} | error={e}"
-                    ) from e
-
-            tmp = Path(str(dst) + ".devvault.tmp")
+                    pipeline.submit(
+                        size=size,
+                        job=partial(self._apply_file, src, rel_path, size, digest_hex, restore_root=restore_root, is_v2=is_v2),
+                    )
+                except PipelineStopped:
+                    break
+        except BaseException:
+            pipeline.abort()
+            raise
+        # Results in manifest order; the first failure in manifest order is re-raised.
+        return pipeline.finish()
+
+    def _apply_file(
+        self,
+        src: Path,
+        rel_path: Path,
+        size: int,
+        digest_hex: str | None,
+        *,
+        restore_root: Path,
+        is_v2: bool,
+    ) -> tuple[Path, Path]:
+        dst = restore_root / rel_path
 
+        if not is_v2:
             try:
-                self.fs.copy_file(src, tmp)
+                self.fs.copy_file(src, dst)
+                return (rel_path, rel_path)
             except Exception as e:
                 raise RuntimeError(
-                    "Restore temp copy failed: "
-                    f"src={src} | tmp={tmp} | dst={dst} | rel={rel_path} | error={e}"
+                    "Restore file apply failed: "
+                    f"src={src} | dst={dst} | rel={rel_path} | error={e}"
                 ) from e
 
-            try:
-                d = hash_path(self.fs, tmp, algo="sha256")
-                if d.hex != digest_hex:
-                    raise SnapshotCorrupt("Restore verification failed: checksum mismatch.")
-                self.fs.rename(tmp, dst)
-                restored_mappings.append((rel_path, rel_path))
-            except Exception as e:
-                if self.fs.exists(tmp):
-                    try:
-                        self.fs.unlink(tmp)
-                    except Exception:
-                        pass
-                raise RuntimeError(
-                    "Restore finalize failed: "
-                    f"src={src} | tmp={tmp} | dst={dst} | rel={rel_path} | error={e}"
-                ) from e
+        # A sync restore writes into a destination that may hold anything, so the temp
+        # name is unique and created exclusively: an entry already there (say, a planted
+        # symlink) is refused, never followed or overwritten.
+        tmp = dst.parent / f"{dst.name}.{uuid4().hex[:16]}.devvault.tmp"
 
-        # Promote staged restore only after all files verified.
-        if staged:
-            self.fs.rename(stage_dir, req.destination_dir)
+        # The digest is computed from the bytes as they are written to tmp, so the
+        # staged copy is verified without reading it back.
+        try:
+            hc = self.fs.copy_file_hashed(src, tmp, algo="sha256", exclusive=True)
+        except Exception as e:
+            if not isinstance(e, FileExistsError):
+                self._discard_tmp(tmp)
+            raise RuntimeError(
+                "Restore temp copy failed: "
+                f"src={src} | tmp={tmp} | dst={dst} | rel={rel_path} | error={e}"
+            ) from e
 
-        self._write_restore_manifest(
-            destination_dir=req.destination_dir,
-            snapshot_id=req.snapshot_dir.name,
-            mappings=restored_mappings,
-        )
+        try:
+            if hc.size != size:
+                raise SnapshotCorrupt("Restore verification failed: file size mismatch.")
+            if hc.digest.hex != digest_hex:
+                raise SnapshotCorrupt("Restore verification failed: checksum mismatch.")
+            self.fs.rename(tmp, dst)
+            return (rel_path, rel_path)
+        except Exception as e:
+            self._discard_tmp(tmp)
+            raise RuntimeError(
+                "Restore finalize failed: "
+                f"src={src} | tmp={tmp} | dst={dst} | rel={rel_path} | error={e}"
+            ) from e
+
+    def _discard_tmp(self, tmp: Path) -> None:
+        """Remove a temp file this restore created (a regular file only)."""
+        try:
+            if self.fs.entry(tmp).is_file(follow_symlinks=False):
+                self.fs.unlink(tmp)
+        except Exception:
+            pass
@@ -0,0 +1,75 @@
+"""
+Selectors for partial restores: which snapshot paths a restore applies.
+
+A selector is a snapshot-relative POSIX path or a glob:
+
+- a plain path selects that file, or everything below it when it is a directory;
+- a glob (*, ?, [...]) selects every path it matches, and everything below a
+  matching directory. As in the catalog search, * also matches "/".
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from pathlib import PurePosixPath
+from typing import Iterable
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def is_glob(selector: str) -> bool:
+    return any(c in _GLOB_CHARS for c in selector)
+
+
+def normalize_selectors(selectors: Iterable[str]) -> tuple[str, ...]:
+    """Canonical form of restore selectors; fails closed on unsafe ones."""
+    out: list[str] = []
+    for raw in selectors:
+        s = str(raw).replace("\\", "/").strip()
+        while s.startswith("./"):
+            s = s[2:]
+        s = s.rstrip("/")
+        parts = PurePosixPath(s).parts if s else ()
+        if not s or s.startswith("/") or ".." in parts:
+            raise RuntimeError(f"Unsupported restore selector: {raw!r}")
+        if s not in out:
+            out.append(s)
+    return tuple(out)
+
+
+def selection_roots(selectors: Iterable[str]) -> list[str]:
+    """
+    Smallest set of subtrees ("" = whole snapshot) that contains every match.
+
+    Each selector contributes its leading glob-free components; roots below
+    another root are dropped.
+    """
+    roots: set[str] = set()
+    for s in selectors:
+        literal: list[str] = []
+        for part in s.split("/"):
+            if is_glob(part):
+                break
+            literal.append(part)
+        roots.add("/".join(literal))
+
+    kept: list[str] = []
+    for r in sorted(roots):
+        if any(k == "" or r.startswith(k + "/") for k in kept):
+            continue
+        kept.append(r)
+    return kept
+
+
+def path_selected(rel_path: str, selectors: Iterable[str]) -> bool:
+    for s in selectors:
+        if is_glob(s):
+            # The path itself, or one of its parent directories, matches.
+            candidate = rel_path
+            while candidate:
+                if fnmatchcase(candidate, s):
+                    return True
+                candidate = candidate.rpartition("/")[0]
+        elif rel_path == s or rel_path.startswith(s + "/"):
+            return True
+    return False
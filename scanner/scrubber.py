@@ -0,0 +1,211 @@
+"""
+Background vault scrubber.
+
+Each run re-verifies the stored files that are due - never verified, failed, or last
+verified a scrub cycle (e.g. 30 days) ago or longer - least-recently-verified first,
+under an optional I/O rate limit and byte/time budgets, and records every outcome in
+the verification ledger as it goes. A stored file shared by several snapshots is read
+once for all of them. A run that is stopped (budget, cancel, crash) loses at most the
+last unflushed batch; the next run resumes with whatever is now least recent. Run it
+periodically to keep every file's last verification within the scrub cycle.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from scanner.errors import SnapshotCorrupt
+from scanner.ports.filesystem import FileSystemPort
+from scanner.snapshot_listing import list_snapshots
+from scanner.verify_engine import VerifyEngine, VerifyTarget
+from scanner.verify_ledger import STATUS_FAILED, STATUS_OK, LedgerRecord, VerifyLedger
+
+DEFAULT_CYCLE_SECONDS = 30 * 24 * 3600
+
+# Ledger writes are batched; a crash loses at most this much progress.
+_FLUSH_FILES = 256
+_FLUSH_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class ScrubFailure:
+    snapshot_id: str
+    path: str  # "" for snapshot-level failures (manifest/identity)
+    reason: str
+
+
+@dataclass(frozen=True)
+class ScrubReport:
+    # Stored files read in this run (each once, however many snapshots reference it):
+    files_verified: int
+    bytes_verified: int
+    failures: tuple[ScrubFailure, ...]
+    # Vault-wide state after this run, counted per snapshot file (all current snapshots):
+    files_total: int
+    files_never_verified: int
+    files_overdue: int  # never verified, or last verified a cycle ago or longer
+    files_failed: int  # whose latest recorded verification failed
+    oldest_verified_at: float | None  # unix time of the least recent verification
+    # True when a budget or cancel stopped the run before every due file was visited.
+    stopped_early: bool
+
+
+@dataclass
+class _Candidate:
+    """One stored file and every snapshot file it backs."""
+    key: tuple[str, str]  # ledger (digest_hex, copy_id)
+    target: VerifyTarget  # as first referenced, in snapshot order
+    refs: list[tuple[str, str]]  # (snapshot_id, path)
+    last: LedgerRecord | None
+
+    @property
+    def last_verified_at(self) -> float | None:
+        return self.last.verified_at if self.last is not None else None
+
+
+class VaultScrubber:
+    def __init__(
+        self,
+        fs: FileSystemPort,
+        *,
+        clock: Callable[[], float] = time.time,
+        monotonic: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.fs = fs
+        self._verify = VerifyEngine(fs)
+        self._clock = clock
+        self._monotonic = monotonic
+        self._sleep = sleep
+
+    def scrub(
+        self,
+        backup_root: Path,
+        *,
+        rate_bytes_per_second: int = 0,
+        max_bytes: int = 0,
+        max_seconds: float = 0.0,
+        cycle_seconds: float = DEFAULT_CYCLE_SECONDS,
+        cancel_check=None,
+    ) -> ScrubReport:
+        """
+        One scrub run over the vault at backup_root (0 = no rate limit / no budget).
+
+        Every snapshot's manifest is authenticated on each run; failures of files and
+        snapshots are reported and recorded, never raised.
+        """
+        failures: list[ScrubFailure] = []
+        groups: dict[tuple[str, str], _Candidate] = {}
+
+        with VerifyLedger.open(backup_root) as ledger:
+            known = ledger.records()
+            for ref in list_snapshots(fs=self.fs, backup_root=backup_root):
+                try:
+                    targets = self._verify.targets(ref.snapshot_dir)
+                except (SnapshotCorrupt, RuntimeError, OSError) as e:
+                    failures.append(ScrubFailure(snapshot_id=ref.snapshot_id, path="", reason=str(e)))
+                    continue
+                for t in targets:
+                    key = (t.digest_hex or "", self._copy_id(t, backup_root=backup_root))
+                    c = groups.get(key)
+                    if c is None:
+                        c = groups[key] = _Candidate(key=key, target=t, refs=[], last=known.get(key))
+                    c.refs.append((ref.snapshot_id, t.rel_path))
+            candidates = list(groups.values())
+            ledger.prune(groups)
+
+            # Content verified within the cycle (and not failed) is not read again.
+            run_at = self._clock()
+            due = [
+                c
+                for c in candidates
+                if c.last is None or c.last.status == STATUS_FAILED or run_at - c.last.verified_at >= cycle_seconds
+            ]
+            # Least recently verified first; never-verified before everything else.
+            due.sort(key=lambda c: (c.last_verified_at is not None, c.last_verified_at or 0.0, c.refs[0]))
+
+            verified = 0
+            verified_bytes = 0
+            stopped = False
+            pending: list[LedgerRecord] = []
+            started = self._monotonic()
+            last_flush = started
+
+            try:
+                for c in due:
+                    if cancel_check is not None and bool(cancel_check()):
+                        stopped = True
+                        break
+                    if verified and (
+                        (max_bytes and verified_bytes + c.target.size > max_bytes)
+                        or (max_seconds and self._monotonic() - started >= max_seconds)
+                    ):
+                        stopped = True
+                        break
+
+                    status, reason = STATUS_OK, None
+                    try:
+                        self._verify.verify_target(c.target)
+                    except (SnapshotCorrupt, OSError) as e:
+                        status, reason = STATUS_FAILED, str(e)
+                        failures.extend(
+                            ScrubFailure(snapshot_id=sid, path=path, reason=reason) for sid, path in c.refs
+                        )
+
+                    c.last = LedgerRecord(
+                        digest_hex=c.key[0],
+                        copy_id=c.key[1],
+                        size=c.target.size,
+                        verified_at=self._clock(),
+                        status=status,
+                        reason=reason,
+                    )
+                    pending.append(c.last)
+                    verified += 1
+                    verified_bytes += c.target.size
+
+                    now = self._monotonic()
+                    if len(pending) >= _FLUSH_FILES or now - last_flush >= _FLUSH_SECONDS:
+                        ledger.record(pending)
+                        pending = []
+                        last_flush = now
+
+                    if rate_bytes_per_second > 0:
+                        # Hold the average read rate at or below the limit.
+                        ahead = verified_bytes / rate_bytes_per_second - (now - started)
+                        if ahead > 0:
+                            self._sleep(ahead)
+            finally:
+                if pending:
+                    ledger.record(pending)
+
+        now = self._clock()
+        stamps = [s for c in candidates for s in [c.last_verified_at] * len(c.refs)]
+        seen = [s for s in stamps if s is not None]
+        return ScrubReport(
+            files_verified=verified,
+            bytes_verified=verified_bytes,
+            failures=tuple(failures),
+            files_total=len(stamps),
+            files_never_verified=len(stamps) - len(seen),
+            files_overdue=sum(1 for s in stamps if s is None or now - s >= cycle_seconds),
+            files_failed=sum(len(c.refs) for c in candidates if c.last is not None and c.last.status == STATUS_FAILED),
+            oldest_verified_at=min(seen) if seen else None,
+            stopped_early=stopped,
+        )
+
+    def _copy_id(self, target: VerifyTarget, *, backup_root: Path) -> str:
+        """Which stored file holds the target: its file id, else its vault-relative path."""
+        try:
+            ino = int(getattr(self.fs.stat(target.src), "st_ino", 0) or 0)
+        except OSError:
+            ino = 0
+        if ino:
+            return f"ino:{ino}"
+        try:
+            return target.src.relative_to(backup_root).as_posix()
+        except ValueError:
+            return target.src.as_posix()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
 from scanner.ports.filesystem import FileSystemPort
-from scanner.snapshot_listing import list_snapshots
-from scanner.snapshot_metadata import read_snapshot_metadata
+from scanner.integrity_keys import ManifestHmacKey, load_manifest_hmac_key
+from scanner.snapshot_listing import list_snapshots, snapshot_storage_root
+from scanner.snapshot_metadata import SnapshotMetadata, read_snapshot_metadata
 
 
 INDEX_DIR_NAME = ".devvault"
@@ -21,12 +23,60 @@ class SnapshotIndex:
     generated_at: datetime
     backup_root: Path
     snapshots: list[dict[str, object]]
+    # Digest of the snapshot directory names the rows account for (see _generation_of).
+    # None for indexes written before generations existed: they are rebuilt on next update.
+    generation: str | None = None
 
 
 def index_path_for_backup_root(backup_root: Path) -> Path:
     return backup_root / INDEX_DIR_NAME / INDEX_FILE_NAME
 
 
+def _snapshot_dir_names(*, fs: FileSystemPort, backup_root: Path) -> set[str]:
+    """Names of candidate snapshot directories, from one listing (no per-snapshot reads)."""
+    root = snapshot_storage_root(backup_root)
+    if not fs.exists(root) or not fs.is_dir(root):
+        root = backup_root
+        if not fs.exists(root) or not fs.is_dir(root):
+            return set()
+    return {
+        entry.name
+        for entry in fs.iterdir(root)
+        if not entry.name.startswith(".incomplete-") and fs.is_dir(entry)
+    }
+
+
+def _generation_of(names: set[str]) -> str:
+    h = hashlib.sha256()
+    for name in sorted(names):
+        h.update(name.encode("utf-8", "surrogateescape"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _vault_hmac_key(backup_root: Path) -> ManifestHmacKey | None:
+    # Loaded once per index operation instead of once per snapshot summary.
+    try:
+        return load_manifest_hmac_key(vault_root=backup_root)
+    except Exception:
+        return None
+
+
+def _row_for_metadata(md: SnapshotMetadata) -> dict[str, object]:
+    return {
+        "snapshot_id": md.snapshot_id,
+        "created_at": md.created_at.isoformat() if md.created_at else None,
+        "manifest_version": md.manifest_version,
+        "checksum_algo": md.checksum_algo,
+        "file_count": md.file_count,
+        "total_bytes": md.total_bytes,
+        "source_root": md.source_root,
+        "seat_id": (getattr(md, "business_identity", {}) or {}).get("seat_id"),
+        "device_id": (getattr(md, "business_identity", {}) or {}).get("device_id"),
+        "hostname": (getattr(md, "business_identity", {}) or {}).get("hostname"),
+    }
+
+
 def rebuild_snapshot_index(*, fs: FileSystemPort, backup_root: Path) -> SnapshotIndex:
     """Rebuild snapshot index from manifests (read-only, vault-bounded).
 
@@ -34,36 +84,73 @@ def rebuild_snapshot_index(*, fs: FileSystemPort, backup_root: Path) -> Snapshot
     This keeps the index usable even if a snapshot is corrupt.
     """
 
+    # Taken BEFORE the rows are read: a snapshot that appears in between is then missing
+    # from the generation too, and the next update rebuilds instead of trusting this index.
+    generation = _generation_of(_snapshot_dir_names(fs=fs, backup_root=backup_root))
+
+    hmac_key = _vault_hmac_key(backup_root)
     snaps_out: list[dict[str, object]] = []
 
     for s in list_snapshots(fs=fs, backup_root=backup_root):
         try:
-            md = read_snapshot_metadata(fs=fs, snapshot_dir=s.snapshot_dir)
+            md = read_snapshot_metadata(fs=fs, snapshot_dir=s.snapshot_dir, hmac_key=hmac_key)
         except Exception:
             continue
 
-        snaps_out.append(
-            {
-                "snapshot_id": md.snapshot_id,
-                "created_at": md.created_at.isoformat() if md.created_at else None,
-                "manifest_version": md.manifest_version,
-                "checksum_algo": md.checksum_algo,
-                "file_count": md.file_count,
-                "total_bytes": md.total_bytes,
-                "seat_id": (getattr(md, "business_identity", {}) or {}).get("seat_id"),
-                "device_id": (getattr(md, "business_identity", {}) or {}).get("device_id"),
-                "hostname": (getattr(md, "business_identity", {}) or {}).get("hostname"),
-            }
-        )
+        snaps_out.append(_row_for_metadata(md))
 
     return SnapshotIndex(
         index_version=INDEX_VERSION,
         generated_at=datetime.now(timezone.utc),
         backup_root=backup_root,
         snapshots=snaps_out,
+        generation=generation,
     )
 
 
+def upsert_snapshot_index(*, fs: FileSystemPort, backup_root: Path, snapshot_dir: Path) -> SnapshotIndex:
+    """Insert/replace one snapshot's row and persist the index atomically.
+
+    Consistency check: the stored generation must equal the generation of the
+    current snapshot directory listing minus `snapshot_dir`, i.e. the new snapshot
+    must be the only change since the index was written. Otherwise (or when the
+    index is missing/old/unreadable) this falls back to a full rebuild.
+
+    Cost on the fast path: one directory listing and one manifest read.
+    """
+    existing = load_snapshot_index(fs=fs, backup_root=backup_root)
+    names = _snapshot_dir_names(fs=fs, backup_root=backup_root)
+    new_id = snapshot_dir.name
+
+    if (
+        existing is None
+        or existing.generation is None
+        or new_id not in names
+        or existing.generation != _generation_of(names - {new_id})
+    ):
+        return repair_snapshot_index(fs=fs, backup_root=backup_root)
+
+    rows = [r for r in existing.snapshots if not (isinstance(r, dict) and r.get("snapshot_id") == new_id)]
+    try:
+        md = read_snapshot_metadata(fs=fs, snapshot_dir=snapshot_dir, hmac_key=_vault_hmac_key(backup_root))
+    except Exception:
+        # Same policy as rebuild: malformed snapshots get no row.
+        md = None
+    if md is not None:
+        rows.append(_row_for_metadata(md))
+    rows.sort(key=lambda r: str(r.get("snapshot_id") or "") if isinstance(r, dict) else "", reverse=True)
+
+    idx = SnapshotIndex(
+        index_version=INDEX_VERSION,
+        generated_at=datetime.now(timezone.utc),
+        backup_root=backup_root,
+        snapshots=rows,
+        generation=_generation_of(names),
+    )
+    write_snapshot_index(fs=fs, index=idx)
+    return idx
+
+
 def write_snapshot_index(*, fs: FileSystemPort, index: SnapshotIndex) -> Path:
     """Write snapshot index atomically.
 
@@ -85,6 +172,8 @@ def write_snapshot_index(*, fs: FileSystemPort, index: SnapshotIndex) -> Path:
         "generated_at": index.generated_at.isoformat(),
         "snapshots": index.snapshots,
     }
+    if index.generation is not None:
+        payload["generation"] = index.generation
 
     fs.write_text(tmp_path, json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
     fs.rename(tmp_path, final_path)
@@ -140,9 +229,14 @@ def load_snapshot_index(*, fs: FileSystemPort, backup_root: Path) -> SnapshotInd
     if not isinstance(snaps, list):
         return None
 
+    generation = raw.get("generation")
+    if not isinstance(generation, str):
+        generation = None
+
     return SnapshotIndex(
         index_version=INDEX_VERSION,
         generated_at=generated_at,
         backup_root=backup_root,
         snapshots=snaps,
+        generation=generation,
     )
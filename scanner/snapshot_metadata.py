@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from scanner.errors import SnapshotCorrupt
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from scanner.integrity_keys import ManifestHmacKey
+from scanner.manifest_cache import MANIFEST_CACHE
+from scanner.path_index import open_path_index
 from scanner.ports.filesystem import FileSystemPort
+from scanner.snapshot_summary import read_snapshot_summary
 
 
 @dataclass(frozen=True)
@@ -39,7 +42,12 @@ def _parse_created_at_from_snapshot_id(snapshot_id: str) -> datetime | None:
         return None
 
 
-def read_snapshot_metadata(*, fs: FileSystemPort, snapshot_dir: Path) -> SnapshotMetadata:
+def read_snapshot_metadata(
+    *,
+    fs: FileSystemPort,
+    snapshot_dir: Path,
+    hmac_key: ManifestHmacKey | None = None,
+) -> SnapshotMetadata:
     """Read minimal snapshot metadata from manifest.json (fail-closed).
 
     Contract:
@@ -48,16 +56,50 @@ def read_snapshot_metadata(*, fs: FileSystemPort, snapshot_dir: Path) -> Snapsho
       - file entries must include size (int >= 0)
 
     This is intentionally lightweight (no file hashing, no directory traversal).
+    A verified summary.json sidecar is preferred, then the header signed into the
+    path index (manifest.idx), so the file list is not parsed; otherwise results are
+    memoized in the process-wide manifest cache until manifest.json changes.
     """
 
-    snapshot_id = snapshot_dir.name
-    created_at = _parse_created_at_from_snapshot_id(snapshot_id)
-
     manifest_path = snapshot_dir / "manifest.json"
     if not fs.exists(manifest_path) or not fs.is_file(manifest_path):
         raise SnapshotCorrupt("Snapshot is missing manifest.json")
 
-    manifest = json.loads(fs.read_text(manifest_path))
+    summary = read_snapshot_summary(fs, snapshot_dir, hmac_key=hmac_key)
+    if summary is not None:
+        try:
+            return _metadata_from_header(
+                snapshot_id=snapshot_dir.name,
+                header=summary,
+                file_count=summary.get("file_count"),
+                total_bytes=summary.get("total_bytes"),
+            )
+        except SnapshotCorrupt:
+            pass  # The manifest decides.
+
+    index = open_path_index(fs, snapshot_dir, hmac_key=hmac_key)
+    if index is not None:
+        try:
+            return _metadata_from_header(
+                snapshot_id=snapshot_dir.name,
+                header=index.header,
+                file_count=len(index),
+                total_bytes=index.total_bytes,
+            )
+        except SnapshotCorrupt:
+            pass  # The manifest decides.
+
+    return MANIFEST_CACHE.derive(
+        fs,
+        manifest_path,
+        "snapshot_metadata",
+        lambda manifest: _metadata_from_manifest(snapshot_id=snapshot_dir.name, manifest=manifest),
+    )
+
+
+def _metadata_from_manifest(*, snapshot_id: str, manifest: dict) -> SnapshotMetadata:
+    if not isinstance(manifest, dict):
+        raise SnapshotCorrupt("Invalid manifest: expected a JSON object")
 
     mv = manifest.get("manifest_version")
     if not isinstance(mv, int):
@@ -79,30 +121,45 @@ def read_snapshot_metadata(*, fs: FileSystemPort, snapshot_dir: Path) -> Snapsho
         total += size
         count += 1
 
+    return _metadata_from_header(snapshot_id=snapshot_id, header=manifest, file_count=count, total_bytes=total)
+
+
+def _metadata_from_header(*, snapshot_id: str, header: dict, file_count: object, total_bytes: object) -> SnapshotMetadata:
+    created_at = _parse_created_at_from_snapshot_id(snapshot_id)
+
+    mv = header.get("manifest_version")
+    if not isinstance(mv, int):
+        raise SnapshotCorrupt("Invalid manifest: missing/invalid manifest_version")
+
+    if not isinstance(file_count, int) or file_count < 0:
+        raise SnapshotCorrupt("Invalid manifest: file count must be a non-negative integer")
+    if not isinstance(total_bytes, int) or total_bytes < 0:
+        raise SnapshotCorrupt("Invalid manifest: total size must be a non-negative integer")
+
     checksum_algo: str | None = None
     if mv == 2:
-        ca = manifest.get("checksum_algo")
+        ca = header.get("checksum_algo")
         if ca is not None and not isinstance(ca, str):
             raise SnapshotCorrupt("Invalid manifest: checksum_algo must be a string")
         checksum_algo = ca
 
-    backup_id = manifest.get("backup_id")
+    backup_id = header.get("backup_id")
     if backup_id is not None and not isinstance(backup_id, str):
         raise SnapshotCorrupt("Invalid manifest: backup_id must be a string")
 
-    source_root = manifest.get("source_root")
+    source_root = header.get("source_root")
     if source_root is not None and not isinstance(source_root, str):
         raise SnapshotCorrupt("Invalid manifest: source_root must be a string")
 
-    source_name = manifest.get("source_name")
+    source_name = header.get("source_name")
     if source_name is not None and not isinstance(source_name, str):
         raise SnapshotCorrupt("Invalid manifest: source_name must be a string")
 
-    display_name = manifest.get("display_name")
+    display_name = header.get("display_name")
     if display_name is not None and not isinstance(display_name, str):
         raise SnapshotCorrupt("Invalid manifest: display_name must be a string")
 
-    business_identity_raw = manifest.get("business_identity")
+    business_identity_raw = header.get("business_identity")
     business_identity: dict[str, str] | None = None
     if business_identity_raw is not None:
         if not isinstance(business_identity_raw, dict):
@@ -121,8 +178,8 @@ def read_snapshot_metadata(*, fs: FileSystemPort, snapshot_dir: Path) -> Snapsho
         created_at=created_at,
         manifest_version=mv,
         checksum_algo=checksum_algo,
-        file_count=count,
-        total_bytes=total,
+        file_count=file_count,
+        total_bytes=total_bytes,
         backup_id=backup_id,
         source_root=source_root,
         source_name=source_name,
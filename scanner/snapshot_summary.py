@@ -0,0 +1,110 @@
+"""
+Per-snapshot summary sidecar (summary.json) written next to manifest.json.
+
+It carries what listings need (counts, bytes, source and identity fields) so that
+metadata readers do not parse the full file list. Like manifest.idx it is a signed
+derivative of the manifest: the summary is sealed with the vault manifest key and
+names the manifest digest it was computed from, so it is ignored as soon as it does
+not belong to the manifest next to it. manifest.json stays authoritative.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from scanner.integrity_keys import ManifestHmacKey, load_manifest_hmac_key
+from scanner.manifest_integrity import add_integrity_block, verify_manifest_integrity
+from scanner.manifest_stream import read_manifest_integrity_tail
+from scanner.ports.filesystem import FileSystemPort
+
+
+SUMMARY_NAME = "summary.json"
+SUMMARY_VERSION = 1
+
+# Manifest header fields copied verbatim into the summary.
+SUMMARY_HEADER_KEYS = (
+    "manifest_version",
+    "checksum_algo",
+    "backup_id",
+    "source_root",
+    "source_name",
+    "display_name",
+    "business_identity",
+)
+
+
+def write_snapshot_summary(
+    fs: FileSystemPort,
+    path: Path,
+    *,
+    header: Dict[str, Any],
+    file_count: int,
+    total_bytes: int,
+    manifest_digest_hex: str,
+    hmac_key: ManifestHmacKey | None,
+) -> None:
+    payload: Dict[str, Any] = {k: header[k] for k in SUMMARY_HEADER_KEYS if k in header}
+    payload["summary_version"] = SUMMARY_VERSION
+    payload["file_count"] = int(file_count)
+    payload["total_bytes"] = int(total_bytes)
+    payload["manifest_digest_hex"] = manifest_digest_hex
+
+    sealed = add_integrity_block(payload, hmac_key=hmac_key)
+    fs.write_text(path, json.dumps(sealed, indent=2, sort_keys=True))
+
+
+def _vault_root_for_snapshot(snapshot_dir: Path) -> Path:
+    # <vault>/.devvault/snapshots/<id>; legacy snapshots sit directly under the vault.
+    parent = snapshot_dir.parent
+    if parent.name == "snapshots" and parent.parent.name == ".devvault":
+        return parent.parent.parent
+    return parent
+
+
+def read_snapshot_summary(
+    fs: FileSystemPort,
+    snapshot_dir: Path,
+    *,
+    hmac_key: ManifestHmacKey | None = None,
+) -> Dict[str, Any] | None:
+    """
+    The verified summary of a snapshot, or None when it cannot be trusted.
+
+    None covers: no sidecar, unreadable/unknown version, bad seal, or a summary
+    computed from a different manifest. Callers then read manifest.json instead.
+    The vault key is looked up from the snapshot location when not given.
+    """
+    path = snapshot_dir / SUMMARY_NAME
+    try:
+        if not fs.exists(path):
+            return None
+        summary = json.loads(fs.read_text(path))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(summary, dict) or summary.get("summary_version") != SUMMARY_VERSION:
+        return None
+
+    if hmac_key is None:
+        try:
+            hmac_key = load_manifest_hmac_key(vault_root=_vault_root_for_snapshot(snapshot_dir))
+        except Exception:
+            hmac_key = None
+
+    integrity = summary.get("manifest_integrity")
+    if not isinstance(integrity, dict):
+        return None
+    if hmac_key is not None and integrity.get("algo") != "hmac-sha256":
+        # A keyed vault only writes keyed summaries; an unkeyed one is not ours.
+        return None
+    ok, _reason = verify_manifest_integrity(summary, hmac_key=hmac_key)
+    if not ok:
+        return None
+
+    manifest_integrity = read_manifest_integrity_tail(fs, snapshot_dir / "manifest.json")
+    if manifest_integrity is None or manifest_integrity["digest_hex"] != summary.get("manifest_digest_hex"):
+        return None
+
+    return summary
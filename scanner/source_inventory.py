@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from scanner.ignore_rules import IgnoreMatcher
+from scanner.models.backup import InventoryEntry, SourceInventory
+from scanner.ports.filesystem import FileSystemPort, FsEntry
+
+SAMPLE_CAP = 25
+
+
+def build_source_inventory(
+    *,
+    fs: FileSystemPort,
+    source_root: Path,
+    strict: bool = True,
+    probe_reads: bool = False,
+    ignore: IgnoreMatcher | None = None,
+    cancel_check=None,
+) -> SourceInventory:
+    """Walk a backup source once and record every file/dir with its stat data.
+
+    Policy (shared by preflight and backup):
+      - symlinks are skipped and counted, never followed
+      - special nodes (fifos, devices, sockets) are ignored silently
+      - paths matched by `ignore` are excluded; ignored directories are pruned
+        before they are listed, so nothing beneath them is visited
+
+    strict=True (backup): any listing/stat failure raises, so a backup never
+    silently omits part of the tree.
+    strict=False (preflight): failures are classified and counted instead.
+    probe_reads=True additionally opens each file and reads 1 byte to surface
+    locked/in-use files early (Windows sharing violations).
+    """
+    root = source_root.expanduser().resolve()
+    root_entry = fs.entry(root)
+    if strict:
+        # Fail closed on a missing/unreadable root instead of producing an empty snapshot.
+        root_entry.stat(follow_symlinks=False)
+    base = root.parent if root_entry.is_file(follow_symlinks=False) else root
+
+    entries: list[InventoryEntry] = []
+    counts = {"skipped_symlinks": 0, "ignored": 0, "perm": 0, "locked": 0, "not_found": 0, "other": 0}
+    samples: list[str] = []
+
+    def record_unreadable(path: Path, exc: BaseException) -> None:
+        if strict:
+            raise exc
+        # PermissionError on Windows can indicate both ACL denial and sharing violations.
+        if isinstance(exc, PermissionError):
+            winerr = getattr(exc, "winerror", None)
+            # Windows sharing violation / lock is commonly 32 or 33.
+            if winerr in (32, 33):
+                counts["locked"] += 1
+            else:
+                counts["perm"] += 1
+        elif isinstance(exc, FileNotFoundError):
+            counts["not_found"] += 1
+        else:
+            counts["other"] += 1
+
+        if len(samples) < SAMPLE_CAP:
+            try:
+                samples.append(str(path))
+            except Exception:
+                samples.append("<unprintable-path>")
+
+    def check_cancel() -> None:
+        if cancel_check is not None and bool(cancel_check()):
+            raise RuntimeError("Cancelled by operator.")
+
+    def visit(node: FsEntry, rel: Path | None) -> None:
+        check_cancel()
+
+        try:
+            if node.is_symlink():
+                counts["skipped_symlinks"] += 1
+                return
+        except Exception as e:
+            record_unreadable(node.path, e)
+            return
+
+        try:
+            is_dir = node.is_dir(follow_symlinks=False)
+            if is_dir:
+                children = fs.scandir(node.path)
+        except Exception as e:
+            record_unreadable(node.path, e)
+            return
+
+        if is_dir:
+            if rel is not None:
+                entries.append(InventoryEntry(rel_path=rel, kind="dir"))
+            for child in children:
+                crel = child_rel(rel, child.name)
+                if ignore and is_ignored(child, crel):
+                    counts["ignored"] += 1
+                    continue
+                visit(child, crel)
+            return
+
+        try:
+            if not node.is_file(follow_symlinks=False):
+                # Special nodes: ignore silently (consistent with backup)
+                return
+            st = node.stat(follow_symlinks=False)
+        except Exception as e:
+            record_unreadable(node.path, e)
+            return
+
+        entries.append(
+            InventoryEntry(
+                rel_path=rel if rel is not None else Path(node.name),
+                kind="file",
+                size=int(st.st_size),
+                mtime_ns=int(getattr(st, "st_mtime_ns", 0) or 0),
+                inode=int(getattr(st, "st_ino", 0) or 0),
+            )
+        )
+
+        if probe_reads:
+            try:
+                with node.path.open("rb") as f:
+                    f.read(1)
+            except Exception as e:
+                record_unreadable(node.path, e)
+
+    def child_rel(rel: Path | None, name: str) -> Path:
+        return Path(name) if rel is None else rel / name
+
+    def is_ignored(child: FsEntry, crel: Path) -> bool:
+        try:
+            child_is_dir = child.is_dir(follow_symlinks=False)
+        except OSError:
+            # Let visit() classify the failure.
+            return False
+        return ignore.is_ignored(crel.as_posix(), is_dir=child_is_dir)
+
+    visit(root_entry, None)
+
+    return SourceInventory(
+        source_root=root,
+        base=base,
+        entries=tuple(entries),
+        skipped_symlinks=counts["skipped_symlinks"],
+        unreadable_permission_denied=counts["perm"],
+        unreadable_locked_or_in_use=counts["locked"],
+        unreadable_not_found=counts["not_found"],
+        unreadable_other_io=counts["other"],
+        unreadable_samples=tuple(samples),
+        ignore_patterns=ignore.patterns if ignore else (),
+        ignored_count=counts["ignored"],
+    )
@@ -0,0 +1,298 @@
+"""
+Optional SQLite catalog of every file in every snapshot (.devvault/catalog.sqlite).
+
+snapshot_index.json holds one row per snapshot; the catalog adds one row per
+(snapshot, path) with size and digest, indexed by path and by digest, so questions
+like "which snapshots contain src/app.py and when did it change?" are indexed
+queries instead of a parse of every manifest.
+
+The catalog is a cache derived from verified manifests, never an authority:
+- it is only created on request (BackupRequest.update_catalog / `devvault catalog sync`)
+  and, once present, kept current by every backup;
+- each snapshot row records the manifest digest it was built from, and
+  sync_catalog() re-imports rows whose manifest changed and drops vanished snapshots.
+
+The default rollback journal is used (not WAL): vaults often live on network shares.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from scanner.errors import SnapshotCorrupt
+from scanner.integrity_keys import ManifestHmacKey, load_manifest_hmac_key
+from scanner.manifest_stream import read_manifest_integrity_tail, verify_manifest_text_integrity
+from scanner.ports.filesystem import FileSystemPort
+from scanner.snapshot_listing import INTERNAL_DIR_NAME, list_snapshots
+
+
+CATALOG_FILE_NAME = "catalog.sqlite"
+CATALOG_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    snapshot_id TEXT NOT NULL UNIQUE,
+    source_root TEXT,
+    manifest_digest_hex TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paths (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS files (
+    snapshot INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    path INTEGER NOT NULL REFERENCES paths(id),
+    size INTEGER NOT NULL,
+    digest_hex TEXT NOT NULL,
+    PRIMARY KEY (snapshot, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS files_by_path ON files(path, snapshot);
+CREATE INDEX IF NOT EXISTS files_by_digest ON files(digest_hex);
+"""
+
+
+def catalog_path_for_backup_root(backup_root: Path) -> Path:
+    return backup_root / INTERNAL_DIR_NAME / CATALOG_FILE_NAME
+
+
+@dataclass(frozen=True)
+class CatalogFile:
+    snapshot_id: str
+    path: str
+    size: int
+    digest_hex: str
+
+
+@dataclass(frozen=True)
+class CatalogDiff:
+    added: list[CatalogFile]
+    removed: list[CatalogFile]
+    changed: list[tuple[CatalogFile, CatalogFile]]
+
+
+@dataclass(frozen=True)
+class CatalogSyncResult:
+    added: int
+    removed: int
+    unchanged: int
+    skipped: int
+
+
+class VaultCatalog:
+    """A connection to one vault's catalog. Use as a context manager."""
+
+    def __init__(self, path: Path, *, create: bool = False):
+        if not create and not path.exists():
+            raise FileNotFoundError(str(path))
+        if create:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(str(path), timeout=30.0)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, CATALOG_SCHEMA_VERSION):
+            self._db.close()
+            raise RuntimeError(f"Unsupported catalog schema version: {version}")
+        with self._db:
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @classmethod
+    def open(cls, backup_root: Path, *, create: bool = False) -> "VaultCatalog | None":
+        """The vault's catalog, or None when it does not exist and create is False."""
+        path = catalog_path_for_backup_root(backup_root)
+        if not create and not path.exists():
+            return None
+        return cls(path, create=create)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "VaultCatalog":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ---------------------------------------------------------------- maintenance
+
+    def snapshot_digests(self) -> dict[str, str]:
+        """snapshot_id -> manifest digest the rows were built from."""
+        return dict(self._db.execute("SELECT snapshot_id, manifest_digest_hex FROM snapshots"))
+
+    def add_snapshot(
+        self,
+        *,
+        snapshot_id: str,
+        source_root: str | None,
+        manifest_digest_hex: str,
+        files: Iterable[dict],
+    ) -> None:
+        """Insert (or replace) a snapshot and its file rows in one transaction."""
+        with self._db:
+            self._db.execute("DELETE FROM snapshots WHERE snapshot_id = ?", (snapshot_id,))
+            cur = self._db.execute(
+                "INSERT INTO snapshots (snapshot_id, source_root, manifest_digest_hex, file_count, total_bytes)"
+                " VALUES (?, ?, ?, 0, 0)",
+                (snapshot_id, source_root, manifest_digest_hex),
+            )
+            sid = cur.lastrowid
+            count = 0
+            total = 0
+            for item in files:
+                path = item["path"]
+                size = int(item["size"])
+                self._db.execute("INSERT OR IGNORE INTO paths (path) VALUES (?)", (path,))
+                self._db.execute(
+                    "INSERT INTO files (snapshot, path, size, digest_hex)"
+                    " VALUES (?, (SELECT id FROM paths WHERE path = ?), ?, ?)",
+                    (sid, path, size, item["digest_hex"]),
+                )
+                count += 1
+                total += size
+            self._db.execute(
+                "UPDATE snapshots SET file_count = ?, total_bytes = ? WHERE id = ?",
+                (count, total, sid),
+            )
+
+    def remove_snapshot(self, snapshot_id: str) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM snapshots WHERE snapshot_id = ?", (snapshot_id,))
+
+    # ---------------------------------------------------------------- queries
+
+    def _files(self, where: str, params: tuple, *, order: str = "s.snapshot_id") -> Iterator[CatalogFile]:
+        sql = (
+            "SELECT s.snapshot_id, p.path, f.size, f.digest_hex"
+            " FROM files f JOIN snapshots s ON s.id = f.snapshot JOIN paths p ON p.id = f.path"
+            f" WHERE {where} ORDER BY {order}"
+        )
+        for row in self._db.execute(sql, params):
+            yield CatalogFile(snapshot_id=row[0], path=row[1], size=row[2], digest_hex=row[3])
+
+    def snapshots_containing(self, path: str) -> list[CatalogFile]:
+        """Every snapshot holding `path` (oldest first)."""
+        return list(self._files("p.path = ?", (path,)))
+
+    def file_history(self, path: str, *, source_root: str | None = None) -> list[CatalogFile]:
+        """
+        The versions of `path` (oldest first): the first snapshot holding it and each
+        snapshot where its digest changed. Restrict to one source with source_root.
+        """
+        where, params = "p.path = ?", (path,)
+        if source_root is not None:
+            where, params = where + " AND s.source_root = ?", params + (source_root,)
+        out: list[CatalogFile] = []
+        for f in self._files(where, params):
+            if not out or out[-1].digest_hex != f.digest_hex:
+                out.append(f)
+        return out
+
+    def snapshots_with_digest(self, digest_hex: str) -> list[CatalogFile]:
+        """Every (snapshot, path) whose content has this sha256."""
+        return list(self._files("f.digest_hex = ?", (digest_hex,), order="s.snapshot_id, p.path"))
+
+    def search_paths(self, pattern: str, *, limit: int = 100) -> list[str]:
+        """Distinct catalogued paths matching a case-sensitive GLOB pattern (e.g. "src/*.py")."""
+        rows = self._db.execute(
+            "SELECT p.path FROM paths p WHERE p.path GLOB ?"
+            " AND EXISTS (SELECT 1 FROM files f WHERE f.path = p.id)"
+            " ORDER BY p.path LIMIT ?",
+            (pattern, int(limit)),
+        )
+        return [r[0] for r in rows]
+
+    def diff_snapshots(self, old_snapshot_id: str, new_snapshot_id: str) -> CatalogDiff:
+        old = {f.path: f for f in self._files("s.snapshot_id = ?", (old_snapshot_id,), order="p.path")}
+        new = {f.path: f for f in self._files("s.snapshot_id = ?", (new_snapshot_id,), order="p.path")}
+        return CatalogDiff(
+            added=[new[p] for p in sorted(new.keys() - old.keys())],
+            removed=[old[p] for p in sorted(old.keys() - new.keys())],
+            changed=[
+                (old[p], new[p])
+                for p in sorted(old.keys() & new.keys())
+                if old[p].digest_hex != new[p].digest_hex or old[p].size != new[p].size
+            ],
+        )
+
+
+def _verified_manifest(fs: FileSystemPort, snapshot_dir: Path, *, hmac_key: ManifestHmacKey | None) -> dict:
+    text = fs.read_text(snapshot_dir / "manifest.json")
+    manifest = json.loads(text)
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), list):
+        raise SnapshotCorrupt("Invalid manifest: expected 'files' list")
+    ok, reason = verify_manifest_text_integrity(text, hmac_key=hmac_key, manifest=manifest)
+    if not ok:
+        raise SnapshotCorrupt(f"Invalid manifest: integrity check failed ({reason}).")
+    return manifest
+
+
+def catalog_snapshot(
+    catalog: VaultCatalog,
+    *,
+    fs: FileSystemPort,
+    snapshot_dir: Path,
+    hmac_key: ManifestHmacKey | None,
+) -> None:
+    """Import one snapshot from its verified manifest (raises SnapshotCorrupt)."""
+    manifest = _verified_manifest(fs, snapshot_dir, hmac_key=hmac_key)
+    integrity = manifest.get("manifest_integrity") or {}
+    source_root = manifest.get("source_root")
+    catalog.add_snapshot(
+        snapshot_id=snapshot_dir.name,
+        source_root=source_root if isinstance(source_root, str) else None,
+        manifest_digest_hex=str(integrity.get("digest_hex") or ""),
+        files=(
+            item
+            for item in manifest["files"]
+            if isinstance(item, dict) and item.get("type", "file") == "file"
+        ),
+    )
+
+
+def sync_catalog(
+    catalog: VaultCatalog,
+    *,
+    fs: FileSystemPort,
+    backup_root: Path,
+    hmac_key: ManifestHmacKey | None = None,
+) -> CatalogSyncResult:
+    """
+    Bring the catalog in line with the vault's snapshots.
+
+    Snapshots whose manifest digest (read from the manifest tail) matches their
+    catalog row are not re-read. Corrupt snapshots are skipped and left out.
+    """
+    if hmac_key is None:
+        hmac_key = load_manifest_hmac_key(vault_root=backup_root)
+
+    known = catalog.snapshot_digests()
+    added = unchanged = skipped = 0
+    present: set[str] = set()
+
+    for ref in list_snapshots(fs=fs, backup_root=backup_root):
+        present.add(ref.snapshot_id)
+        tail = read_manifest_integrity_tail(fs, ref.snapshot_dir / "manifest.json")
+        if tail is not None and known.get(ref.snapshot_id) == tail["digest_hex"]:
+            unchanged += 1
+            continue
+        try:
+            catalog_snapshot(catalog, fs=fs, snapshot_dir=ref.snapshot_dir, hmac_key=hmac_key)
+            added += 1
+        except (SnapshotCorrupt, OSError, ValueError):
+            catalog.remove_snapshot(ref.snapshot_id)
+            skipped += 1
+
+    removed = 0
+    for snapshot_id in known.keys() - present:
+        catalog.remove_snapshot(snapshot_id)
+        removed += 1
+
+    return CatalogSyncResult(added=added, removed=removed, unchanged=unchanged, skipped=skipped)
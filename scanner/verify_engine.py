@@ -1,28 +1,134 @@
 from __future__ import annotations
 
-from scanner.errors import SnapshotCorrupt, RestoreRefused
+from scanner.errors import DevVaultRefusal, SnapshotCorrupt, RestoreRefused
 
+import hashlib
 import json
+import random
+import secrets
+import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
 from scanner.checksum import hash_path
+from scanner.copy_pipeline import DEFAULT_MAX_INFLIGHT_BYTES, ParallelCopyPipeline, PipelineStopped
 from scanner.integrity_keys import load_manifest_hmac_key
-from scanner.manifest_integrity import verify_manifest_integrity
+from scanner.manifest_stream import verify_manifest_text_integrity
 from scanner.manifest_schema import validate_crypto_stanza
+from scanner.object_store import snapshot_file_path, storage_layout_of
+from scanner.path_index import read_indexed_selection
 from scanner.ports.filesystem import FileSystemPort
+from scanner.restore_selection import normalize_selectors, path_selected
+from scanner.snapshot_listing import list_snapshots
+
+
+VERIFY_FULL = "full"
+VERIFY_SAMPLED = "sampled"
 
 
 @dataclass(frozen=True)
 class VerifyRequest:
     snapshot_dir: Path
 
+    # >1 checks/hashes files on a bounded worker pool (hashlib releases the GIL on
+    # large buffers). The reported failure is still the first one in manifest order.
+    workers: int = 1
+
+    # "full": hash every file.
+    # "sampled": check manifest integrity, identity, existence and size of every file,
+    # then hash a subset of files within the budgets below.
+    mode: str = VERIFY_FULL
+
+    # Sampled mode budgets (0 = unlimited). Files are hashed in sample order until
+    # the next one would exceed sample_bytes or sample_seconds have elapsed.
+    sample_bytes: int = 0
+    sample_seconds: float = 0.0
+
+    # Sample order seed (None = fresh random seed, reported in the result).
+    sample_seed: int | None = None
+
+    # Rotation: >0 splits files into this many stable slices (by path) and samples only
+    # slice `rotation_slice` (default: UTC day number), so N daily runs cover every file.
+    rotation_slices: int = 0
+    rotation_slice: int | None = None
+
+    # Snapshot paths or globs to verify (same selectors as RestoreRequest.include);
+    # empty verifies the whole snapshot. A selection is read from the signed path
+    # index when the snapshot has one.
+    include: tuple[str, ...] = ()
+
 
 @dataclass(frozen=True)
 class VerifyResult:
     snapshot_dir: Path
     files_verified: int
 
+    mode: str = VERIFY_FULL
+    # Content actually hashed vs. what the snapshot holds.
+    files_hashed: int = 0
+    bytes_hashed: int = 0
+    total_bytes: int = 0
+    sample_seed: int | None = None
+    rotation_slice: int | None = None
+    # True when a sample budget stopped hashing before the candidate files ran out.
+    budget_exhausted: bool = False
+
+    @property
+    def file_coverage(self) -> float:
+        """Fraction of files hashed: the chance a single corrupted file was caught."""
+        if self.files_verified <= 0:
+            return 1.0
+        return self.files_hashed / self.files_verified
+
+    @property
+    def byte_coverage(self) -> float:
+        """Fraction of bytes hashed: the chance a single corrupted byte was caught."""
+        if self.total_bytes <= 0:
+            return 1.0
+        return self.bytes_hashed / self.total_bytes
+
+
+@dataclass(frozen=True)
+class VerifyTarget:
+    """One manifest entry resolved to its stored file."""
+    rel_path: str
+    src: Path
+    size: int
+    digest_hex: str | None
+
+
+@dataclass(frozen=True)
+class _OpenedManifest:
+    files: list
+    is_v2: bool
+    layout: str
+    vault_root: Path
+
+
+@dataclass(frozen=True)
+class SnapshotVerdict:
+    snapshot_id: str
+    snapshot_dir: Path
+    ok: bool
+    files_verified: int
+    reason: str | None = None  # first failure in manifest order
+
+
+@dataclass(frozen=True)
+class VaultVerifyResult:
+    backup_root: Path
+    verdicts: tuple[SnapshotVerdict, ...]
+    # Unique physical files hashed vs. what per-snapshot verifies would have read.
+    unique_files_hashed: int
+    bytes_hashed: int
+    bytes_referenced: int
+
+    @property
+    def ok(self) -> bool:
+        return all(v.ok for v in self.verdicts)
+
 
 class VerifyEngine:
     def __init__(self, fs: FileSystemPort):
@@ -54,40 +160,56 @@ class VerifyEngine:
                 "Snapshot identity mismatch: folder name does not match manifest metadata."
             )
 
-    def verify(self, req: VerifyRequest) -> VerifyResult:
-        if not self.fs.exists(req.snapshot_dir):
+    def _open_manifest(self, snapshot_dir: Path, include: tuple[str, ...] = ()) -> "_OpenedManifest":
+        """
+        Read and authenticate a snapshot manifest (integrity, crypto stanza, identity).
+
+        With include, only the matching entries are returned, taken from the signed
+        path index when it is usable; refuses when nothing matches.
+        """
+        if not self.fs.exists(snapshot_dir):
             raise SnapshotCorrupt("Snapshot directory does not exist.")
-        if not self.fs.is_dir(req.snapshot_dir):
+        if not self.fs.is_dir(snapshot_dir):
             raise SnapshotCorrupt("Snapshot path is not a directory.")
-        if req.snapshot_dir.name.startswith(".incomplete-"):
+        if snapshot_dir.name.startswith(".incomplete-"):
             raise SnapshotCorrupt("Refusing to verify an incomplete snapshot.")
 
-        manifest_path = req.snapshot_dir / "manifest.json"
+        manifest_path = snapshot_dir / "manifest.json"
         if not self.fs.exists(manifest_path):
             raise SnapshotCorrupt("Snapshot is missing manifest.json")
 
-        try:
-            manifest = json.loads(self.fs.read_text(manifest_path))
-        except json.JSONDecodeError:
-            raise RuntimeError(
-                f"Snapshot manifest is invalid JSON; refusing verify. Path: {manifest_path}"
-            ) from None
-
         hmac_key = load_manifest_hmac_key(
-            vault_root=self._vault_root_for_snapshot(req.snapshot_dir)
+            vault_root=self._vault_root_for_snapshot(snapshot_dir)
         )
-        ok, reason = verify_manifest_integrity(manifest, hmac_key=hmac_key)
-        if not ok:
-            if reason == "missing-hmac-key":
-                raise SnapshotCorrupt("Business vault manifest HMAC key is missing; refusing verify.")
-            raise SnapshotCorrupt("Invalid manifest: integrity check failed.")
+
+        manifest = read_indexed_selection(self.fs, snapshot_dir, include, hmac_key=hmac_key) if include else None
+        if manifest is None:
+            try:
+                manifest_text = self.fs.read_text(manifest_path)
+                manifest = json.loads(manifest_text)
+            except json.JSONDecodeError:
+                raise RuntimeError(
+                    f"Snapshot manifest is invalid JSON; refusing verify. Path: {manifest_path}"
+                ) from None
+
+            ok, reason = verify_manifest_text_integrity(
+                manifest_text, hmac_key=hmac_key, manifest=manifest
+            )
+            if not ok:
+                if reason == "missing-hmac-key":
+                    raise SnapshotCorrupt("Business vault manifest HMAC key is missing; refusing verify.")
+                raise SnapshotCorrupt("Invalid manifest: integrity check failed.")
 
         validate_crypto_stanza(manifest)
-        self._validate_snapshot_identity(snapshot_dir=req.snapshot_dir, manifest=manifest)
+        self._validate_snapshot_identity(snapshot_dir=snapshot_dir, manifest=manifest)
 
         files = manifest.get("files")
         if not isinstance(files, list):
             raise SnapshotCorrupt("Invalid manifest: expected 'files' list.")
+        if include:
+            files = [f for f in files if isinstance(f, dict) and path_selected(str(f.get("path", "")), include)]
+            if not files:
+                raise DevVaultRefusal("No snapshot entries match the verify selection.")
 
         manifest_version = manifest.get("manifest_version")
         is_v2 = manifest_version == 2
@@ -96,45 +218,363 @@ class VerifyEngine:
         if is_v2 and checksum_algo != "sha256":
             raise SnapshotCorrupt("Invalid manifest: unsupported checksum algorithm.")
 
+        layout = storage_layout_of(manifest)
+        vault_root = self._vault_root_for_snapshot(snapshot_dir)
+
+        return _OpenedManifest(files=files, is_v2=is_v2, layout=layout, vault_root=vault_root)
+
+    def targets(self, snapshot_dir: Path) -> list[VerifyTarget]:
+        """
+        The snapshot's files resolved to their stored paths, after the manifest checks
+        of verify(). Raises SnapshotCorrupt for the first invalid entry.
+        """
+        opened = self._open_manifest(snapshot_dir)
+        out: list[VerifyTarget] = []
+        for item in opened.files:
+            src, size, digest_hex = self._checked_entry(
+                item,
+                snapshot_dir=snapshot_dir,
+                vault_root=opened.vault_root,
+                layout=opened.layout,
+                is_v2=opened.is_v2,
+            )
+            out.append(VerifyTarget(rel_path=item["path"], src=src, size=size, digest_hex=digest_hex))
+        return out
+
+    def verify_target(self, target: VerifyTarget, *, hash_content: bool = True) -> None:
+        """Presence, size and (unless hash_content is False) sha256 of one file; raises SnapshotCorrupt."""
+        self._verify_file(target.src, size=target.size, digest_hex=target.digest_hex if hash_content else None)
+
+    def verify(self, req: VerifyRequest) -> VerifyResult:
+        workers = int(getattr(req, "workers", 1) or 1)
+        if workers < 1:
+            raise RuntimeError(f"Unsupported verify worker count: {workers}")
+        mode = str(getattr(req, "mode", VERIFY_FULL) or VERIFY_FULL)
+        if mode not in (VERIFY_FULL, VERIFY_SAMPLED):
+            raise RuntimeError(f"Unsupported verify mode: {mode}")
+
+        include = normalize_selectors(getattr(req, "include", ()) or ())
+        opened = self._open_manifest(req.snapshot_dir, include)
+        files, is_v2, layout, vault_root = opened.files, opened.is_v2, opened.layout, opened.vault_root
+
+        if mode == VERIFY_SAMPLED:
+            return self._verify_sampled(
+                req,
+                files=files,
+                vault_root=vault_root,
+                layout=layout,
+                is_v2=is_v2,
+                workers=workers,
+            )
+
+        pipeline: ParallelCopyPipeline | None = None
+        if workers > 1:
+            pipeline = ParallelCopyPipeline(
+                workers=workers,
+                max_inflight_bytes=DEFAULT_MAX_INFLIGHT_BYTES,
+                thread_name_prefix="devvault-verify",
+            )
+
         verified = 0
+        total_bytes = 0
 
+        try:
+            for item in files:
+                try:
+                    src, size, digest_hex = self._checked_entry(
+                        item,
+                        snapshot_dir=req.snapshot_dir,
+                        vault_root=vault_root,
+                        layout=layout,
+                        is_v2=is_v2,
+                    )
+                except SnapshotCorrupt:
+                    if pipeline is not None:
+                        # A failure of an earlier entry takes precedence (manifest order).
+                        p, pipeline = pipeline, None
+                        p.finish()
+                    raise
+
+                if pipeline is None:
+                    self._verify_file(src, size=size, digest_hex=digest_hex)
+                else:
+                    try:
+                        pipeline.submit(
+                            size=size,
+                            job=partial(self._verify_file, src, size=size, digest_hex=digest_hex),
+                        )
+                    except PipelineStopped:
+                        break
+
+                verified += 1
+                total_bytes += size
+
+            if pipeline is not None:
+                p, pipeline = pipeline, None
+                p.finish()
+        finally:
+            if pipeline is not None:
+                pipeline.abort()
+
+        return VerifyResult(
+            snapshot_dir=req.snapshot_dir,
+            files_verified=verified,
+            files_hashed=verified if is_v2 else 0,
+            bytes_hashed=total_bytes if is_v2 else 0,
+            total_bytes=total_bytes,
+        )
+
+    def _verify_sampled(
+        self,
+        req: VerifyRequest,
+        *,
+        files: list,
+        vault_root: Path,
+        layout: str,
+        is_v2: bool,
+        workers: int,
+    ) -> VerifyResult:
+        # Pass 1 — every entry: validation, existence and size (metadata only).
+        checks: list[tuple[Path, int, str | None, str]] = []
         for item in files:
-            rel = item.get("path")
-            size = item.get("size")
+            src, size, digest_hex = self._checked_entry(
+                item,
+                snapshot_dir=req.snapshot_dir,
+                vault_root=vault_root,
+                layout=layout,
+                is_v2=is_v2,
+            )
+            self._verify_file(src, size=size, digest_hex=None)
+            checks.append((src, size, digest_hex, item["path"]))
+        total_bytes = sum(c[1] for c in checks)
+
+        # Pass 2 — hash a (seeded) random or rotating subset within the budgets.
+        seed = req.sample_seed if req.sample_seed is not None else secrets.randbits(32)
+        candidates = list(range(len(checks))) if is_v2 else []
+
+        slices = max(0, int(req.rotation_slices or 0))
+        rotation_slice: int | None = None
+        if slices > 0:
+            rotation_slice = req.rotation_slice
+            if rotation_slice is None:
+                rotation_slice = datetime.now(timezone.utc).date().toordinal()
+            rotation_slice %= slices
+            candidates = [i for i in candidates if _rotation_slice_of(checks[i][3], slices) == rotation_slice]
+
+        random.Random(seed).shuffle(candidates)
+
+        byte_budget = max(0, int(req.sample_bytes or 0))
+        deadline = time.monotonic() + req.sample_seconds if req.sample_seconds and req.sample_seconds > 0 else None
+
+        pipeline: ParallelCopyPipeline | None = None
+        if workers > 1:
+            pipeline = ParallelCopyPipeline(
+                workers=workers,
+                max_inflight_bytes=DEFAULT_MAX_INFLIGHT_BYTES,
+                thread_name_prefix="devvault-verify",
+            )
+
+        hashed = 0
+        hashed_bytes = 0
+        exhausted = False
+        try:
+            for i in candidates:
+                src, size, digest_hex, _rel = checks[i]
+                if hashed and (
+                    (byte_budget and hashed_bytes + size > byte_budget)
+                    or (deadline is not None and time.monotonic() >= deadline)
+                ):
+                    exhausted = True
+                    break
+
+                if pipeline is None:
+                    self._hash_file(src, digest_hex=digest_hex)
+                else:
+                    try:
+                        pipeline.submit(size=size, job=partial(self._hash_file, src, digest_hex=digest_hex))
+                    except PipelineStopped:
+                        break
+                hashed += 1
+                hashed_bytes += size
+
+            if pipeline is not None:
+                p, pipeline = pipeline, None
+                p.finish()
+        finally:
+            if pipeline is not None:
+                pipeline.abort()
+
+        return VerifyResult(
+            snapshot_dir=req.snapshot_dir,
+            files_verified=len(checks),
+            mode=VERIFY_SAMPLED,
+            files_hashed=hashed,
+            bytes_hashed=hashed_bytes,
+            total_bytes=total_bytes,
+            sample_seed=seed,
+            rotation_slice=rotation_slice,
+            budget_exhausted=exhausted,
+        )
 
-            if not isinstance(rel, str) or rel == "":
-                raise SnapshotCorrupt("Invalid manifest entry: file path must be a non-empty string.")
-            if not isinstance(size, int) or size < 0:
-                raise SnapshotCorrupt("Invalid manifest entry: file size must be a non-negative integer.")
+    def verify_vault(self, backup_root: Path, *, workers: int = 1) -> VaultVerifyResult:
+        """
+        Verify every snapshot of a vault, hashing each physical file once.
+
+        Entries are grouped by (digest, physical identity): files shared between
+        snapshots (object store, hardlinked incremental files) are hashed once and the
+        outcome is applied to every referencing snapshot. Each snapshot gets its own
+        verdict, with the first failing entry in manifest order as the reason; a
+        failing snapshot does not stop the others.
+        """
+        workers = int(workers or 1)
+        if workers < 1:
+            raise RuntimeError(f"Unsupported verify worker count: {workers}")
+
+        refs = list_snapshots(fs=self.fs, backup_root=backup_root)
+        # Per snapshot: (manifest-order failures {entry index: reason}, entry count) or a fatal reason.
+        failures: list[dict[int, str]] = [{} for _ in refs]
+        counts: list[int] = [0] * len(refs)
+        fatal: list[str | None] = [None] * len(refs)
+        # (digest, physical id) -> [target, [(snapshot idx, entry idx), ...]]
+        groups: dict[tuple, list] = {}
+        referenced = 0
+
+        for si, ref in enumerate(refs):
+            try:
+                targets = self.targets(ref.snapshot_dir)
+            except (SnapshotCorrupt, RuntimeError, OSError) as e:
+                fatal[si] = str(e)
+                continue
+            counts[si] = len(targets)
+            for ei, t in enumerate(targets):
+                try:
+                    st = self._stat_checked(t.src, size=t.size)
+                except (SnapshotCorrupt, OSError) as e:
+                    failures[si][ei] = str(e)
+                    continue
+                referenced += t.size
+                if t.digest_hex is None:
+                    continue
+                ino = int(getattr(st, "st_ino", 0) or 0)
+                physical = (int(st.st_dev), ino) if ino else (str(t.src),)
+                groups.setdefault((t.digest_hex, physical), [t, []])[1].append((si, ei))
+
+        def hash_outcome(t: VerifyTarget) -> str | None:
+            try:
+                self._hash_file(t.src, digest_hex=t.digest_hex)
+            except (SnapshotCorrupt, OSError) as e:
+                return str(e)
+            return None
+
+        unique = list(groups.values())
+        if workers > 1:
+            pipeline = ParallelCopyPipeline(
+                workers=workers,
+                max_inflight_bytes=DEFAULT_MAX_INFLIGHT_BYTES,
+                thread_name_prefix="devvault-verify",
+            )
+            try:
+                for t, _refs in unique:
+                    pipeline.submit(size=t.size, job=partial(hash_outcome, t))
+            except BaseException:
+                pipeline.abort()
+                raise
+            outcomes = pipeline.finish()
+        else:
+            outcomes = [hash_outcome(t) for t, _refs in unique]
+
+        for (t, users), reason in zip(unique, outcomes):
+            if reason is not None:
+                for si, ei in users:
+                    failures[si][ei] = reason
+
+        verdicts = []
+        for si, ref in enumerate(refs):
+            reason = fatal[si]
+            if reason is None and failures[si]:
+                reason = failures[si][min(failures[si])]
+            verdicts.append(
+                SnapshotVerdict(
+                    snapshot_id=ref.snapshot_id,
+                    snapshot_dir=ref.snapshot_dir,
+                    ok=reason is None,
+                    files_verified=counts[si] if reason is None else 0,
+                    reason=reason,
+                )
+            )
 
-            digest_hex = None
-            if is_v2:
-                dh = item.get("digest_hex")
-                if not isinstance(dh, str) or dh == "":
-                    raise SnapshotCorrupt("Invalid manifest entry: missing digest.")
-                if len(dh) != 64:
-                    raise SnapshotCorrupt("Invalid manifest entry: invalid digest format.")
-                digest_hex = dh
+        return VaultVerifyResult(
+            backup_root=backup_root,
+            verdicts=tuple(verdicts),
+            unique_files_hashed=len(unique),
+            bytes_hashed=sum(t.size for t, _users in unique),
+            bytes_referenced=referenced,
+        )
 
-            rel_path = Path(rel)
-            if rel_path.is_absolute() or ".." in rel_path.parts:
-                raise SnapshotCorrupt("Invalid manifest entry: unsafe path.")
+    def _checked_entry(
+        self,
+        item: object,
+        *,
+        snapshot_dir: Path,
+        vault_root: Path,
+        layout: str,
+        is_v2: bool,
+    ) -> tuple[Path, int, str | None]:
+        """Validate one manifest entry and resolve its stored file (no I/O)."""
+        if not isinstance(item, dict):
+            raise SnapshotCorrupt("Invalid manifest entry: expected an object.")
+        rel = item.get("path")
+        size = item.get("size")
+
+        if not isinstance(rel, str) or rel == "":
+            raise SnapshotCorrupt("Invalid manifest entry: file path must be a non-empty string.")
+        if not isinstance(size, int) or size < 0:
+            raise SnapshotCorrupt("Invalid manifest entry: file size must be a non-negative integer.")
+
+        digest_hex = None
+        if is_v2:
+            dh = item.get("digest_hex")
+            if not isinstance(dh, str) or dh == "":
+                raise SnapshotCorrupt("Invalid manifest entry: missing digest.")
+            if len(dh) != 64:
+                raise SnapshotCorrupt("Invalid manifest entry: invalid digest format.")
+            digest_hex = dh
+
+        rel_path = Path(rel)
+        if rel_path.is_absolute() or ".." in rel_path.parts:
+            raise SnapshotCorrupt("Invalid manifest entry: unsafe path.")
+
+        src = snapshot_file_path(
+            snapshot_dir=snapshot_dir,
+            vault_root=vault_root,
+            layout=layout,
+            rel_path=rel_path,
+            digest_hex=digest_hex,
+        )
+        return src, size, digest_hex
 
-            src = req.snapshot_dir / rel_path
-            if not self.fs.exists(src) or not self.fs.is_file(src):
-                raise SnapshotCorrupt("Snapshot is corrupt: referenced file missing.")
+    def _stat_checked(self, src: Path, *, size: int):
+        if not self.fs.exists(src) or not self.fs.is_file(src):
+            raise SnapshotCorrupt("Snapshot is corrupt: referenced file missing.")
 
-            st = self.fs.stat(src)
-            if st.st_size != size:
-                raise SnapshotCorrupt("Snapshot is corrupt: file size mismatch.")
+        st = self.fs.stat(src)
+        if st.st_size != size:
+            raise SnapshotCorrupt("Snapshot is corrupt: file size mismatch.")
+        return st
 
-            if is_v2:
-                d = hash_path(self.fs, src, algo="sha256")
-                if d.hex != digest_hex:
-                    raise SnapshotCorrupt("Snapshot verification failed: checksum mismatch.")
+    def _verify_file(self, src: Path, *, size: int, digest_hex: str | None) -> None:
+        self._stat_checked(src, size=size)
 
-            verified += 1
+        if digest_hex is not None:
+            self._hash_file(src, digest_hex=digest_hex)
 
-        return VerifyResult(snapshot_dir=req.snapshot_dir, files_verified=verified)
+    def _hash_file(self, src: Path, *, digest_hex: str) -> None:
+        d = hash_path(self.fs, src, algo="sha256")
+        if d.hex != digest_hex:
+            raise SnapshotCorrupt("Snapshot verification failed: checksum mismatch.")
 
 
+def _rotation_slice_of(rel_path: str, slices: int) -> int:
+    # Stable across runs and processes (unlike hash()).
+    h = hashlib.sha256(rel_path.encode("utf-8", "surrogateescape")).digest()
+    return int.from_bytes(h[:8], "big") % slices
@@ -0,0 +1,130 @@
+"""
+Verification ledger (.devvault/verify_ledger.sqlite): when each piece of stored
+content was last verified, and with what outcome.
+
+Rows are keyed by (digest_hex, copy_id): the sha256 of the content and the stored
+file that holds it ("ino:<n>", or the vault-relative path where the volume has no
+file ids). Content shared between snapshots - an object store object, hardlinked
+incremental files - is one row, verified once for every snapshot that references
+it; separate copies of the same bytes are separate rows. The ledger is bookkeeping
+only: losing it means the next scrub starts over, never that damage goes unreported.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from scanner.snapshot_listing import INTERNAL_DIR_NAME
+
+
+LEDGER_FILE_NAME = "verify_ledger.sqlite"
+LEDGER_SCHEMA_VERSION = 2
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verified_content (
+    digest_hex TEXT NOT NULL,
+    copy_id TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    verified_at REAL NOT NULL,
+    status TEXT NOT NULL,
+    reason TEXT,
+    PRIMARY KEY (digest_hex, copy_id)
+) WITHOUT ROWID;
+"""
+
+
+def ledger_path_for_backup_root(backup_root: Path) -> Path:
+    return backup_root / INTERNAL_DIR_NAME / LEDGER_FILE_NAME
+
+
+@dataclass(frozen=True)
+class LedgerRecord:
+    digest_hex: str  # "" for v1 manifests (no digests)
+    copy_id: str
+    size: int
+    verified_at: float  # unix time
+    status: str = STATUS_OK
+    reason: str | None = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.digest_hex, self.copy_id)
+
+
+class VerifyLedger:
+    """A connection to one vault's verification ledger. Use as a context manager."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(str(path), timeout=30.0)
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, 1, LEDGER_SCHEMA_VERSION):
+            self._db.close()
+            raise RuntimeError(f"Unsupported verify ledger schema version: {version}")
+        with self._db:
+            if version == 1:
+                # Version 1 rows were per snapshot file; the next scrub starts over.
+                self._db.execute("DROP TABLE IF EXISTS verified")
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {LEDGER_SCHEMA_VERSION}")
+
+    @classmethod
+    def open(cls, backup_root: Path) -> "VerifyLedger":
+        return cls(ledger_path_for_backup_root(backup_root))
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "VerifyLedger":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def records(self) -> dict[tuple[str, str], LedgerRecord]:
+        """(digest_hex, copy_id) -> last record, for the whole vault."""
+        rows = self._db.execute(
+            "SELECT digest_hex, copy_id, size, verified_at, status, reason FROM verified_content"
+        )
+        return {
+            (r[0], r[1]): LedgerRecord(
+                digest_hex=r[0],
+                copy_id=r[1],
+                size=r[2],
+                verified_at=r[3],
+                status=r[4],
+                reason=r[5],
+            )
+            for r in rows
+        }
+
+    def record(self, records: Iterable[LedgerRecord]) -> None:
+        """Upsert records in one transaction."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO verified_content (digest_hex, copy_id, size, verified_at, status, reason)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (r.digest_hex, r.copy_id, int(r.size), float(r.verified_at), r.status, r.reason)
+                    for r in records
+                ],
+            )
+
+    def prune(self, keep: Iterable[tuple[str, str]]) -> int:
+        """Drop rows whose (digest_hex, copy_id) is not in keep; returns the number of rows removed."""
+        keep = set(keep)
+        gone = [
+            key
+            for key in self._db.execute("SELECT digest_hex, copy_id FROM verified_content")
+            if tuple(key) not in keep
+        ]
+        with self._db:
+            self._db.executemany("DELETE FROM verified_content WHERE digest_hex = ? AND copy_id = ?", gone)
+        return len(gone)
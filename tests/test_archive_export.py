@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from devvault.cli import main
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.archive_export import ArchiveExporter, ExportRequest, archive_format_for
+from scanner.backup_engine import BackupEngine
+from scanner.errors import RestoreRefused, SnapshotCorrupt
+from scanner.models.backup import BackupRequest
+
+FILES = {
+    "README.md": b"readme",
+    "pkg/app.py": b"print('app')\n" * 100,
+    "pkg/data/blob.bin": bytes(range(256)) * 64,
+}
+
+
+def _snapshot(tmp_path: Path) -> Path:
+    source = tmp_path / "src"
+    for rel, data in FILES.items():
+        (source / rel).parent.mkdir(parents=True, exist_ok=True)
+        (source / rel).write_bytes(data)
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    return BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path
+
+
+def _tar_members(data: bytes) -> dict[str, bytes]:
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as tf:
+        return {m.name: tf.extractfile(m).read() for m in tf.getmembers()}
+
+
+def _zip_members(data: bytes) -> dict[str, bytes]:
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {n: zf.read(n) for n in zf.namelist()}
+
+
+@pytest.mark.parametrize("fmt", ["tar", "tar.gz", "tar.xz", "zip"])
+def test_export_round_trip(tmp_path: Path, fmt: str) -> None:
+    snapshot = _snapshot(tmp_path)
+    archive = tmp_path / f"out.{fmt}"
+    assert archive_format_for(archive) == fmt
+
+    res = ArchiveExporter(OSFileSystem()).export(ExportRequest(snapshot_dir=snapshot, output=archive, archive_format=fmt))
+
+    assert (res.files_exported, res.bytes_exported) == (3, sum(len(d) for d in FILES.values()))
+    members = (_zip_members if fmt == "zip" else _tar_members)(archive.read_bytes())
+    assert members == FILES
+    assert not (tmp_path / f"out.{fmt}.devvault.tmp").exists()
+
+
+def test_export_to_stream_with_selection(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path)
+    buf = io.BytesIO()
+
+    res = ArchiveExporter(OSFileSystem()).export(
+        ExportRequest(snapshot_dir=snapshot, archive_format="tar.gz", include=("pkg/*.py",)), stream=buf
+    )
+
+    assert res.files_exported == 1
+    assert _tar_members(buf.getvalue()) == {"pkg/app.py": FILES["pkg/app.py"]}
+
+
+def test_export_checksum_mismatch_leaves_no_archive(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path)
+    victim = snapshot / "pkg" / "data" / "blob.bin"
+    data = victim.read_bytes()
+    victim.write_bytes(bytes([data[0] ^ 0x01]) + data[1:])
+    archive = tmp_path / "out.zip"
+
+    with pytest.raises(SnapshotCorrupt, match="checksum mismatch: pkg/data/blob.bin"):
+        ArchiveExporter(OSFileSystem()).export(ExportRequest(snapshot_dir=snapshot, output=archive, archive_format="zip"))
+
+    assert not archive.exists()
+    assert not (tmp_path / "out.zip.devvault.tmp").exists()
+
+    # A stream cannot be taken back, but it is never finished into a readable archive.
+    buf = io.BytesIO()
+    with pytest.raises(SnapshotCorrupt):
+        ArchiveExporter(OSFileSystem()).export(ExportRequest(snapshot_dir=snapshot, archive_format="zip"), stream=buf)
+    with pytest.raises(zipfile.BadZipFile):
+        _zip_members(buf.getvalue())
+
+
+def test_export_refusals(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path)
+    exporter = ArchiveExporter(OSFileSystem())
+    existing = tmp_path / "exists.tar"
+    existing.write_bytes(b"keep")
+
+    with pytest.raises(RestoreRefused, match="already exists"):
+        exporter.export(ExportRequest(snapshot_dir=snapshot, output=existing))
+    assert existing.read_bytes() == b"keep"
+    with pytest.raises(RuntimeError, match="Unsupported export format"):
+        exporter.export(ExportRequest(snapshot_dir=snapshot, output=tmp_path / "x.rar", archive_format="rar"))
+
+    (snapshot / "README.md").unlink()
+    with pytest.raises(SnapshotCorrupt, match="referenced file missing"):
+        exporter.export(ExportRequest(snapshot_dir=snapshot, output=tmp_path / "x.tar"))
+    assert not (tmp_path / "x.tar").exists()
+
+
+def test_cli_export_json(tmp_path: Path, capsys) -> None:
+    snapshot = _snapshot(tmp_path)
+    archive = tmp_path / "snap.tgz"
+
+    assert main(["export", str(snapshot), str(archive), "--include", "README.md", "--json"]) == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    assert (payload["format"], payload["files_exported"]) == ("tar.gz", 1)
+    assert _tar_members(archive.read_bytes()) == {"README.md": FILES["README.md"]}
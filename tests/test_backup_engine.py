@@ -114,6 +114,9 @@ def test_backup_engine_manifest_failure_does_not_finalize(tmp_path: Path):
             source_name: str,
             display_name: str,
             backup_root: Path | None = None,
+            copied=None,
+            storage_layout="tree",
+            ignore_patterns=(),
         ) -> None:
             raise RuntimeError("boom: manifest write failed")
 
@@ -267,3 +270,494 @@ def test_backup_engine_rename_failure_leaves_incomplete(tmp_path: Path, monkeypa
 
     incompletes = [p for p in backup_root.iterdir() if p.is_dir() and p.name.startswith(".incomplete-")]
     assert len(incompletes) == 0
+
+
+def test_backup_engine_reads_each_source_file_once(tmp_path: Path) -> None:
+    import json
+
+    from scanner.checksum import hash_path
+
+    class CountingFS(OSFileSystem):
+        def __init__(self) -> None:
+            self.source_opens: list[Path] = []
+
+        def open_read(self, path: Path):
+            if source in path.parents:
+                self.source_opens.append(path)
+            return super().open_read(path)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    (source / "sub").mkdir(parents=True)
+    backup_root.mkdir()
+    (source / "a.txt").write_bytes(b"a" * 5000)
+    (source / "sub" / "b.bin").write_bytes(b"\x00\x01" * 70000)
+
+    fs = CountingFS()
+    result = BackupEngine(fs).execute(BackupRequest(source_root=source, backup_root=backup_root))
+
+    # Manifest digests are computed during copy; the source is never re-opened for hashing.
+    assert fs.source_opens == []
+
+    data = json.loads((result.backup_path / "manifest.json").read_text(encoding="utf-8"))
+    by_path = {f["path"]: f for f in data["files"]}
+    assert set(by_path) == {"a.txt", "sub/b.bin"}
+    for rel, entry in by_path.items():
+        src = source / rel
+        assert entry["size"] == src.stat().st_size
+        assert entry["digest_hex"] == hash_path(OSFileSystem(), src).hex
+
+
+def test_backup_engine_incremental_reuses_unchanged_files(tmp_path: Path) -> None:
+    import json
+
+    from scanner.verify_engine import VerifyEngine, VerifyRequest
+
+    fs = OSFileSystem()
+    engine = BackupEngine(fs)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    source.mkdir()
+    backup_root.mkdir()
+    (source / "same.txt").write_text("unchanged\n", encoding="utf-8")
+    (source / "edit.txt").write_text("v1\n", encoding="utf-8")
+
+    first = engine.execute(BackupRequest(source_root=source, backup_root=backup_root, incremental=True))
+    assert first.files_reused == 0
+    assert first.files_copied == 2
+
+    (source / "edit.txt").write_text("version two\n", encoding="utf-8")
+
+    second = engine.execute(BackupRequest(source_root=source, backup_root=backup_root, incremental=True))
+    assert second.files_reused == 1
+    assert second.files_copied == 1
+
+    assert (second.backup_path / "same.txt").read_text(encoding="utf-8") == "unchanged\n"
+    assert (second.backup_path / "edit.txt").read_text(encoding="utf-8") == "version two\n"
+
+    data = json.loads((second.backup_path / "manifest.json").read_text(encoding="utf-8"))
+    assert data["source_root"] == str(source.resolve())
+
+    # Each snapshot remains a complete, independently verifiable tree.
+    assert VerifyEngine(fs).verify(VerifyRequest(snapshot_dir=first.backup_path)).files_verified == 2
+    assert VerifyEngine(fs).verify(VerifyRequest(snapshot_dir=second.backup_path)).files_verified == 2
+
+
+def test_backup_engine_incremental_reuse_leaves_prior_files_alone(tmp_path: Path) -> None:
+    import stat
+
+    from scanner.object_store import object_store_root
+
+    fs = OSFileSystem()
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    source.mkdir()
+    backup_root.mkdir()
+    (source / "same.txt").write_text("unchanged\n", encoding="utf-8")
+
+    # Tree prior: a hardlinked reuse must not change the prior inode's mode.
+    first = BackupEngine(fs).execute(BackupRequest(source_root=source, backup_root=backup_root, incremental=True))
+    prior_file = first.backup_path / "same.txt"
+    prior_file.chmod(0o444)
+    second = BackupEngine(fs).execute(BackupRequest(source_root=source, backup_root=backup_root, incremental=True))
+    assert second.files_reused == 1
+    assert stat.S_IMODE(prior_file.stat().st_mode) == 0o444
+
+    # Objects prior: the store object is never linked into a tree snapshot.
+    vault = tmp_path / "ObjectsVault"
+    vault.mkdir()
+    BackupEngine(fs).execute(
+        BackupRequest(source_root=source, backup_root=vault, incremental=True, storage_layout="objects")
+    )
+    objects = {p: p.stat() for p in object_store_root(vault).rglob("*") if p.is_file()}
+    assert objects
+
+    tree = BackupEngine(fs).execute(BackupRequest(source_root=source, backup_root=vault, incremental=True))
+
+    assert tree.files_reused == 0
+    for p, st in objects.items():
+        after = p.stat()
+        assert (stat.S_IMODE(after.st_mode), after.st_nlink) == (stat.S_IMODE(st.st_mode), st.st_nlink)
+
+
+def test_backup_engine_incremental_ignores_other_sources(tmp_path: Path) -> None:
+    fs = OSFileSystem()
+    engine = BackupEngine(fs)
+
+    backup_root = tmp_path / "DevVault"
+    backup_root.mkdir()
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "f.txt").write_text(name, encoding="utf-8")
+
+    engine.execute(BackupRequest(source_root=tmp_path / "one", backup_root=backup_root, incremental=True))
+    res = engine.execute(BackupRequest(source_root=tmp_path / "two", backup_root=backup_root, incremental=True))
+
+    assert res.files_reused == 0
+    assert (res.backup_path / "f.txt").read_text(encoding="utf-8") == "two"
+
+
+def test_backup_engine_object_layout_dedupes_across_snapshots(tmp_path: Path) -> None:
+    from scanner.object_store import object_store_root
+    from scanner.restore_engine import RestoreEngine, RestoreRequest
+    from scanner.verify_engine import VerifyEngine, VerifyRequest
+
+    fs = OSFileSystem()
+    engine = BackupEngine(fs)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    (source / "sub").mkdir(parents=True)
+    backup_root.mkdir()
+    (source / "a.txt").write_text("shared\n", encoding="utf-8")
+    (source / "sub" / "copy-of-a.txt").write_text("shared\n", encoding="utf-8")
+    (source / "b.txt").write_text("b1\n", encoding="utf-8")
+
+    req = BackupRequest(source_root=source, backup_root=backup_root, storage_layout="objects")
+    first = engine.execute(req)
+    (source / "b.txt").write_text("b2\n", encoding="utf-8")
+    second = engine.execute(req)
+
+    # Snapshot directories only hold manifests; content lives once in the object store.
+    assert sorted(p.name for p in second.backup_path.iterdir()) == ["manifest.idx", "manifest.json", "summary.json"]
+    objects = [p for p in object_store_root(backup_root).rglob("*") if p.is_file()]
+    assert len(objects) == 3  # "shared", "b1", "b2"
+
+    for snap in (first.backup_path, second.backup_path):
+        assert VerifyEngine(fs).verify(VerifyRequest(snapshot_dir=snap)).files_verified == 3
+
+    dst = tmp_path / "restored"
+    RestoreEngine(fs).restore(RestoreRequest(snapshot_dir=second.backup_path, destination_dir=dst))
+    assert (dst / "sub" / "copy-of-a.txt").read_text(encoding="utf-8") == "shared\n"
+    assert (dst / "b.txt").read_text(encoding="utf-8") == "b2\n"
+
+
+@pytest.mark.parametrize("option", [{"storage_layout": "bogus"}, {"durability": "bogus"}])
+def test_backup_engine_rejects_unknown_options_before_creating_anything(tmp_path: Path, option: dict) -> None:
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    source.mkdir()
+    backup_root.mkdir()
+    (source / "a.txt").write_text("hello\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="Unsupported"):
+        BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=backup_root, **option))
+
+    snapshots = backup_root / ".devvault" / "snapshots"
+    assert not snapshots.exists() or list(snapshots.iterdir()) == []
+
+
+def test_backup_engine_object_layout_detects_damaged_object(tmp_path: Path) -> None:
+    from scanner.object_store import object_store_root
+    from scanner.verify_engine import VerifyEngine, VerifyRequest
+
+    fs = OSFileSystem()
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    source.mkdir()
+    backup_root.mkdir()
+    (source / "a.txt").write_text("hello\n", encoding="utf-8")
+
+    res = BackupEngine(fs).execute(
+        BackupRequest(source_root=source, backup_root=backup_root, storage_layout="objects")
+    )
+
+    (obj,) = [p for p in object_store_root(backup_root).rglob("*") if p.is_file()]
+    obj.write_text("HELLO\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        VerifyEngine(fs).verify(VerifyRequest(snapshot_dir=res.backup_path))
+
+
+def test_backup_engine_object_layout_replaces_rotted_object_of_same_size(tmp_path: Path) -> None:
+    from scanner.object_store import object_store_root
+    from scanner.verify_engine import VerifyEngine, VerifyRequest
+
+    fs = OSFileSystem()
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    source.mkdir()
+    backup_root.mkdir()
+    (source / "a.txt").write_text("hello\n", encoding="utf-8")
+    req = BackupRequest(source_root=source, backup_root=backup_root, storage_layout="objects")
+
+    first = BackupEngine(fs).execute(req)
+    (obj,) = [p for p in object_store_root(backup_root).rglob("*") if p.is_file()]
+    obj.write_text("HELLO\n", encoding="utf-8")
+
+    second = BackupEngine(fs).execute(req)
+
+    assert obj.read_text(encoding="utf-8") == "hello\n"
+    for snap in (first.backup_path, second.backup_path):
+        assert VerifyEngine(fs).verify(VerifyRequest(snapshot_dir=snap)).files_verified == 1
+    assert not list((object_store_root(backup_root) / ".incoming").iterdir())
+
+
+def test_backup_engine_parallel_copy_matches_serial_manifest(tmp_path: Path) -> None:
+    import json
+
+    fs = OSFileSystem()
+    engine = BackupEngine(fs)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    backup_root.mkdir()
+    for i in range(40):
+        d = source / f"d{i % 5}"
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f"f{i}.bin").write_bytes(bytes([i]) * (1000 + i * 37))
+
+    serial = engine.execute(BackupRequest(source_root=source, backup_root=backup_root))
+    parallel = engine.execute(
+        BackupRequest(
+            source_root=source,
+            backup_root=backup_root,
+            copy_workers=4,
+            max_inflight_bytes=4096,
+        )
+    )
+
+    def entries(snap: Path) -> list[tuple[str, int, str]]:
+        data = json.loads((snap / "manifest.json").read_text(encoding="utf-8"))
+        return [(f["path"], f["size"], f["digest_hex"]) for f in data["files"]]
+
+    assert entries(parallel.backup_path) == entries(serial.backup_path)
+    assert sum(w.files for w in parallel.worker_stats) == 40
+    assert sum(w.bytes for w in parallel.worker_stats) == sum(e[1] for e in entries(serial.backup_path))
+    assert serial.worker_stats == ()
+
+
+def test_backup_engine_parallel_copy_honours_cancel(tmp_path: Path) -> None:
+    fs = OSFileSystem()
+    engine = BackupEngine(fs)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    source.mkdir()
+    backup_root.mkdir()
+    for i in range(30):
+        (source / f"f{i}.txt").write_text("x" * 100, encoding="utf-8")
+
+    calls = {"n": 0}
+
+    def cancel_check() -> bool:
+        # Inventory polls once per node (31 here); cancel part-way through the copy phase.
+        calls["n"] += 1
+        return calls["n"] > 45
+
+    with pytest.raises(RuntimeError, match="Cancelled by operator"):
+        engine.execute(
+            BackupRequest(source_root=source, backup_root=backup_root, copy_workers=3),
+            cancel_check=cancel_check,
+        )
+
+    snaps = backup_root / ".devvault" / "snapshots"
+    assert [p for p in snaps.iterdir() if not p.name.startswith(".incomplete-")] == []
+
+
+def test_preflight_uses_cached_listing_metadata(tmp_path: Path) -> None:
+    class CountingFS(OSFileSystem):
+        def __init__(self) -> None:
+            self.path_calls = 0
+
+        def _count(self) -> None:
+            self.path_calls += 1
+
+        def is_dir(self, path: Path) -> bool:
+            self._count()
+            return super().is_dir(path)
+
+        def is_file(self, path: Path) -> bool:
+            self._count()
+            return super().is_file(path)
+
+        def is_symlink(self, path: Path) -> bool:
+            self._count()
+            return super().is_symlink(path)
+
+        def stat(self, path: Path):
+            self._count()
+            return super().stat(path)
+
+    source = tmp_path / "src"
+    for i in range(10):
+        d = source / f"d{i}"
+        d.mkdir(parents=True)
+        (d / "f.txt").write_text("x" * i, encoding="utf-8")
+
+    fs = CountingFS()
+    rep = BackupEngine(fs).preflight(BackupRequest(source_root=source, backup_root=tmp_path / "vault"))
+
+    assert rep.file_count == 10
+    assert rep.total_bytes == sum(range(10))
+    # Per-node type/stat answers come from scandir entries, not per-path calls.
+    assert fs.path_calls == 0
+
+
+def test_backup_engine_reuses_preflight_inventory(tmp_path: Path) -> None:
+    class ListingCountingFS(OSFileSystem):
+        def __init__(self) -> None:
+            self.listings = 0
+
+        def scandir(self, path: Path):
+            self.listings += 1
+            return super().scandir(path)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    (source / "a" / "b").mkdir(parents=True)
+    backup_root.mkdir()
+    (source / "top.txt").write_text("top", encoding="utf-8")
+    (source / "a" / "b" / "deep.txt").write_text("deep", encoding="utf-8")
+
+    fs = ListingCountingFS()
+    engine = BackupEngine(fs)
+    req = BackupRequest(source_root=source, backup_root=backup_root)
+
+    rep = engine.preflight(req)
+    assert rep.inventory is not None
+    assert rep.inventory.file_count == 2
+    walked = fs.listings
+
+    result = engine.execute(req, inventory=rep.inventory)
+
+    # execute() consumed the preflight traversal instead of walking the source again.
+    assert fs.listings == walked
+    assert (result.backup_path / "a" / "b" / "deep.txt").read_text(encoding="utf-8") == "deep"
+    assert (result.backup_path / "top.txt").read_text(encoding="utf-8") == "top"
+
+
+def test_backup_engine_rewalks_when_preflight_saw_unreadable_paths(tmp_path: Path) -> None:
+    import json
+
+    class FlakyListingFS(OSFileSystem):
+        def __init__(self, deny: Path) -> None:
+            self.deny: Path | None = deny
+
+        def scandir(self, path: Path):
+            if self.deny is not None and path == self.deny:
+                raise PermissionError(13, "denied", str(path))
+            return super().scandir(path)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    (source / "a").mkdir(parents=True)
+    backup_root.mkdir()
+    (source / "a" / "x.txt").write_text("x", encoding="utf-8")
+    (source / "b.txt").write_text("b", encoding="utf-8")
+
+    fs = FlakyListingFS(source.resolve() / "a")
+    engine = BackupEngine(fs)
+    req = BackupRequest(source_root=source, backup_root=backup_root)
+
+    rep = engine.preflight(req)
+    assert rep.unreadable_permission_denied == 1
+    assert rep.inventory.file_count == 1
+
+    fs.deny = None  # readable again by the time the backup runs
+    result = engine.execute(req, inventory=rep.inventory)
+
+    manifest = json.loads((result.backup_path / "manifest.json").read_text(encoding="utf-8"))
+    assert sorted(f["path"] for f in manifest["files"]) == ["a/x.txt", "b.txt"]
+
+
+def test_backup_engine_ignore_patterns_prune_traversal(tmp_path: Path) -> None:
+    import json
+
+    class ListingRecordingFS(OSFileSystem):
+        def __init__(self) -> None:
+            self.listed: list[str] = []
+
+        def scandir(self, path: Path):
+            self.listed.append(Path(path).name)
+            return super().scandir(path)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    (source / "node_modules" / "dep").mkdir(parents=True)
+    (source / "pkg").mkdir()
+    backup_root.mkdir()
+    (source / "node_modules" / "dep" / "index.js").write_text("x", encoding="utf-8")
+    (source / "pkg" / "mod.py").write_text("py", encoding="utf-8")
+    (source / "pkg" / "mod.pyc").write_text("pyc", encoding="utf-8")
+    (source / ".devvaultignore").write_text("*.pyc\n", encoding="utf-8")
+
+    fs = ListingRecordingFS()
+    engine = BackupEngine(fs)
+    req = BackupRequest(
+        source_root=source,
+        backup_root=backup_root,
+        ignore_patterns=("node_modules/",),
+        use_ignore_files=True,
+    )
+
+    rep = engine.preflight(req)
+    assert rep.file_count == 2  # .devvaultignore + pkg/mod.py
+    assert rep.ignored_count == 2
+
+    result = engine.execute(req)
+
+    # Ignored directories are never listed, in preflight or in the backup.
+    assert "node_modules" not in fs.listed
+    assert "dep" not in fs.listed
+
+    manifest = json.loads((result.backup_path / "manifest.json").read_text(encoding="utf-8"))
+    assert sorted(f["path"] for f in manifest["files"]) == [".devvaultignore", "pkg/mod.py"]
+    assert manifest["ignore_patterns"] == ["*.pyc", "node_modules/"]
+    assert not (result.backup_path / "node_modules").exists()
+    assert not (result.backup_path / "pkg" / "mod.pyc").exists()
+
+
+def test_backup_engine_batched_durability_syncs_once_before_finalize(tmp_path: Path) -> None:
+    class RecordingFS(OSFileSystem):
+        def __init__(self) -> None:
+            self.durable_flags: list[bool] = []
+            self.events: list[tuple] = []
+
+        def copy_file_hashed(self, src, dst, *, algo="sha256", cancel_check=None, durable=True):
+            self.durable_flags.append(durable)
+            return super().copy_file_hashed(src, dst, algo=algo, cancel_check=cancel_check, durable=durable)
+
+        def sync_barrier(self, *, files=(), dirs=()):
+            files, dirs = list(files), list(dirs)
+            self.events.append(("sync", files, dirs))
+            super().sync_barrier(files=files, dirs=dirs)
+
+        def rename(self, src, dst):
+            self.events.append(("rename", Path(src), Path(dst)))
+            super().rename(src, dst)
+
+    source = tmp_path / "src"
+    backup_root = tmp_path / "DevVault"
+    (source / "sub").mkdir(parents=True)
+    backup_root.mkdir()
+    (source / "a.txt").write_text("a", encoding="utf-8")
+    (source / "sub" / "b.txt").write_text("b", encoding="utf-8")
+
+    fs = RecordingFS()
+    result = BackupEngine(fs).execute(
+        BackupRequest(source_root=source, backup_root=backup_root, durability="batched")
+    )
+
+    assert fs.durable_flags == [False, False]
+
+    finalize = next(i for i, e in enumerate(fs.events) if e[0] == "rename" and e[2] == result.backup_path)
+    kind, files, dirs = fs.events[finalize - 1]
+    assert kind == "sync"
+    incomplete = fs.events[finalize][1]
+    assert {p.relative_to(incomplete).as_posix() for p in files} == {"a.txt", "sub/b.txt", "manifest.json", "manifest.idx", "summary.json"}
+    assert incomplete in dirs and incomplete / "sub" in dirs
+    # The committing rename itself is flushed via the parent directory.
+    assert fs.events[finalize + 1] == ("sync", [], [result.backup_path.parent])
+
+
+def test_backup_engine_rejects_unknown_durability_mode(tmp_path: Path) -> None:
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.txt").write_text("a", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="durability"):
+        BackupEngine(OSFileSystem()).execute(
+            BackupRequest(source_root=source, backup_root=tmp_path / "vault", durability="never")
+        )
@@ -93,3 +93,36 @@ def test_backup_age_days_handles_naive_timestamp():
 def test_backup_age_days_invalid_returns_none():
     assert backup_age_days("not-a-date") is None
     assert backup_age_days("") is None
+
+
+def test_coverage_pass_reads_each_snapshot_metadata_once(tmp_path, monkeypatch):
+    from devvault_desktop import coverage_assurance as ca
+    from devvault_desktop.config import set_vault_dir
+    from scanner.adapters.filesystem import OSFileSystem
+    from scanner.backup_engine import BackupEngine
+    from scanner.models.backup import BackupRequest
+
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    for name in ("a", "a", "b"):
+        src = tmp_path / "sources" / name
+        src.mkdir(parents=True, exist_ok=True)
+        (src / "main.py").write_text("print('hi')\n")
+        BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=src, backup_root=vault))
+    set_vault_dir(str(vault))
+    scan_root = tmp_path / "scan"
+    scan_root.mkdir()
+
+    reads = []
+
+    def counting_read(*, fs, snapshot_dir):
+        reads.append(snapshot_dir)
+        return read_snapshot_metadata(fs=fs, snapshot_dir=snapshot_dir)
+
+    read_snapshot_metadata = ca.read_snapshot_metadata
+    monkeypatch.setattr(ca, "read_snapshot_metadata", counting_read)
+
+    result = compute_uncovered_candidates(scan_roots=[scan_root], depth=2, top=10)
+
+    assert result.uncovered == []
+    assert len(reads) == 3
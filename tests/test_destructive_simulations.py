@@ -51,7 +51,7 @@ def _snapshot_dir_from_backup_json(stdout: str, backup_root: Path) -> Path:
 
 def _find_any_payload_file(snapshot_dir: Path) -> Path:
     """Find a file we can corrupt that should be covered by integrity verification."""
-    skip = {"manifest.json", "manifest.hmac", "backup.json"}
+    skip = {"manifest.json", "manifest.idx", "summary.json", "manifest.hmac", "backup.json"}
     for p in snapshot_dir.rglob("*"):
         if p.is_file() and p.name not in skip:
             return p
@@ -0,0 +1,138 @@
+import errno
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+import scanner.adapters.filesystem as fsmod
+from scanner.adapters.filesystem import OSFileSystem
+
+
+def _payload(size: int) -> bytes:
+    return (b"devvault-" * (size // 9 + 1))[:size]
+
+
+@pytest.mark.parametrize("size", [0, 1, 3 * 1024 * 1024 + 17])
+def test_copy_file_copies_exact_bytes(tmp_path: Path, size: int) -> None:
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(_payload(size))
+
+    OSFileSystem().copy_file(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_finishes_in_userspace_when_kernel_copy_gives_up(tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    data = _payload(2 * 1024 * 1024 + 5)
+    src.write_bytes(data)
+
+    calls = {"n": 0}
+
+    def partial_then_exdev(rfd: int, wfd: int, offset: int) -> int:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return os.pwrite(wfd, os.pread(rfd, 1000, offset), offset)
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(fsmod, "_KERNEL_COPY_METHODS", (partial_then_exdev,))
+    OSFileSystem().copy_file(src, dst)
+
+    assert calls["n"] == 2
+    assert dst.read_bytes() == data
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="no copy_file_range")
+@pytest.mark.parametrize("sendfile_copies", [True, False])
+def test_copy_file_does_not_trust_a_zero_return_before_the_end(
+    tmp_path: Path, monkeypatch, sendfile_copies: bool
+) -> None:
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    data = _payload(64 * 1024 + 3)
+    src.write_bytes(data)
+
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0)
+    if not sendfile_copies:
+        monkeypatch.setattr(fsmod, "_KERNEL_COPY_METHODS", (fsmod._copy_file_range_chunk,))
+    OSFileSystem().copy_file(src, dst)
+
+    assert dst.read_bytes() == data
+
+
+def test_copy_file_propagates_real_io_errors(tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"x" * 10)
+
+    def failing(rfd: int, wfd: int, offset: int) -> int:
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(fsmod, "_KERNEL_COPY_METHODS", (failing,))
+    with pytest.raises(OSError):
+        OSFileSystem().copy_file(src, tmp_path / "dst.bin")
+
+
+@pytest.mark.parametrize("kernel", [True, False])
+def test_copy_file_honours_cancel(tmp_path: Path, monkeypatch, kernel: bool) -> None:
+    if not kernel:
+        monkeypatch.setattr(fsmod, "_KERNEL_COPY_METHODS", ())
+    src = tmp_path / "src.bin"
+    src.write_bytes(_payload(20 * 1024 * 1024))
+
+    calls = {"n": 0}
+
+    def cancel_after_first_chunk() -> bool:
+        calls["n"] += 1
+        return calls["n"] > 1
+
+    with pytest.raises(RuntimeError, match="Cancelled"):
+        OSFileSystem().copy_file(src, tmp_path / "dst.bin", cancel_check=cancel_after_first_chunk)
+
+
+def test_copy_file_hashed_digest_matches_written_bytes(tmp_path: Path) -> None:
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    data = _payload(1024 * 1024 * 2 + 3)
+    src.write_bytes(data)
+
+    hc = OSFileSystem().copy_file_hashed(src, dst)
+
+    assert hc.size == len(data)
+    assert hc.digest.hex == hashlib.sha256(data).hexdigest()
+    assert dst.read_bytes() == data
+
+
+def test_copy_file_hashed_exclusive_refuses_existing_entries(tmp_path: Path) -> None:
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"new")
+    target = tmp_path / "target.bin"
+    target.write_bytes(b"precious")
+    link = tmp_path / "link.bin"
+    try:
+        os.symlink(target, link)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+
+    for dst in (link, target):
+        with pytest.raises(FileExistsError):
+            OSFileSystem().copy_file_hashed(src, dst, exclusive=True)
+    assert target.read_bytes() == b"precious"
+
+
+def test_sync_barrier_flushes_files_and_directories(tmp_path: Path) -> None:
+    files = []
+    for i in range(70):  # enough to take the whole-filesystem path where available
+        p = tmp_path / f"f{i}.bin"
+        p.write_bytes(b"x")
+        files.append(p)
+
+    fs = OSFileSystem()
+    fs.sync_barrier(files=files, dirs=[tmp_path])
+    fs.sync_barrier(files=files[:2], dirs=[tmp_path])
+    fs.sync_barrier()
+
+    with pytest.raises(OSError):
+        fs.sync_barrier(files=[tmp_path / "missing.bin"])
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.ignore_rules import IgnoreMatcher, read_ignore_files
+
+
+def test_unanchored_name_matches_at_any_depth() -> None:
+    m = IgnoreMatcher(["node_modules/", "*.pyc"])
+
+    assert m.is_ignored("node_modules", is_dir=True)
+    assert m.is_ignored("web/app/node_modules", is_dir=True)
+    # Trailing slash: directories only.
+    assert not m.is_ignored("node_modules", is_dir=False)
+    assert m.is_ignored("pkg/__pycache__/mod.pyc", is_dir=False)
+    assert not m.is_ignored("pkg/mod.py", is_dir=False)
+
+
+def test_slash_anchors_pattern_to_source_root() -> None:
+    m = IgnoreMatcher(["/build", "docs/*.tmp"])
+
+    assert m.is_ignored("build", is_dir=True)
+    assert not m.is_ignored("src/build", is_dir=True)
+    assert m.is_ignored("docs/a.tmp", is_dir=False)
+    assert not m.is_ignored("docs/sub/a.tmp", is_dir=False)
+    assert not m.is_ignored("other/docs/a.tmp", is_dir=False)
+
+
+def test_double_star_and_negation() -> None:
+    m = IgnoreMatcher(["**/cache/**", "*.log", "!keep.log", "# comment", ""])
+
+    assert m.patterns == ("**/cache/**", "*.log", "!keep.log")
+    assert m.is_ignored("a/cache/x/y.bin", is_dir=False)
+    assert m.is_ignored("cache/y.bin", is_dir=False)
+    assert m.is_ignored("logs/run.log", is_dir=False)
+    # Last matching rule wins.
+    assert not m.is_ignored("logs/keep.log", is_dir=False)
+
+
+def test_empty_matcher_ignores_nothing() -> None:
+    m = IgnoreMatcher()
+    assert not m
+    assert not m.is_ignored("anything", is_dir=True)
+
+
+def test_read_ignore_files_reads_root_ignore_files(tmp_path: Path) -> None:
+    (tmp_path / ".gitignore").write_text("dist/\n", encoding="utf-8")
+    (tmp_path / ".devvaultignore").write_text("*.iso\n", encoding="utf-8")
+
+    assert read_ignore_files(fs=OSFileSystem(), source_root=tmp_path) == ["dist/", "*.iso"]
+    assert read_ignore_files(fs=OSFileSystem(), source_root=tmp_path / "missing") == []
+
+
+def test_bracket_classes_with_leading_close_bracket() -> None:
+    m = IgnoreMatcher(["[]a]x", "[!]b]y", "z[]"])
+
+    assert m.is_ignored("]x", is_dir=False)
+    assert m.is_ignored("ax", is_dir=False)
+    assert not m.is_ignored("bx", is_dir=False)
+    assert m.is_ignored("cy", is_dir=False)
+    assert not m.is_ignored("]y", is_dir=False)
+    assert not m.is_ignored("by", is_dir=False)
+    # No closing bracket: "[" and "]" are literal text.
+    assert m.is_ignored("z[]", is_dir=False)
+
+
+def test_unusable_class_falls_back_to_literal_match() -> None:
+    m = IgnoreMatcher(["[z-a].txt", "*.log"])
+
+    assert m.patterns == ("[z-a].txt", "*.log")
+    assert m.is_ignored("[z-a].txt", is_dir=False)
+    assert not m.is_ignored("b.txt", is_dir=False)
+    assert m.is_ignored("run.log", is_dir=False)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.manifest_cache import MANIFEST_CACHE, ManifestCache
+from scanner.snapshot_metadata import read_snapshot_metadata
+
+
+class CountingFS(OSFileSystem):
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def read_text(self, path: Path, *, encoding: str = "utf-8") -> str:
+        self.reads += 1
+        return super().read_text(path, encoding=encoding)
+
+
+def _write_manifest(path: Path, sizes: list[int]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"manifest_version": 2, "files": [{"path": f"f{i}", "size": s} for i, s in enumerate(sizes)]}),
+        encoding="utf-8",
+    )
+
+
+def test_cache_serves_repeat_reads_and_revalidates_on_change(tmp_path: Path) -> None:
+    cache = ManifestCache()
+    fs = CountingFS()
+    p = tmp_path / "manifest.json"
+    _write_manifest(p, [1, 2])
+
+    first = cache.load(fs, p)
+    assert cache.load(fs, p) is first
+    assert fs.reads == 1
+
+    _write_manifest(p, [1, 2, 3, 4])
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert len(cache.load(fs, p)["files"]) == 4
+    assert fs.reads == 2
+
+
+def test_cache_is_bounded_by_approximate_size(tmp_path: Path) -> None:
+    fs = CountingFS()
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"s{i}" / "manifest.json"
+        _write_manifest(p, list(range(50)))
+        paths.append(p)
+
+    one = len(paths[0].read_bytes()) * 6
+    cache = ManifestCache(max_bytes=one * 2)
+    for p in paths:
+        cache.load(fs, p)
+
+    assert len(cache) == 2
+    assert cache.approx_bytes <= cache.max_bytes
+    # Least recently used entries were evicted; the newest are still served from memory.
+    reads = fs.reads
+    cache.load(fs, paths[-1])
+    assert fs.reads == reads
+    cache.load(fs, paths[0])
+    assert fs.reads == reads + 1
+
+
+def test_snapshot_metadata_is_memoized_per_manifest_version(tmp_path: Path) -> None:
+    MANIFEST_CACHE.clear()
+    fs = CountingFS()
+    snap = tmp_path / "20260101T000000Z-abcdef01 - proj - backup"
+    _write_manifest(snap / "manifest.json", [3, 4])
+
+    md1 = read_snapshot_metadata(fs=fs, snapshot_dir=snap)
+    md2 = read_snapshot_metadata(fs=fs, snapshot_dir=snap)
+
+    assert md1 is md2
+    assert (md1.file_count, md1.total_bytes) == (2, 7)
+    assert fs.reads == 1
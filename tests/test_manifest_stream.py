@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import scanner.manifest_stream as ms
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.integrity_keys import ManifestHmacKey
+from scanner.manifest_integrity import add_integrity_block
+from scanner.manifest_stream import (
+    verify_manifest_file_integrity,
+    verify_manifest_text_integrity,
+    write_manifest_stream,
+)
+
+KEY = ManifestHmacKey(key_bytes=b"k" * 32)
+
+HEADER = {
+    "manifest_version": 2,
+    "backup_id": "20260101T000000Z-abcdef01",
+    "source_root": "/home/dev/proj",
+    "source_name": "proj",
+    "display_name": "proj - backup",
+    "checksum_algo": "sha256",
+    "ignore_patterns": ["node_modules/", "*.pyc"],
+    "storage_layout": "objects",
+    "business_identity": {"seat_id": "s1", "hostname": None, "fleet_id": "fé"},
+}
+
+
+def _files(n: int) -> list[dict]:
+    return [
+        {"path": f"dir/ü{i}.txt", "size": i, "type": "file", "digest_hex": f"{i:064x}", "mtime_ns": i, "inode": i}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("key", [KEY, None])
+@pytest.mark.parametrize("n", [0, 1, 5])
+def test_stream_writer_matches_canonical_manifest_bytes(tmp_path: Path, key, n: int) -> None:
+    path = tmp_path / "manifest.json"
+    files = _files(n)
+
+    integrity = write_manifest_stream(OSFileSystem(), path, header=HEADER, files=iter(files), hmac_key=key)
+
+    expected = add_integrity_block({**HEADER, "files": files}, hmac_key=key)
+    assert integrity == expected["manifest_integrity"]
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=2, sort_keys=True)
+
+
+def _write(tmp_path: Path, header=HEADER, key=KEY) -> Path:
+    path = tmp_path / "manifest.json"
+    write_manifest_stream(OSFileSystem(), path, header=header, files=_files(50), hmac_key=key)
+    return path
+
+
+def _text_verdict(text: str, key=KEY):
+    return verify_manifest_text_integrity(text, hmac_key=key, manifest=json.loads(text))
+
+
+def test_stream_verifier_accepts_and_rejects(tmp_path: Path, monkeypatch) -> None:
+    text = _write(tmp_path).read_text(encoding="utf-8")
+
+    assert _text_verdict(text) == (True, "ok")
+    assert _text_verdict(text, key=None) == (False, "missing-hmac-key")
+    assert _text_verdict(text, key=ManifestHmacKey(key_bytes=b"x" * 32)) == (False, "manifest-integrity-mismatch")
+    assert _text_verdict(text.replace('"size": 7,', '"size": 8,')) == (False, "manifest-integrity-mismatch")
+
+    # Tiny chunks: the integrity marker straddles chunk boundaries.
+    monkeypatch.setattr(ms, "_CHUNK", 7)
+    assert _text_verdict(text) == (True, "ok")
+    assert verify_manifest_file_integrity(OSFileSystem(), tmp_path / "manifest.json", hmac_key=KEY) == (True, "ok")
+
+
+def test_stream_verifier_does_not_parse_canonical_manifests(tmp_path: Path) -> None:
+    text = _write(tmp_path).read_text(encoding="utf-8")
+
+    def no_parse():
+        raise AssertionError("canonical manifest must not need a parse")
+
+    chunks = iter([text.encode("utf-8")])
+    assert ms._verify_chunks(chunks, hmac_key=KEY, fallback=no_parse) == (True, "ok")
+
+
+def test_stream_verifier_falls_back_for_non_canonical_layout(tmp_path: Path) -> None:
+    text = _write(tmp_path).read_text(encoding="utf-8")
+    reformatted = json.dumps(json.loads(text), indent=4)
+
+    assert _text_verdict(reformatted) == (True, "ok")
+
+    # Integrity as the last key (older writer without later header keys) also streams.
+    last = {k: v for k, v in HEADER.items() if k < "manifest_integrity"}
+    text_last = _write(tmp_path, header=last).read_text(encoding="utf-8")
+    assert text_last.endswith("  }\n}")
+    assert _text_verdict(text_last) == (True, "ok")
+
+    unsealed = json.dumps({**HEADER, "files": []}, indent=2, sort_keys=True)
+    assert _text_verdict(unsealed) == (True, "no-integrity")
+
+
+def test_stream_verifier_handles_sha256_sealed_manifests(tmp_path: Path) -> None:
+    text = _write(tmp_path, key=None).read_text(encoding="utf-8")
+
+    assert _text_verdict(text, key=None) == (True, "ok")
+    # Same answer as the dict-based check when a key is available.
+    assert _text_verdict(text, key=KEY) == (True, "ok")
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.backup_engine import BackupEngine
+from scanner.integrity_keys import load_manifest_hmac_key
+from scanner.models.backup import BackupRequest
+from scanner.path_index import (
+    PATH_INDEX_NAME,
+    PathIndex,
+    PathIndexError,
+    lookup_snapshot_path,
+    open_path_index,
+    read_indexed_selection,
+    write_path_index,
+)
+from scanner.manifest_stream import read_manifest_integrity_tail
+
+
+def _backup(tmp_path: Path, name: str = "src") -> tuple[Path, Path, list[str]]:
+    source = tmp_path / name
+    vault = tmp_path / "vault"
+    vault.mkdir(exist_ok=True)
+    paths = []
+    for d in range(3):
+        for i in range(150):  # several index blocks
+            rel = f"d{d}/f{i:03d}.txt"
+            (source / rel).parent.mkdir(parents=True, exist_ok=True)
+            (source / rel).write_text(f"{name}-{rel}", encoding="utf-8")
+            paths.append(rel)
+    # Sorts between "d0" and "d0/": must not leak into the d0 subtree.
+    (source / "d0-notes.txt").write_text("n", encoding="utf-8")
+    (source / "d0.txt").write_text("n", encoding="utf-8")
+    paths += ["d0-notes.txt", "d0.txt"]
+
+    result = BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault))
+    return result.backup_path, vault, paths
+
+
+def test_path_index_lookup_and_subtree(tmp_path: Path) -> None:
+    snap, vault, paths = _backup(tmp_path)
+    key = load_manifest_hmac_key(vault_root=vault)
+    index = PathIndex.open(OSFileSystem(), snap, hmac_key=key)
+
+    assert len(index) == len(paths)
+    assert index.header["manifest_version"] == 2
+    assert index.header["source_name"] == "src"
+    assert "files" not in index.header and "manifest_integrity" not in index.header
+    assert index.total_bytes == sum(len(f"src-{p}") for p in paths if "/" in p) + 2
+    hit = index.lookup("d1/f042.txt")
+    assert hit is not None
+    assert hit["size"] == len("src-d1/f042.txt")
+    assert isinstance(hit["mtime_ns"], int) and isinstance(hit["inode"], int)
+    assert index.contains("d0.txt")
+    assert not index.contains("d1/missing.txt")
+    assert not index.contains("d1")
+
+    sub = [e["path"] for e in index.iter_subtree("d0")]
+    assert sub == sorted(p for p in paths if p.startswith("d0/"))
+    assert [e["path"] for e in index.iter_subtree("d2/f149.txt")] == ["d2/f149.txt"]
+    assert len(list(index.iter_subtree(""))) == len(paths)
+
+
+def test_path_index_lookup_does_not_parse_manifest(tmp_path: Path) -> None:
+    snap, vault, _paths = _backup(tmp_path)
+
+    class NoManifestParseFS(OSFileSystem):
+        def read_text(self, path: Path, *, encoding: str = "utf-8") -> str:
+            raise AssertionError("manifest.json must not be parsed")
+
+    key = load_manifest_hmac_key(vault_root=vault)
+    entry = lookup_snapshot_path(NoManifestParseFS(), snap, "d2/f007.txt", hmac_key=key)
+    assert entry is not None and entry["path"] == "d2/f007.txt"
+
+
+def test_path_index_rejects_tampering_and_foreign_index(tmp_path: Path) -> None:
+    snap_a, vault, _ = _backup(tmp_path, "a")
+    snap_b, _, _ = _backup(tmp_path, "b")
+    key = load_manifest_hmac_key(vault_root=vault)
+    fs = OSFileSystem()
+
+    # An index copied from another snapshot does not bind to this manifest.
+    shutil.copyfile(snap_a / PATH_INDEX_NAME, snap_b / PATH_INDEX_NAME)
+    assert open_path_index(fs, snap_b, hmac_key=key) is None
+    # Lookups still work from the manifest.
+    assert lookup_snapshot_path(fs, snap_b, "d0/f001.txt", hmac_key=key)["path"] == "d0/f001.txt"
+
+    idx = snap_a / PATH_INDEX_NAME
+    data = bytearray(idx.read_bytes())
+    data[40] ^= 0xFF  # inside the first block
+    idx.write_bytes(bytes(data))
+    index = PathIndex.open(fs, snap_a, hmac_key=key)
+    with pytest.raises(PathIndexError):
+        index.lookup("d0/f000.txt")
+
+    (snap_a / PATH_INDEX_NAME).unlink()
+    assert open_path_index(fs, snap_a, hmac_key=key) is None
+    assert lookup_snapshot_path(fs, snap_a, "nope", hmac_key=key) is None
+
+
+def test_path_index_selection_without_manifest_and_forged_index(tmp_path: Path) -> None:
+    snap, vault, _paths = _backup(tmp_path)
+    key = load_manifest_hmac_key(vault_root=vault)
+
+    class NoManifestParseFS(OSFileSystem):
+        def read_text(self, path: Path, *, encoding: str = "utf-8") -> str:
+            raise AssertionError("manifest.json must not be parsed")
+
+    planned = read_indexed_selection(NoManifestParseFS(), snap, ("d1/f00*",), hmac_key=key)
+    assert planned is not None and planned["backup_id"]
+    assert [e["path"] for e in planned["files"]] == [f"d1/f00{i}.txt" for i in range(10)]
+
+    # An index rebuilt without the vault key (sha256 MACs only) is not accepted.
+    fs = OSFileSystem()
+    digest_hex = read_manifest_integrity_tail(fs, snap / "manifest.json")["digest_hex"]
+    forged = {"path": "d1/f000.txt", "size": 1, "type": "file", "digest_hex": "0" * 64}
+    write_path_index(
+        fs,
+        snap / PATH_INDEX_NAME,
+        header=planned,
+        entries=[forged],
+        manifest_digest_hex=digest_hex,
+        hmac_key=None,
+    )
+    assert open_path_index(fs, snap, hmac_key=key) is None
+    assert read_indexed_selection(fs, snap, ("d1",), hmac_key=key) is None
@@ -124,3 +124,129 @@ def test_restore_rejects_path_traversal_manifest(tmp_path: Path) -> None:
 
     # Fail-closed: destination should not be created as a side effect of invalid manifest.
     assert not restore_dest.exists()
+
+
+def _many_file_snapshot(tmp_path: Path) -> tuple[Path, Path]:
+    source = tmp_path / "source"
+    for d in range(4):
+        (source / f"d{d}").mkdir(parents=True)
+        for i in range(10):
+            (source / f"d{d}" / f"f{i}.bin").write_bytes(bytes([d, i]) * (100 * (i + 1)))
+    backups_root = tmp_path / "backups"
+    backups_root.mkdir()
+    result = BackupEngine(fs=OSFileSystem()).execute(_BackupReq(source_root=source, backup_root=backups_root))
+    return source, result.backup_path
+
+
+def test_restore_parallel_round_trip(tmp_path: Path) -> None:
+    source, snapshot_dir = _many_file_snapshot(tmp_path)
+    dest = tmp_path / "restore_dest"
+
+    RestoreEngine(fs=OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot_dir, destination_dir=dest, workers=4))
+
+    for f in source.rglob("*.bin"):
+        assert (dest / f.relative_to(source)).read_bytes() == f.read_bytes()
+    assert not (tmp_path / "restore_dest.devvault.staging").exists()
+    mapping = (dest / "_restore_manifest.txt").read_text(encoding="utf-8").split("Mapping:\n", 1)[1].split()
+    # Mappings stay in manifest order regardless of completion order.
+    restored = [p for p in mapping if p != "->"][::2]
+    manifest = json.loads((snapshot_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert restored == [f["path"] for f in manifest["files"]]
+
+
+def test_restore_parallel_failure_promotes_nothing(tmp_path: Path) -> None:
+    import pytest
+
+    _source, snapshot_dir = _many_file_snapshot(tmp_path)
+    victim = snapshot_dir / "d2" / "f5.bin"
+    data = victim.read_bytes()
+    victim.write_bytes(bytes([data[0] ^ 0xFF]) + data[1:])
+    dest = tmp_path / "restore_dest"
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        RestoreEngine(fs=OSFileSystem()).restore(
+            RestoreRequest(snapshot_dir=snapshot_dir, destination_dir=dest, workers=4)
+        )
+
+    assert not dest.exists()
+    staging = tmp_path / "restore_dest.devvault.staging"
+    assert not list(staging.rglob("*.devvault.tmp"))
+
+
+def test_restore_preflight_lists_each_snapshot_directory_once(tmp_path: Path) -> None:
+    import pytest
+
+    from scanner.errors import SnapshotCorrupt
+
+    class CountingFS(OSFileSystem):
+        def __init__(self, snapshot_dir: Path) -> None:
+            self.snapshot_dir = snapshot_dir
+            self.per_file_calls = 0
+            self.listed: list[Path] = []
+
+        def _count(self, path: Path) -> None:
+            if self.snapshot_dir in path.parents and path.suffix == ".bin":
+                self.per_file_calls += 1
+
+        def exists(self, path: Path) -> bool:
+            self._count(path)
+            return super().exists(path)
+
+        def is_file(self, path: Path) -> bool:
+            self._count(path)
+            return super().is_file(path)
+
+        def stat(self, path: Path):
+            self._count(path)
+            return super().stat(path)
+
+        def scandir(self, path: Path):
+            self.listed.append(path)
+            return super().scandir(path)
+
+    _source, snapshot_dir = _many_file_snapshot(tmp_path)
+    fs = CountingFS(snapshot_dir)
+
+    RestoreEngine(fs=fs).restore(RestoreRequest(snapshot_dir=snapshot_dir, destination_dir=tmp_path / "dest"))
+
+    assert fs.per_file_calls == 0
+    assert sorted(fs.listed) == [snapshot_dir / f"d{d}" for d in range(4)]
+
+    # Still fails closed, before the destination exists.
+    (snapshot_dir / "d3" / "f9.bin").unlink()
+    with pytest.raises(SnapshotCorrupt, match="referenced file missing"):
+        RestoreEngine(fs=CountingFS(snapshot_dir)).restore(
+            RestoreRequest(snapshot_dir=snapshot_dir, destination_dir=tmp_path / "dest2")
+        )
+    assert not (tmp_path / "dest2").exists()
+
+
+def test_restore_preflight_does_not_list_object_shards(tmp_path: Path) -> None:
+    from scanner.models.backup import BackupRequest
+    from scanner.object_store import object_store_root
+
+    class ListingFS(OSFileSystem):
+        def __init__(self) -> None:
+            self.listed: list[Path] = []
+
+        def scandir(self, path: Path):
+            self.listed.append(path)
+            return super().scandir(path)
+
+    source = tmp_path / "src"
+    source.mkdir()
+    for i in range(20):
+        (source / f"f{i}.txt").write_text(f"file {i}\n", encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    res = BackupEngine(OSFileSystem()).execute(
+        BackupRequest(source_root=source, backup_root=vault, storage_layout="objects")
+    )
+
+    fs = ListingFS()
+    dst = tmp_path / "dest"
+    RestoreEngine(fs=fs).restore(RestoreRequest(snapshot_dir=res.backup_path, destination_dir=dst))
+
+    store = object_store_root(vault)
+    assert not [p for p in fs.listed if p == store or store in p.parents]
+    assert (dst / "f7.txt").read_text(encoding="utf-8") == "file 7\n"
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from devvault.cli import main
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.backup_engine import BackupEngine
+from scanner.errors import RestoreRefused, SnapshotCorrupt
+from scanner.models.backup import BackupRequest
+from scanner.path_index import PATH_INDEX_NAME
+from scanner.restore_engine import RestoreEngine, RestoreRequest
+from scanner.restore_selection import normalize_selectors, path_selected, selection_roots
+
+
+class ManifestReadCountingFS(OSFileSystem):
+    def __init__(self) -> None:
+        self.manifest_reads = 0
+
+    def read_text(self, path: Path, *args, **kwargs) -> str:
+        if path.name == "manifest.json":
+            self.manifest_reads += 1
+        return super().read_text(path, *args, **kwargs)
+
+
+def _snapshot(tmp_path: Path) -> Path:
+    source = tmp_path / "src"
+    for rel, text in {
+        "README.md": "readme",
+        "pkg/app.py": "app",
+        "pkg/util.py": "util",
+        "pkg/data/blob.bin": "blob",
+        "pkgs/other.py": "other",
+        "docs/guide.md": "guide",
+    }.items():
+        (source / rel).parent.mkdir(parents=True, exist_ok=True)
+        (source / rel).write_text(text, encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    return BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path
+
+
+def _restored(dst: Path) -> list[str]:
+    return sorted(p.relative_to(dst).as_posix() for p in dst.rglob("*") if p.is_file() and p.name != "_restore_manifest.txt")
+
+
+def test_selectors_normalize_and_match() -> None:
+    assert normalize_selectors(["./pkg/", "pkg", "docs\\guide.md"]) == ("pkg", "docs/guide.md")
+    for bad in ("", "/etc", "../x", "a/../../b"):
+        with pytest.raises(RuntimeError, match="Unsupported restore selector"):
+            normalize_selectors([bad])
+
+    assert path_selected("pkg/data/blob.bin", ("pkg",))
+    assert not path_selected("pkgs/other.py", ("pkg",))
+    assert path_selected("pkg/data/blob.bin", ("pkg/d*",))
+    assert selection_roots(["pkg/*.py", "pkg/data", "*.md"]) == [""]
+    assert selection_roots(["pkg/*.py", "pkg/data/blob.bin", "docs"]) == ["docs", "pkg"]
+
+
+@pytest.mark.parametrize("with_index", [True, False])
+def test_selective_restore_copies_only_matches(tmp_path: Path, with_index: bool) -> None:
+    snapshot = _snapshot(tmp_path)
+    if not with_index:
+        (snapshot / PATH_INDEX_NAME).unlink()
+    dst = tmp_path / "dst"
+    fs = ManifestReadCountingFS()
+
+    RestoreEngine(fs).restore(
+        RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, include=("pkg/*.py", "README.md"))
+    )
+
+    assert _restored(dst) == ["README.md", "pkg/app.py", "pkg/util.py"]
+    assert (dst / "pkg" / "app.py").read_text(encoding="utf-8") == "app"
+    mapping = (dst / "_restore_manifest.txt").read_text(encoding="utf-8")
+    assert "pkgs/other.py" not in mapping
+    # With an index the file list is never parsed out of manifest.json.
+    assert (fs.manifest_reads == 0) is with_index
+
+
+def test_selective_restore_checks_only_selected_files(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path)
+    (snapshot / "docs" / "guide.md").write_text("GUIDE", encoding="utf-8")  # same size, other bytes
+
+    dst = tmp_path / "dst"
+    RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, include=("pkg",)))
+    assert _restored(dst) == ["pkg/app.py", "pkg/data/blob.bin", "pkg/util.py"]
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        RestoreEngine(OSFileSystem()).restore(
+            RestoreRequest(snapshot_dir=snapshot, destination_dir=tmp_path / "dst2", include=("docs",))
+        )
+    assert not (tmp_path / "dst2").exists()
+
+
+def test_selective_restore_refuses_empty_selection(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path)
+    dst = tmp_path / "dst"
+
+    with pytest.raises(RestoreRefused, match="No snapshot entries match"):
+        RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, include=("nope",)))
+    assert not dst.exists()
+
+
+def test_selective_restore_trusts_signed_index_not_manifest_body(tmp_path: Path) -> None:
+    snapshot = _snapshot(tmp_path)
+    manifest_path = snapshot / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    next(f for f in manifest["files"] if f["path"] == "docs/guide.md")["size"] += 1
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+    # The selection is answered by the signed index; the altered file list is never read.
+    dst = tmp_path / "dst"
+    RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, include=("docs",)))
+    assert (dst / "docs" / "guide.md").read_text(encoding="utf-8") == "guide"
+
+    # Reading the whole manifest authenticates it, and refuses.
+    with pytest.raises(SnapshotCorrupt, match="integrity check failed"):
+        RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=tmp_path / "dst2"))
+
+    # A manifest sealed with another digest no longer binds the index: back to the manifest.
+    manifest["manifest_integrity"]["digest_hex"] = "0" * 64
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    with pytest.raises(SnapshotCorrupt, match="integrity check failed"):
+        RestoreEngine(OSFileSystem()).restore(
+            RestoreRequest(snapshot_dir=snapshot, destination_dir=tmp_path / "dst3", include=("pkg",))
+        )
+
+
+def test_cli_restore_include(tmp_path: Path, capsys) -> None:
+    snapshot = _snapshot(tmp_path)
+    dst = tmp_path / "dst"
+
+    rc = main(["restore", str(snapshot), str(dst), "--include", "docs", "--include", "*.md", "--json"])
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["include"] == ["docs", "*.md"]
+    assert _restored(dst) == ["README.md", "docs/guide.md"]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from devvault.cli import main
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.backup_engine import BackupEngine
+from scanner.errors import RestoreRefused
+from scanner.models.backup import BackupRequest
+from scanner.restore_engine import RestoreEngine, RestoreRequest
+
+
+class OpenReadRecordingFS(OSFileSystem):
+    def __init__(self) -> None:
+        self.opened: list[Path] = []
+
+    def open_read(self, path: Path):
+        self.opened.append(path)
+        return super().open_read(path)
+
+
+def _snapshot(tmp_path: Path) -> Path:
+    source = tmp_path / "src"
+    for rel, text in {
+        "a.txt": "alpha",
+        "b.txt": "bravo",
+        "pkg/c.py": "charlie",
+        "pkg/d.py": "delta",
+    }.items():
+        (source / rel).parent.mkdir(parents=True, exist_ok=True)
+        (source / rel).write_text(text, encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    return BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path
+
+
+def _files(dst: Path) -> dict[str, str]:
+    return {
+        p.relative_to(dst).as_posix(): p.read_text(encoding="utf-8")
+        for p in dst.rglob("*")
+        if p.is_file() and p.name != "_restore_manifest.txt"
+    }
+
+
+def _restored(tmp_path: Path) -> tuple[Path, Path]:
+    snapshot = _snapshot(tmp_path)
+    dst = tmp_path / "dst"
+    RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst))
+    return snapshot, dst
+
+
+def test_sync_restore_rewrites_only_differing_files(tmp_path: Path) -> None:
+    snapshot, dst = _restored(tmp_path)
+    (dst / "a.txt").write_text("ALPHA", encoding="utf-8")  # same size, other bytes
+    (dst / "pkg" / "d.py").unlink()
+    (dst / "extra.txt").write_text("extra", encoding="utf-8")
+    untouched_inode = (dst / "b.txt").stat().st_ino
+
+    res = RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True))
+
+    assert (res.files_restored, res.files_unchanged, res.files_removed) == (2, 2, 0)
+    assert _files(dst) == {
+        "a.txt": "alpha",
+        "b.txt": "bravo",
+        "extra.txt": "extra",
+        "pkg/c.py": "charlie",
+        "pkg/d.py": "delta",
+    }
+    assert (dst / "b.txt").stat().st_ino == untouched_inode
+    assert not list(dst.rglob("*.devvault.tmp"))
+
+
+def test_sync_restore_second_pass_skips_by_size_and_mtime(tmp_path: Path) -> None:
+    snapshot, dst = _restored(tmp_path)
+    engine = RestoreEngine(OSFileSystem())
+    engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True))  # hashes, stamps mtimes
+
+    fs = OpenReadRecordingFS()
+    res = RestoreEngine(fs).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True))
+
+    assert (res.files_restored, res.files_unchanged) == (0, 4)
+    assert not [p for p in fs.opened if dst in p.parents]
+
+
+def test_sync_restore_delete_extras_respects_selection(tmp_path: Path) -> None:
+    snapshot, dst = _restored(tmp_path)
+    (dst / "extra.txt").write_text("extra", encoding="utf-8")
+    (dst / "pkg" / "old.py").write_text("old", encoding="utf-8")
+    (dst / "pkg" / "gone").mkdir()
+    (dst / "pkg" / "gone" / "x.py").write_text("x", encoding="utf-8")
+
+    res = RestoreEngine(OSFileSystem()).restore(
+        RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, include=("pkg",), sync=True, delete_extras=True)
+    )
+
+    assert res.files_removed == 2
+    assert sorted(_files(dst)) == ["a.txt", "b.txt", "extra.txt", "pkg/c.py", "pkg/d.py"]
+    assert not (dst / "pkg" / "gone").exists()
+
+    res = RestoreEngine(OSFileSystem()).restore(
+        RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True, delete_extras=True)
+    )
+    assert res.files_removed == 1
+    assert "extra.txt" not in _files(dst)
+    assert (dst / "_restore_manifest.txt").exists()
+
+
+def test_sync_restore_refusals(tmp_path: Path) -> None:
+    snapshot, dst = _restored(tmp_path)
+    engine = RestoreEngine(OSFileSystem())
+
+    with pytest.raises(RestoreRefused, match="must be empty"):
+        engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst))
+    with pytest.raises(RuntimeError, match="delete_extras requires sync"):
+        engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, delete_extras=True))
+
+    (dst / "b.txt").unlink()
+    (dst / "b.txt").mkdir()
+    with pytest.raises(RestoreRefused, match="is a directory: b.txt"):
+        engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True))
+    (dst / "b.txt").rmdir()
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    for p in (dst / "pkg").iterdir():
+        p.unlink()
+    (dst / "pkg").rmdir()
+    try:
+        os.symlink(outside, dst / "pkg", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+    with pytest.raises(RestoreRefused, match="not a directory: pkg"):
+        engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True))
+    assert list(outside.iterdir()) == []
+
+
+def test_cli_restore_sync_json(tmp_path: Path, capsys) -> None:
+    snapshot, dst = _restored(tmp_path)
+    (dst / "extra.txt").write_text("extra", encoding="utf-8")
+
+    rc = main(["restore", str(snapshot), str(dst), "--sync", "--delete-extras", "--json"])
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert (payload["files_restored"], payload["files_unchanged"], payload["files_removed"]) == (0, 4, 1)
+
+
+def test_sync_restore_delete_extras_keeps_what_the_backup_excluded(tmp_path: Path) -> None:
+    source = tmp_path / "src"
+    (source / "node_modules" / "pkg").mkdir(parents=True)
+    (source / "node_modules" / "pkg" / "i.js").write_text("module", encoding="utf-8")
+    (source / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+    (source / "app.py").write_text("app", encoding="utf-8")
+    try:
+        os.symlink(source / "app.py", source / "link.py")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    snapshot = BackupEngine(OSFileSystem()).execute(
+        BackupRequest(source_root=source, backup_root=vault, use_ignore_files=True)
+    ).backup_path
+    (source / "stale.py").write_text("stale", encoding="utf-8")
+
+    res = RestoreEngine(OSFileSystem()).restore(
+        RestoreRequest(snapshot_dir=snapshot, destination_dir=source, sync=True, delete_extras=True)
+    )
+
+    assert res.files_removed == 1
+    assert not (source / "stale.py").exists()
+    assert (source / "node_modules" / "pkg" / "i.js").read_text(encoding="utf-8") == "module"
+    assert (source / "link.py").is_symlink()
+
+
+def test_sync_restore_never_writes_through_planted_temp_names(tmp_path: Path) -> None:
+    snapshot, dst = _restored(tmp_path)
+    outside = tmp_path / "outside.txt"
+    outside.write_text("precious", encoding="utf-8")
+    (dst / "a.txt").write_text("ALPHA", encoding="utf-8")
+    try:
+        os.symlink(outside, dst / "a.txt.devvault.tmp")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+    (dst / "pkg" / "c.py.devvault.tmp").write_text("leftover", encoding="utf-8")
+    (dst / "pkg" / "c.py").write_text("CHARLIE", encoding="utf-8")
+
+    RestoreEngine(OSFileSystem()).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst, sync=True))
+
+    assert outside.read_text(encoding="utf-8") == "precious"
+    assert not (dst / "a.txt").is_symlink()
+    assert (dst / "a.txt").read_text(encoding="utf-8") == "alpha"
+    assert (dst / "pkg" / "c.py").read_text(encoding="utf-8") == "charlie"
+    assert (dst / "a.txt.devvault.tmp").is_symlink()
+    assert (dst / "pkg" / "c.py.devvault.tmp").read_text(encoding="utf-8") == "leftover"
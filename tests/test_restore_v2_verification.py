@@ -436,9 +436,7 @@ def test_restore_interrupted_copy_does_not_promote_destination(tmp_path: Path, m
     _write_v2_manifest(snapshot, "big.bin", size=data_file.stat().st_size, digest_hex=d.hex)
 
     # Simulate a crash mid-copy: write some bytes, then raise.
-    original_copy = fs.copy_file
-
-    def exploding_copy(src: Path, out: Path) -> None:
+    def exploding_copy(src: Path, out: Path, **_kwargs) -> None:
         out.parent.mkdir(parents=True, exist_ok=True)
         with src.open("rb") as r, out.open("wb") as w:
             w.write(r.read(64 * 1024))
@@ -446,6 +444,7 @@ def test_restore_interrupted_copy_does_not_promote_destination(tmp_path: Path, m
         raise RuntimeError("simulated crash during copy")
 
     monkeypatch.setattr(fs, "copy_file", exploding_copy)
+    monkeypatch.setattr(fs, "copy_file_hashed", exploding_copy)
 
     with pytest.raises(RuntimeError, match="simulated crash"):
         engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst))
@@ -506,9 +505,13 @@ class ReadOnlySnapshotFS(OSFileSystem):
         self._deny_if_in_snapshot(dst)
         super().rename(src, dst)
 
-    def copy_file(self, src: Path, dst: Path) -> None:
+    def copy_file(self, src: Path, dst: Path, cancel_check=None, *, durable: bool = True) -> None:
+        self._deny_if_in_snapshot(dst)
+        super().copy_file(src, dst, cancel_check, durable=durable)
+
+    def copy_file_hashed(self, src: Path, dst: Path, **kwargs):
         self._deny_if_in_snapshot(dst)
-        super().copy_file(src, dst)
+        return super().copy_file_hashed(src, dst, **kwargs)
 
 
 def test_restore_never_writes_into_snapshot(tmp_path: Path) -> None:
@@ -528,3 +531,29 @@ def test_restore_never_writes_into_snapshot(tmp_path: Path) -> None:
 
     engine.restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst))
     assert (dst / "hello.txt").read_text(encoding="utf-8") == "hello"
+
+
+class OpenReadCountingFS(OSFileSystem):
+    def __init__(self) -> None:
+        self.opened: list[Path] = []
+
+    def open_read(self, path: Path):
+        self.opened.append(path)
+        return super().open_read(path)
+
+
+def test_restore_v2_verifies_while_copying_without_reading_back(tmp_path: Path) -> None:
+    snapshot = tmp_path / "snapshot"
+    dst = tmp_path / "dst"
+    snapshot.mkdir()
+
+    data_file = snapshot / "hello.txt"
+    data_file.write_text("hello", encoding="utf-8")
+    d = hash_path(OSFileSystem(), data_file, algo="sha256")
+    _write_v2_manifest(snapshot, "hello.txt", size=data_file.stat().st_size, digest_hex=d.hex)
+
+    fs = OpenReadCountingFS()
+    RestoreEngine(fs).restore(RestoreRequest(snapshot_dir=snapshot, destination_dir=dst))
+
+    assert (dst / "hello.txt").read_text(encoding="utf-8") == "hello"
+    assert not any(p.name.endswith(".devvault.tmp") for p in fs.opened)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from devvault.cli import main
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.backup_engine import BackupEngine
+from scanner.models.backup import BackupRequest
+from scanner.object_store import object_store_root
+from scanner.scrubber import VaultScrubber
+from scanner.verify_ledger import STATUS_FAILED, VerifyLedger
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+        self.slept: list[float] = []
+
+    def clock(self) -> float:
+        self.now += 1.0
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _vault(tmp_path: Path) -> tuple[Path, list[Path]]:
+    source = tmp_path / "src"
+    (source / "d").mkdir(parents=True)
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    snaps = []
+    for round_ in range(2):
+        for i in range(5):
+            (source / "d" / f"f{i}.txt").write_text(f"{round_}-{i}" * 100, encoding="utf-8")
+        snaps.append(BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path)
+    return vault, snaps
+
+
+def _digest(snapshot_dir: Path, rel: str) -> str:
+    manifest = json.loads((snapshot_dir / "manifest.json").read_text(encoding="utf-8"))
+    return next(f["digest_hex"] for f in manifest["files"] if f["path"] == rel)
+
+
+def _scrubber(t: FakeTime) -> VaultScrubber:
+    return VaultScrubber(OSFileSystem(), clock=t.clock, monotonic=t.monotonic, sleep=t.sleep)
+
+
+def _ledger_rows(vault: Path) -> dict[tuple[str, str], float]:
+    with VerifyLedger.open(vault) as ledger:
+        return {key: rec.verified_at for key, rec in ledger.records().items()}
+
+
+def test_scrub_budget_then_resume_covers_everything(tmp_path: Path) -> None:
+    vault, snaps = _vault(tmp_path)
+    t = FakeTime()
+
+    first = _scrubber(t).scrub(vault, max_bytes=1200)
+    assert first.stopped_early
+    assert 0 < first.files_verified < 10
+    assert first.files_total == 10
+    assert first.files_never_verified == 10 - first.files_verified
+
+    second = _scrubber(t).scrub(vault)
+    assert not second.stopped_early
+    assert second.files_never_verified == 0
+    assert second.files_overdue == 0
+    assert second.failures == ()
+
+    # Within the cycle nothing is read again.
+    before = _ledger_rows(vault)
+    third = _scrubber(t).scrub(vault)
+    assert (third.files_verified, third.stopped_early) == (0, False)
+    assert _ledger_rows(vault) == before
+
+    # Once due, the next run starts with the file verified longest ago.
+    oldest = min(before, key=before.__getitem__)
+    fourth = _scrubber(t).scrub(vault, max_bytes=1, cycle_seconds=0)
+    assert fourth.files_verified == 1
+    after = _ledger_rows(vault)
+    assert [k for k in before if after[k] != before[k]] == [oldest]
+
+
+def test_scrub_records_and_reports_corruption(tmp_path: Path) -> None:
+    vault, snaps = _vault(tmp_path)
+    victim = snaps[0] / "d" / "f3.txt"
+    data = victim.read_bytes()
+    victim.write_bytes(bytes([data[0] ^ 0x01]) + data[1:])
+
+    rep = _scrubber(FakeTime()).scrub(vault)
+
+    assert [(f.snapshot_id, f.path) for f in rep.failures] == [(snaps[0].name, "d/f3.txt")]
+    assert "checksum mismatch" in rep.failures[0].reason
+    assert rep.files_failed == 1
+    assert rep.files_verified == 10
+
+    with VerifyLedger.open(vault) as ledger:
+        assert [r.status for r in ledger.records().values()].count(STATUS_FAILED) == 1
+
+    # A failed file stays due within the cycle and is reported again.
+    again = _scrubber(FakeTime()).scrub(vault)
+    assert again.files_verified == 1
+    assert [(f.snapshot_id, f.path) for f in again.failures] == [(snaps[0].name, "d/f3.txt")]
+
+
+def test_scrub_rate_limit_sleeps_to_hold_average_rate(tmp_path: Path) -> None:
+    vault, _snaps = _vault(tmp_path)
+    t = FakeTime()
+    start = t.now
+
+    rep = _scrubber(t).scrub(vault, rate_bytes_per_second=100)
+
+    assert t.slept
+    # Time only advances by sleeping (and 1s per ledger timestamp): the average rate holds.
+    assert rep.bytes_verified / (t.now - start) <= 100
+
+
+def test_scrub_prunes_deleted_snapshots_and_reports_bad_manifest(tmp_path: Path) -> None:
+    vault, snaps = _vault(tmp_path)
+    t = FakeTime()
+    _scrubber(t).scrub(vault)
+
+    shutil.rmtree(snaps[0])
+    manifest = snaps[1] / "manifest.json"
+    manifest.write_text(manifest.read_text(encoding="utf-8").replace('"size": ', '"size": 1'), encoding="utf-8")
+
+    rep = _scrubber(t).scrub(vault)
+    assert [(f.snapshot_id, f.path) for f in rep.failures] == [(snaps[1].name, "")]
+    assert rep.files_total == 0
+
+    assert _ledger_rows(vault) == {}
+
+
+def test_scrub_verifies_shared_objects_once(tmp_path: Path) -> None:
+    source = tmp_path / "src"
+    source.mkdir()
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    for i in range(4):
+        (source / f"f{i}.txt").write_text(f"shared {i}" * 100, encoding="utf-8")
+    req = BackupRequest(source_root=source, backup_root=vault, storage_layout="objects", incremental=True)
+    first = BackupEngine(OSFileSystem()).execute(req)
+    (source / "f0.txt").write_text("changed" * 100, encoding="utf-8")
+    second = BackupEngine(OSFileSystem()).execute(req)
+
+    t = FakeTime()
+    rep = _scrubber(t).scrub(vault)
+
+    # 3 objects shared by both snapshots, plus the old and new f0.
+    assert (rep.files_total, rep.files_verified) == (8, 5)
+    assert len(_ledger_rows(vault)) == 5
+
+    digest = _digest(second.backup_path, "f1.txt")
+    obj = object_store_root(vault) / digest[:2] / digest
+    obj.write_bytes(b"X" + obj.read_bytes()[1:])
+    rep = _scrubber(t).scrub(vault, cycle_seconds=0)
+    assert sorted(f.snapshot_id for f in rep.failures) == sorted([first.backup_path.name, second.backup_path.name])
+    assert rep.files_failed == 2
+
+
+def test_cli_scrub_exit_codes(tmp_path: Path, capsys) -> None:
+    vault, snaps = _vault(tmp_path)
+    assert main(["scrub", "--vault", str(vault), "--json"]) == 0
+    capsys.readouterr()
+
+    (snaps[1] / "d" / "f0.txt").unlink()
+    assert main(["scrub", "--vault", str(vault)]) == 1
+    assert "referenced file missing" in capsys.readouterr().out
@@ -54,3 +54,77 @@ def test_load_rejects_wrong_version(tmp_path: Path) -> None:
     p.write_text(json.dumps({"index_version": 999, "generated_at": "2026-02-06T00:00:00+00:00", "snapshots": []}), encoding="utf-8")
 
     assert load_snapshot_index(fs=fs, backup_root=tmp_path) is None
+
+
+def _make_snapshot(backup_root: Path, snapshot_id: str) -> Path:
+    snap = backup_root / ".devvault" / "snapshots" / snapshot_id
+    snap.mkdir(parents=True)
+    manifest = {"manifest_version": 2, "checksum_algo": "sha256", "files": [{"path": "a", "size": 1, "type": "file", "digest_hex": "0" * 64}]}
+    (snap / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return snap
+
+
+def test_upsert_reads_only_the_new_snapshot(tmp_path: Path, monkeypatch) -> None:
+    import scanner.snapshot_index as si
+
+    fs = OSFileSystem()
+    _make_snapshot(tmp_path, "20260206T140102Z-aaaaaaaa")
+    si.repair_snapshot_index(fs=fs, backup_root=tmp_path)
+
+    read: list[str] = []
+    real = si.read_snapshot_metadata
+
+    def counting(*, fs, snapshot_dir, hmac_key=None):
+        read.append(snapshot_dir.name)
+        return real(fs=fs, snapshot_dir=snapshot_dir, hmac_key=hmac_key)
+
+    monkeypatch.setattr(si, "read_snapshot_metadata", counting)
+
+    new = _make_snapshot(tmp_path, "20260207T140102Z-bbbbbbbb")
+    idx = si.upsert_snapshot_index(fs=fs, backup_root=tmp_path, snapshot_dir=new)
+
+    assert read == ["20260207T140102Z-bbbbbbbb"]
+    assert [r["snapshot_id"] for r in idx.snapshots] == ["20260207T140102Z-bbbbbbbb", "20260206T140102Z-aaaaaaaa"]
+
+    loaded = load_snapshot_index(fs=fs, backup_root=tmp_path)
+    assert loaded is not None
+    assert loaded.snapshots == idx.snapshots
+    assert loaded.generation == rebuild_snapshot_index(fs=fs, backup_root=tmp_path).generation
+
+
+def test_upsert_rebuilds_when_directory_changed_behind_the_index(tmp_path: Path) -> None:
+    import scanner.snapshot_index as si
+
+    fs = OSFileSystem()
+    _make_snapshot(tmp_path, "20260206T140102Z-aaaaaaaa")
+    si.repair_snapshot_index(fs=fs, backup_root=tmp_path)
+
+    # A snapshot the index never saw, then the one being upserted.
+    _make_snapshot(tmp_path, "20260207T140102Z-bbbbbbbb")
+    new = _make_snapshot(tmp_path, "20260208T140102Z-cccccccc")
+    idx = si.upsert_snapshot_index(fs=fs, backup_root=tmp_path, snapshot_dir=new)
+
+    assert [r["snapshot_id"] for r in idx.snapshots] == [
+        "20260208T140102Z-cccccccc",
+        "20260207T140102Z-bbbbbbbb",
+        "20260206T140102Z-aaaaaaaa",
+    ]
+
+
+def test_upsert_rebuilds_index_without_generation(tmp_path: Path) -> None:
+    import scanner.snapshot_index as si
+
+    fs = OSFileSystem()
+    _make_snapshot(tmp_path, "20260206T140102Z-aaaaaaaa")
+    idx_dir = tmp_path / INDEX_DIR_NAME
+    idx_dir.mkdir(exist_ok=True)
+    (idx_dir / INDEX_FILE_NAME).write_text(
+        json.dumps({"index_version": INDEX_VERSION, "generated_at": "2026-02-06T00:00:00+00:00", "snapshots": []}),
+        encoding="utf-8",
+    )
+
+    new = _make_snapshot(tmp_path, "20260207T140102Z-bbbbbbbb")
+    idx = si.upsert_snapshot_index(fs=fs, backup_root=tmp_path, snapshot_dir=new)
+
+    assert len(idx.snapshots) == 2
+    assert idx.generation is not None
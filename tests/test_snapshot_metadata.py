@@ -67,3 +67,32 @@ def test_created_at_none_when_id_not_parseable(tmp_path: Path) -> None:
 
     md = read_snapshot_metadata(fs=fs, snapshot_dir=snap)
     assert md.created_at is None
+
+
+def test_read_snapshot_metadata_uses_path_index_without_manifest(tmp_path: Path) -> None:
+    from scanner.backup_engine import BackupEngine
+    from scanner.integrity_keys import load_manifest_hmac_key
+    from scanner.models.backup import BackupRequest
+    from scanner.snapshot_summary import SUMMARY_NAME
+
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.txt").write_text("abc", encoding="utf-8")
+    (source / "b.txt").write_text("hello", encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    snap = BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path
+    (snap / SUMMARY_NAME).unlink()
+
+    class NoManifestReadFS(OSFileSystem):
+        def read_text(self, path: Path, *args, **kwargs) -> str:
+            if path.name == "manifest.json":
+                raise AssertionError("manifest.json must not be read")
+            return super().read_text(path, *args, **kwargs)
+
+    md = read_snapshot_metadata(
+        fs=NoManifestReadFS(), snapshot_dir=snap, hmac_key=load_manifest_hmac_key(vault_root=vault)
+    )
+    assert md.file_count == 2
+    assert md.total_bytes == 8
+    assert md.source_name == "src"
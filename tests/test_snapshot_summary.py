@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import scanner.snapshot_metadata as snapshot_metadata
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.backup_engine import BackupEngine
+from scanner.models.backup import BackupRequest
+from scanner.snapshot_metadata import read_snapshot_metadata
+from scanner.snapshot_summary import SUMMARY_NAME, read_snapshot_summary
+
+
+def _backup(tmp_path: Path, name: str) -> Path:
+    source = tmp_path / name
+    (source / "sub").mkdir(parents=True)
+    (source / "a.txt").write_text(name + "-a", encoding="utf-8")
+    (source / "sub" / "b.txt").write_text(name + "-bbbb", encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir(exist_ok=True)
+    return BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path
+
+
+def test_backup_writes_verified_summary(tmp_path: Path) -> None:
+    snap = _backup(tmp_path, "src")
+
+    summary = read_snapshot_summary(OSFileSystem(), snap)
+    assert summary is not None
+    assert summary["file_count"] == 2
+    assert summary["total_bytes"] == len("src-a") + len("src-bbbb")
+    assert summary["manifest_integrity"]["algo"] == "hmac-sha256"
+
+
+def test_metadata_prefers_summary_over_manifest(tmp_path: Path, monkeypatch) -> None:
+    snap = _backup(tmp_path, "src")
+    expected = snapshot_metadata._metadata_from_manifest(
+        snapshot_id=snap.name,
+        manifest=json.loads((snap / "manifest.json").read_text(encoding="utf-8")),
+    )
+
+    def no_manifest_parse(*_a, **_k):
+        raise AssertionError("manifest.json was parsed")
+
+    monkeypatch.setattr(snapshot_metadata.MANIFEST_CACHE, "derive", no_manifest_parse)
+
+    assert read_snapshot_metadata(fs=OSFileSystem(), snapshot_dir=snap) == expected
+
+
+@pytest.mark.parametrize("damage", ["tamper", "foreign", "garbage"])
+def test_untrusted_summary_falls_back_to_manifest(tmp_path: Path, damage: str) -> None:
+    snap = _backup(tmp_path, "src")
+    summary_path = snap / SUMMARY_NAME
+
+    if damage == "tamper":
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        summary["total_bytes"] += 1
+        summary_path.write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8")
+    elif damage == "foreign":
+        # Validly sealed, but computed from another snapshot's manifest.
+        other = _backup(tmp_path, "other-source")
+        shutil.copyfile(other / SUMMARY_NAME, summary_path)
+    else:
+        summary_path.write_text("{not json", encoding="utf-8")
+
+    fs = OSFileSystem()
+    assert read_snapshot_summary(fs, snap) is None
+
+    md = read_snapshot_metadata(fs=fs, snapshot_dir=snap)
+    assert md.file_count == 2
+    assert md.total_bytes == len("src-a") + len("src-bbbb")
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from devvault.cli import main
+from scanner.adapters.filesystem import OSFileSystem
+from scanner.backup_engine import BackupEngine
+from scanner.models.backup import BackupRequest
+from scanner.vault_catalog import VaultCatalog, catalog_path_for_backup_root, sync_catalog
+
+
+def _backup(source: Path, vault: Path, *, update_catalog: bool = False) -> Path:
+    req = BackupRequest(source_root=source, backup_root=vault, update_catalog=update_catalog)
+    return BackupEngine(OSFileSystem()).execute(req).backup_path
+
+
+def _vault_with_history(tmp_path: Path) -> tuple[Path, Path, list[Path]]:
+    source = tmp_path / "src"
+    vault = tmp_path / "vault"
+    (source / "pkg").mkdir(parents=True)
+    vault.mkdir()
+
+    (source / "pkg" / "app.py").write_text("v1", encoding="utf-8")
+    (source / "README.md").write_text("readme", encoding="utf-8")
+    first = _backup(source, vault)
+
+    (source / "pkg" / "util.py").write_text("util", encoding="utf-8")
+    second = _backup(source, vault)  # app.py unchanged
+
+    (source / "pkg" / "app.py").write_text("v2 longer", encoding="utf-8")
+    (source / "README.md").unlink()
+    third = _backup(source, vault)
+
+    # Snapshot ids have one-second resolution; give them a deterministic order.
+    snaps = []
+    for i, snap in enumerate((first, second, third)):
+        renamed = snap.with_name(f"2026010{i + 1}T000000Z-{snap.name.split('-', 1)[1]}")
+        snap.rename(renamed)
+        snaps.append(renamed)
+    return source, vault, snaps
+
+
+def _synced(vault: Path) -> VaultCatalog:
+    cat = VaultCatalog.open(vault, create=True)
+    sync_catalog(cat, fs=OSFileSystem(), backup_root=vault)
+    return cat
+
+
+def test_backup_without_catalog_request_creates_none(tmp_path: Path) -> None:
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.txt").write_text("a", encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+
+    _backup(source, vault)
+    assert not catalog_path_for_backup_root(vault).exists()
+    assert VaultCatalog.open(vault) is None
+
+
+def test_catalog_history_search_and_diff(tmp_path: Path) -> None:
+    _source, vault, (first, second, third) = _vault_with_history(tmp_path)
+
+    with _synced(vault) as cat:
+        assert set(cat.snapshot_digests()) == {first.name, second.name, third.name}
+
+        assert [f.snapshot_id for f in cat.snapshots_containing("pkg/app.py")] == [first.name, second.name, third.name]
+        history = cat.file_history("pkg/app.py")
+        assert [(f.snapshot_id, f.size) for f in history] == [(first.name, 2), (third.name, 9)]
+
+        assert cat.search_paths("pkg/*.py") == ["pkg/app.py", "pkg/util.py"]
+        assert cat.search_paths("*.md") == ["README.md"]
+
+        d = cat.diff_snapshots(second.name, third.name)
+        assert [f.path for f in d.removed] == ["README.md"]
+        assert [new.path for _old, new in d.changed] == ["pkg/app.py"]
+        assert d.added == []
+
+        digest = history[-1].digest_hex
+        assert [(f.snapshot_id, f.path) for f in cat.snapshots_with_digest(digest)] == [(third.name, "pkg/app.py")]
+
+
+def test_backup_creates_catalog_on_request_and_keeps_it_current(tmp_path: Path) -> None:
+    source, vault, snaps = _vault_with_history(tmp_path)
+
+    fourth = _backup(source, vault, update_catalog=True)
+    with VaultCatalog.open(vault) as cat:
+        # The snapshots that predate the catalog were imported too.
+        assert set(cat.snapshot_digests()) == {s.name for s in snaps} | {fourth.name}
+
+    (source / "new.txt").write_text("n", encoding="utf-8")
+    fifth = _backup(source, vault)  # no update_catalog: the catalog exists already
+
+    with VaultCatalog.open(vault) as cat:
+        assert [f.snapshot_id for f in cat.snapshots_containing("new.txt")] == [fifth.name]
+
+
+def test_sync_catalog_drops_deleted_and_skips_unchanged(tmp_path: Path) -> None:
+    _source, vault, (first, second, third) = _vault_with_history(tmp_path)
+    _synced(vault).close()
+    shutil.rmtree(first)
+
+    with VaultCatalog.open(vault) as cat:
+        res = sync_catalog(cat, fs=OSFileSystem(), backup_root=vault)
+        assert (res.added, res.removed, res.unchanged, res.skipped) == (0, 1, 2, 0)
+        assert set(cat.snapshot_digests()) == {second.name, third.name}
+
+
+def test_sync_catalog_skips_tampered_manifest(tmp_path: Path) -> None:
+    _source, vault, (first, _second, _third) = _vault_with_history(tmp_path)
+
+    manifest_path = first / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["files"][0]["size"] += 1
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+    with VaultCatalog.open(vault, create=True) as cat:
+        res = sync_catalog(cat, fs=OSFileSystem(), backup_root=vault)
+        assert (res.added, res.skipped) == (2, 1)
+        assert first.name not in cat.snapshot_digests()
+
+
+def test_cli_catalog_history_json(tmp_path: Path, capsys) -> None:
+    _source, vault, (first, _second, third) = _vault_with_history(tmp_path)
+
+    assert main(["catalog", "sync", "--vault", str(vault), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["added"] == 3
+    assert main(["catalog", "history", "pkg/app.py", "--vault", str(vault), "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert [v["snapshot_id"] for v in payload["versions"]] == [first.name, third.name]
+
+
+def test_cli_catalog_refuses_without_catalog(tmp_path: Path, capsys) -> None:
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    assert main(["catalog", "search", "*", "--vault", str(vault)]) == 1
+    assert "No catalog" in capsys.readouterr().err
@@ -141,3 +141,241 @@ def test_verify_engine_rejects_same_size_content_corruption(tmp_path: Path) -> N
 
     with pytest.raises(RuntimeError, match="checksum mismatch"):
         eng.verify(VerifyRequest(snapshot_dir=snap))
+
+
+def _write_snapshot(tmp_path: Path, n: int) -> tuple[Path, list[dict]]:
+    fs = OSFileSystem()
+    snap = tmp_path / "snap"
+    snap.mkdir()
+    entries = []
+    for i in range(n):
+        f = snap / f"f{i:02d}.txt"
+        f.write_text(f"content-{i}" * (i + 1), encoding="utf-8")
+        entries.append(
+            {"path": f.name, "size": f.stat().st_size, "type": "file", "digest_hex": hash_path(fs, f, algo="sha256").hex}
+        )
+    return snap, entries
+
+
+def _seal(snap: Path, entries: list[dict]) -> None:
+    manifest = add_integrity_block({"manifest_version": 2, "checksum_algo": "sha256", "files": entries})
+    (snap / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def test_verify_engine_parallel_success(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 40)
+    _seal(snap, entries)
+
+    res = VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, workers=4))
+    assert res.files_verified == 40
+
+
+def test_verify_engine_parallel_reports_first_failure_in_manifest_order(tmp_path: Path) -> None:
+    import threading
+    import time
+
+    snap, entries = _write_snapshot(tmp_path, 20)
+    entries[3]["digest_hex"] = "0" * 64  # slow to detect: hashed last
+    (snap / entries[12]["path"]).unlink()  # fast to detect
+    _seal(snap, entries)
+
+    slow = snap / entries[3]["path"]
+    missing_seen = threading.Event()
+
+    class SlowFS(OSFileSystem):
+        def open_read(self, path: Path):
+            if path == slow:
+                missing_seen.wait(timeout=5)
+                time.sleep(0.05)
+            return super().open_read(path)
+
+        def exists(self, path: Path) -> bool:
+            out = super().exists(path)
+            if not out and path.name == entries[12]["path"]:
+                missing_seen.set()
+            return out
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        VerifyEngine(SlowFS()).verify(VerifyRequest(snapshot_dir=snap, workers=4))
+
+
+def test_verify_engine_parallel_io_failure_precedes_later_manifest_error(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 10)
+    (snap / entries[2]["path"]).unlink()
+    entries[8]["path"] = "../escape.txt"
+    _seal(snap, entries)
+
+    with pytest.raises(RuntimeError, match="referenced file missing"):
+        VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, workers=4))
+
+
+def test_verify_engine_rejects_invalid_worker_count(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 1)
+    _seal(snap, entries)
+
+    with pytest.raises(RuntimeError, match="Unsupported verify worker count"):
+        VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, workers=-1))
+
+
+def test_verify_engine_sampled_respects_byte_budget_and_seed(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 30)
+    _seal(snap, entries)
+    total = sum(e["size"] for e in entries)
+    eng = VerifyEngine(OSFileSystem())
+
+    req = VerifyRequest(snapshot_dir=snap, mode="sampled", sample_bytes=total // 4, sample_seed=7)
+    res = eng.verify(req)
+
+    assert res.mode == "sampled"
+    assert res.files_verified == 30
+    assert res.total_bytes == total
+    assert 0 < res.bytes_hashed <= total // 4
+    assert res.budget_exhausted
+    assert 0 < res.file_coverage < 1
+    assert res.byte_coverage == res.bytes_hashed / total
+    assert res.sample_seed == 7
+
+    again = eng.verify(req)
+    assert (again.files_hashed, again.bytes_hashed) == (res.files_hashed, res.bytes_hashed)
+
+
+def test_verify_engine_sampled_checks_every_file_size_and_presence(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 10)
+    _seal(snap, entries)
+    (snap / entries[6]["path"]).write_text("truncated", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="file size mismatch"):
+        VerifyEngine(OSFileSystem()).verify(
+            VerifyRequest(snapshot_dir=snap, mode="sampled", sample_bytes=1, sample_seed=1)
+        )
+
+
+def test_verify_engine_sampled_without_budget_detects_content_corruption(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 10)
+    _seal(snap, entries)
+    f = snap / entries[4]["path"]
+    data = f.read_bytes()
+    f.write_bytes(bytes([data[0] ^ 0x01]) + data[1:])
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, mode="sampled", workers=3))
+
+
+def test_verify_engine_rotation_slices_cover_every_file_once(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 25)
+    _seal(snap, entries)
+    eng = VerifyEngine(OSFileSystem())
+
+    results = [
+        eng.verify(VerifyRequest(snapshot_dir=snap, mode="sampled", rotation_slices=3, rotation_slice=k))
+        for k in range(3)
+    ]
+    assert [r.rotation_slice for r in results] == [0, 1, 2]
+    assert sum(r.files_hashed for r in results) == 25
+    assert sum(r.bytes_hashed for r in results) == sum(e["size"] for e in entries)
+
+
+def test_verify_engine_rejects_unknown_mode(tmp_path: Path) -> None:
+    snap, entries = _write_snapshot(tmp_path, 1)
+    _seal(snap, entries)
+
+    with pytest.raises(RuntimeError, match="Unsupported verify mode"):
+        VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, mode="quick"))
+
+
+@pytest.mark.parametrize("with_index", [True, False])
+def test_verify_engine_include_checks_only_selected_files(tmp_path: Path, with_index: bool) -> None:
+    from scanner.backup_engine import BackupEngine
+    from scanner.errors import DevVaultRefusal
+    from scanner.models.backup import BackupRequest
+    from scanner.path_index import PATH_INDEX_NAME
+
+    source = tmp_path / "src"
+    for rel in ("pkg/app.py", "pkg/util.py", "docs/guide.md"):
+        (source / rel).parent.mkdir(parents=True, exist_ok=True)
+        (source / rel).write_text(rel, encoding="utf-8")
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    snap = BackupEngine(OSFileSystem()).execute(BackupRequest(source_root=source, backup_root=vault)).backup_path
+    if not with_index:
+        (snap / PATH_INDEX_NAME).unlink()
+    (snap / "docs" / "guide.md").write_text("DOCS/GUIDE.MD", encoding="utf-8")  # same size, other bytes
+
+    class ManifestReadCountingFS(OSFileSystem):
+        manifest_reads = 0
+
+        def read_text(self, path: Path, *args, **kwargs) -> str:
+            if path.name == "manifest.json":
+                self.manifest_reads += 1
+            return super().read_text(path, *args, **kwargs)
+
+    fs = ManifestReadCountingFS()
+    res = VerifyEngine(fs).verify(VerifyRequest(snapshot_dir=snap, include=("pkg/app.py",)))
+    assert res.files_verified == 1
+    assert res.total_bytes == len("pkg/app.py")
+    # With an index, verifying one path does not read manifest.json.
+    assert (fs.manifest_reads == 0) is with_index
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, include=("docs",)))
+    with pytest.raises(DevVaultRefusal, match="No snapshot entries match"):
+        VerifyEngine(OSFileSystem()).verify(VerifyRequest(snapshot_dir=snap, include=("nope",)))
+
+
+def _objects_vault(tmp_path: Path) -> tuple[Path, list[Path]]:
+    from scanner.backup_engine import BackupEngine
+    from scanner.models.backup import BackupRequest
+
+    source = tmp_path / "src"
+    source.mkdir()
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    for i in range(4):
+        (source / f"shared{i}.bin").write_bytes(bytes([i]) * 4096)
+    snaps = []
+    for round_ in range(3):
+        (source / "changing.txt").write_text(f"round {round_}", encoding="utf-8")
+        req = BackupRequest(source_root=source, backup_root=vault, storage_layout="objects")
+        snaps.append(BackupEngine(OSFileSystem()).execute(req).backup_path)
+    return vault, snaps
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_verify_vault_hashes_shared_content_once(tmp_path: Path, workers: int) -> None:
+    vault, snaps = _objects_vault(tmp_path)
+
+    res = VerifyEngine(OSFileSystem()).verify_vault(vault, workers=workers)
+
+    assert res.ok
+    assert sorted(v.snapshot_id for v in res.verdicts) == sorted(s.name for s in snaps)
+    assert all(v.files_verified == 5 for v in res.verdicts)
+    # 4 shared objects + 3 versions of changing.txt, instead of 15 file reads.
+    assert res.unique_files_hashed == 7
+    assert res.bytes_hashed < res.bytes_referenced
+    assert res.bytes_referenced == 3 * (4 * 4096) + sum(len(f"round {r}") for r in range(3))
+
+
+def test_verify_vault_fans_failures_out_to_referencing_snapshots(tmp_path: Path) -> None:
+    from scanner.object_store import object_path, object_store_root
+
+    vault, snaps = _objects_vault(tmp_path)
+    shared = json.loads((snaps[0] / "manifest.json").read_text(encoding="utf-8"))
+    digest = next(f["digest_hex"] for f in shared["files"] if f["path"] == "shared2.bin")
+    obj = object_path(object_store_root(vault), digest)
+    obj.chmod(0o644)
+    obj.write_bytes(b"\x00" * 4096)
+
+    # Only the oldest snapshot references this version of changing.txt.
+    only_first = json.loads((snaps[0] / "manifest.json").read_text(encoding="utf-8"))
+    first_digest = next(f["digest_hex"] for f in only_first["files"] if f["path"] == "changing.txt")
+    object_path(object_store_root(vault), first_digest).unlink()
+
+    res = VerifyEngine(OSFileSystem()).verify_vault(vault)
+    by_id = {v.snapshot_id: v for v in res.verdicts}
+
+    assert not res.ok
+    # Manifest order is path order: changing.txt comes before shared2.bin.
+    assert "referenced file missing" in by_id[snaps[0].name].reason
+    assert "checksum mismatch" in by_id[snaps[1].name].reason
+    assert "checksum mismatch" in by_id[snaps[2].name].reason
+    assert by_id[snaps[1].name].files_verified == 0